@@ -0,0 +1,77 @@
+# src/lumineer/alight/benchmark.py
+"""Memory used per KnowledgeNode, compared with the original layout.
+
+Run with: python -m lumineer.alight.benchmark [node count]
+"""
+import gc
+import sys
+import tracemalloc
+
+from .knowledge import KnowledgeNode
+
+FANOUT = 20
+SEGMENT_NAMES = 500  # Distinct names, reused across the tree as in real notes
+
+
+class DictNode:
+    """The node layout before slots and interning, kept for comparison."""
+
+    def __init__(self, name, content=None, parent=None, is_leaf=None):
+        self.name = name
+        self.content = content
+        self.parent = parent
+        self.is_leaf = content is not None if is_leaf is None else is_leaf
+        self.children = {}
+        self.digest = None
+        # The subtree statistics KnowledgeNode also carries
+        self.leaves = int(self.is_leaf)
+        self.size = 0
+        self.modified = 0.0
+        self.content_size = 0 if self.is_leaf else None
+
+    def add_child(self, name, content=None, is_leaf=None):
+        child = DictNode(name, content, self, is_leaf)
+        self.children[name] = child
+        return child
+
+
+def build(node_class, count):
+    root = node_class("alight")
+    level = [root]
+    made = 1
+    while made < count:
+        next_level = []
+        for parent in level:
+            for i in range(FANOUT):
+                if made >= count:
+                    break
+                # A fresh string each time, as the loaders produce
+                name = "".join(("note", "-", str((made + i) % SEGMENT_NAMES)))
+                next_level.append(parent.add_child(name, is_leaf=True))
+                made += 1
+        level = next_level
+    return root
+
+
+def bytes_per_node(node_class, count):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    root = build(node_class, count)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del root
+    return used / count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    before = bytes_per_node(DictNode, count)
+    after = bytes_per_node(KnowledgeNode, count)
+    print(f"{count} nodes, fan-out {FANOUT}")
+    print(f"before: {before:7.1f} bytes/node")
+    print(f"after:  {after:7.1f} bytes/node ({after / before:.0%})")
+
+
+if __name__ == '__main__':
+    main()
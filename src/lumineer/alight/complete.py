@@ -0,0 +1,156 @@
+# src/lumineer/alight/complete.py
+import bisect
+import heapq
+import re
+from itertools import accumulate
+
+from .knowledge import KnowledgeListener
+
+COMPLETION_LIMIT = 20
+FUZZY_SCAN = 2000  # Sibling names checked for fuzzy matches per keystroke
+FUZZY_CANDIDATES = 100  # Fuzzy matches ranked per keystroke
+
+
+def fuzzy_pattern(query):
+    # Case-folded letters of the query in order. Each gap excludes the next letter, so
+    # the earliest occurrence is taken without backtracking
+    parts = [re.escape(query[0])]
+    for char in query[1:]:
+        parts.append(f"[^\n{re.escape(char)}]*{re.escape(char)}")
+    return re.compile(''.join(parts))
+
+
+class PathCompleter(KnowledgeListener):
+    """Suggests dotted paths for a partially typed one.
+
+    The node tree is already a trie keyed by path segment, so complete
+    segments are followed through it directly. For the segment being typed,
+    each node keeps its child names sorted by case-folded name, built on
+    first use and then kept in order as events arrive, so prefix matches are
+    a binary search however many siblings there are. When prefixes run out,
+    a bounded number of siblings are matched as subsequences instead.
+    """
+
+    def __init__(self, knowledge_base):
+        self.knowledge_base = knowledge_base
+        self.sorted = {}
+        self.blocks = {}
+
+    def names(self, node):
+        names = self.sorted.get(node)
+        if names is None:
+            names = self.sorted[node] = sorted(
+                (name.casefold(), name) for name in node.children)
+        return names
+
+    def block(self, node):
+        # The first FUZZY_SCAN folded names joined by newlines, with the
+        # offset where each starts, rebuilt only after the names change
+        block = self.blocks.get(node)
+        if block is None:
+            scan = self.names(node)[:FUZZY_SCAN]
+            block = self.blocks[node] = (
+                scan, '\n'.join(folded for folded, _ in scan),
+                [0, *accumulate(len(folded) + 1 for folded, _ in scan)])
+        return block
+
+    def child(self, node, segment):
+        if segment in node.children:
+            return node.children[segment]
+        names = self.names(node)
+        key = segment.casefold()
+        i = bisect.bisect_left(names, (key,))
+        if i < len(names) and names[i][0] == key:
+            return node.children[names[i][1]]
+        return None
+
+    def complete(self, text, limit=COMPLETION_LIMIT):
+        root = self.knowledge_base.root
+        parts = text.split('.')
+        if parts[0] != root.name:
+            if '.' not in text and root.name.startswith(text.casefold()):
+                return [root.name]
+            parts.insert(0, root.name)  # Paths may omit the root
+
+        node = root
+        for segment in parts[1:-1]:
+            node = self.child(node, segment)
+            if node is None:
+                return []
+        base = node.path
+        typed = parts[-1]
+        key = typed.casefold()
+        names = self.names(node)
+
+        results = []
+        i = bisect.bisect_left(names, (key,))
+        while i < len(names) and len(results) < limit and names[i][0].startswith(key):
+            results.append(names[i][1])
+            i += 1
+
+        if len(results) < limit and key:
+            # One regex pass over the joined names is much cheaper than a
+            # search per name
+            scan, block, starts = self.block(node)
+            found = set(results)
+            scored = []
+            for match in fuzzy_pattern(key).finditer(block):
+                line = bisect.bisect_right(starts, match.start()) - 1
+                name = scan[line][1]
+                if name not in found:
+                    found.add(name)
+                    # Tighter and earlier matches rank first
+                    scored.append((match.end() - match.start(),
+                                   match.start() - starts[line], name))
+                    if len(scored) >= FUZZY_CANDIDATES:
+                        break
+            scored.sort()
+            results += [name for _, _, name in scored[:limit - len(results)]]
+        return [f"{base}.{name}" for name in results]
+
+    def forget(self, removed):
+        # Only nodes that were completed under have lists, so check those
+        # rather than walking the removed subtree
+        for node in list(self.sorted):
+            ancestor = node
+            while ancestor is not None and ancestor is not removed:
+                ancestor = ancestor.parent
+            if ancestor is removed:
+                del self.sorted[node]
+                self.blocks.pop(node, None)
+
+    def insert_name(self, parent, name):
+        self.blocks.pop(parent, None)
+        names = self.sorted.get(parent)
+        if names is not None:
+            bisect.insort(names, (name.casefold(), name))
+
+    def remove_name(self, parent, name):
+        self.blocks.pop(parent, None)
+        names = self.sorted.get(parent)
+        if names is not None:
+            i = bisect.bisect_left(names, (name.casefold(), name))
+            if i < len(names) and names[i][1] == name:
+                del names[i]
+
+    def node_inserted(self, node, content):
+        self.insert_name(node.parent, node.name)
+
+    def nodes_inserted(self, entries):
+        # Each list gains its new names in one merge rather than an insort
+        # per name
+        added = {}
+        for node, _ in entries:
+            if node.parent in self.sorted:
+                added.setdefault(node.parent, []).append((node.name.casefold(), node.name))
+        for parent, names in added.items():
+            self.blocks.pop(parent, None)
+            self.sorted[parent] = list(heapq.merge(self.sorted[parent], sorted(names)))
+
+    def node_removed(self, parent, node):
+        self.remove_name(parent, node.name)
+        self.forget(node)
+
+    def node_renamed(self, node, old_name):
+        self.remove_name(node.parent, old_name)
+        self.insert_name(node.parent, node.name)
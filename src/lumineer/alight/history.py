@@ -0,0 +1,255 @@
+# src/lumineer/alight/history.py
+import hashlib
+import json
+import time
+import zlib
+from contextlib import contextmanager
+from functools import lru_cache
+
+from .knowledge import KnowledgeListener
+
+OBJECT_CACHE_SIZE = 4096  # Decoded tree objects kept in memory
+
+
+def blob_digest(data):
+    return hashlib.blake2b(b"blob\0" + data, digest_size=20).hexdigest()
+
+
+def tree_digest(data):
+    return hashlib.blake2b(b"tree\0" + data, digest_size=20).hexdigest()
+
+
+def ancestors(path):
+    parts = path.split('.')
+    return ['.'.join(parts[:i]) for i in range(1, len(parts))]
+
+
+class History(KnowledgeListener):
+    """Content-addressed snapshots of the knowledge base, stored like git objects.
+
+    Leaf content is stored once per distinct text as a blob, and every node is
+    a tree object naming its content blob and its children's objects. A change
+    writes new objects only for the touched node and its ancestors, then
+    records a snapshot pointing at the new root, so unchanged subtrees are
+    shared by every version. Each node's current digest is kept on the node
+    and in the nodes table.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self.connection = store.connection
+        self.groups = []
+        # Nodes to re-hash once a bulk change is done, or None
+        self.pending = None
+        self.load = lru_cache(maxsize=OBJECT_CACHE_SIZE)(self.read_tree)
+
+    @staticmethod
+    def create(db):
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS objects (
+                digest TEXT PRIMARY KEY,
+                data BLOB NOT NULL
+            ) WITHOUT ROWID""")
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS snapshots (
+                id INTEGER PRIMARY KEY,
+                root TEXT NOT NULL,
+                created REAL NOT NULL,
+                action TEXT NOT NULL,
+                path TEXT NOT NULL
+            )""")
+        db.execute("CREATE INDEX IF NOT EXISTS snapshots_path ON snapshots (path)")
+
+    def put(self, db, digest, data):
+        db.execute("INSERT OR IGNORE INTO objects (digest, data) VALUES (?, ?)",
+                   (digest, zlib.compress(data)))
+        return digest
+
+    def put_blob(self, db, content):
+        if content is None:
+            return None
+        data = content.encode("utf-8")
+        return self.put(db, blob_digest(data), data)
+
+    def put_tree(self, db, content_digest, node):
+        children = [[name, child.digest] for name, child in node.children.items()]
+        data = json.dumps([content_digest, children], ensure_ascii=False,
+                          separators=(',', ':')).encode("utf-8")
+        return self.put(db, tree_digest(data), data)
+
+    def read(self, digest):
+        row = self.connection.execute(
+            "SELECT data FROM objects WHERE digest = ?", (digest,)).fetchone()
+        if row is None:
+            raise KeyError(digest)
+        return zlib.decompress(row[0]).decode("utf-8")
+
+    def read_tree(self, digest):
+        # Objects never change once written, so decoded trees can be cached
+        content_digest, children = json.loads(self.read(digest))
+        return content_digest, tuple((name, child) for name, child in children)
+
+    def blob(self, digest):
+        return None if digest is None else self.read(digest)
+
+    def content_digest(self, node):
+        return None if node.digest is None else self.load(node.digest)[0]
+
+    def rebuild(self, root):
+        """Write objects for a whole tree and record it as a snapshot."""
+        with self.store.transaction() as db:
+            # Children first, so every parent sees its children's digests
+            order = []
+            stack = [root]
+            while stack:
+                node = stack.pop()
+                order.append(node)
+                stack.extend(node.children.values())
+            updates = []
+            for node in reversed(order):
+                content = self.store.read_content(node.path) if node.is_leaf else None
+                node.digest = self.put_tree(db, self.put_blob(db, content), node)
+                if node is not root:
+                    updates.append((node.digest, node.path))
+            db.executemany("UPDATE nodes SET digest = ? WHERE path = ?", updates)
+            self.snapshot(db, root, "import", root.name)
+
+    def propagate(self, db, node, content_digest):
+        # Re-hash the changed node and each ancestor; siblings keep their
+        # objects and are only referenced
+        updates = []
+        path = node.path
+        while node is not None:
+            node.digest = self.put_tree(db, content_digest, node)
+            if node.parent is not None:
+                updates.append((node.digest, path))
+                path = path.rsplit('.', 1)[0]
+            root = node
+            node = node.parent
+            if node is not None:
+                content_digest = self.content_digest(node)
+        db.executemany("UPDATE nodes SET digest = ? WHERE path = ?", updates)
+        return root
+
+    def snapshot(self, db, root, action, path):
+        db.execute("""
+            INSERT INTO snapshots (root, created, action, path)
+            VALUES (?, ?, ?, ?)""", (root.digest, time.time(), action, path))
+
+    def changed(self, node, content_digest, action, path):
+        if self.pending is not None:
+            self.pending[node] = content_digest
+            return
+        with self.store.transaction() as db:
+            root = self.propagate(db, node, content_digest)
+            if not self.groups:
+                self.snapshot(db, root, action, path)
+
+    @contextmanager
+    def grouped(self, root, action, path):
+        """Record everything inside the block as a single snapshot."""
+        with self.store.transaction() as db:
+            self.groups.append(action)
+            try:
+                yield db
+            finally:
+                self.groups.pop()
+            if not self.groups:
+                self.snapshot(db, root, action, path)
+
+    def node_inserted(self, node, content):
+        with self.store.transaction() as db:
+            content_digest = self.put_blob(db, content)
+            self.changed(node, content_digest, "create", node.path)
+
+    def nodes_inserted(self, entries):
+        with self.store.transaction() as db:
+            # Entries come parents first, so build objects in reverse, then
+            # re-hash the existing ancestors once per place the batch joins
+            updates = []
+            new = set()
+            for node, content in reversed(entries):
+                node.digest = self.put_tree(db, self.put_blob(db, content), node)
+                updates.append((node.digest, node.path))
+                new.add(node)
+            db.executemany("UPDATE nodes SET digest = ? WHERE path = ?", updates)
+            joins = {node.parent: None for node, _ in entries if node.parent not in new}
+            for parent in joins:
+                root = self.propagate(db, parent, self.content_digest(parent))
+            if not self.groups:
+                self.snapshot(db, root, "import", entries[0][0].path)
+
+    def content_changed(self, node, content):
+        with self.store.transaction() as db:
+            content_digest = self.put_blob(db, content)
+            self.changed(node, content_digest, "update", node.path)
+
+    def node_renamed(self, node, old_name):
+        self.changed(node.parent, self.content_digest(node.parent), "rename", node.path)
+
+    def node_removed(self, parent, node):
+        self.changed(parent, self.content_digest(parent), "delete",
+                     f"{parent.path}.{node.name}")
+
+    def resolve(self, digest, path):
+        """Return the digest of path within the tree object digest, or None."""
+        for part in path.split('.')[1:]:  # Skip 'alight'
+            digest = dict(self.load(digest)[1]).get(part)
+            if digest is None:
+                return None
+        return digest
+
+    def versions(self, path, limit=200):
+        """Return (snapshot id, time, action, changed path, digest) for each
+        distinct earlier state of path, newest first."""
+        low, high = path + '.', path + '/'
+        scope = ancestors(path)
+        rows = self.connection.execute(f"""
+            SELECT id, created, action, path, root FROM snapshots
+            WHERE path = ? OR (path >= ? AND path < ?)
+               OR path IN ({', '.join('?' * len(scope)) or "''"})
+            ORDER BY id DESC LIMIT ?""", (path, low, high, *scope, limit))
+        result = []
+        last = None
+        for snapshot_id, created, action, changed, root in rows:
+            digest = self.resolve(root, path)
+            if digest is not None and digest != last:
+                result.append((snapshot_id, created, action, changed, digest))
+            last = digest
+        return result
+
+    def describe(self, digest):
+        """Return the content and child names stored in a tree object."""
+        content_digest, children = self.load(digest)
+        return self.blob(content_digest), [name for name, _ in children]
+
+    def restore(self, knowledge_base, path, digest):
+        """Replace path with the version stored under digest."""
+        root = knowledge_base.root
+        with self.grouped(root, "restore", path) as db:
+            if path == root.name:
+                # Each removal would re-hash the root, so that is done once
+                self.pending = {}
+                try:
+                    for name in list(root.children):
+                        knowledge_base.delete(f"{path}.{name}")
+                finally:
+                    pending, self.pending = self.pending, None
+                for node, content_digest in pending.items():
+                    self.propagate(db, node, content_digest)
+                stack = [(f"{path}.{name}", child)
+                         for name, child in reversed(self.load(digest)[1])]
+            else:
+                if knowledge_base.get(path) is not None:
+                    knowledge_base.delete(path)
+                stack = [(path, digest)]
+            # Parents come before their children, and the whole version is
+            # created as one batch
+            entries = []
+            while stack:
+                node_path, node_digest = stack.pop()
+                content_digest, children = self.load(node_digest)
+                entries.append((node_path, self.blob(content_digest)))
+                stack.extend((f"{node_path}.{name}", child)
+                             for name, child in reversed(children))
+            knowledge_base.create_many(entries)
@@ -0,0 +1,93 @@
+# src/lumineer/alight/importer.py
+import os
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+MARKDOWN_SUFFIXES = ('.md', '.markdown')
+READ_WORKERS = 16
+READ_BATCH = 256  # Files read per task
+
+
+def node_name(name):
+    # Dots separate path segments, so they cannot appear inside a name
+    return name.strip().replace('.', '_')
+
+
+def scan_directory(directory):
+    subdirectories = []
+    files = []
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                subdirectories.append(entry.path)
+            elif entry.is_file() and entry.name.lower().endswith(MARKDOWN_SUFFIXES):
+                files.append(entry.path)
+    return subdirectories, files
+
+
+def read_files(paths):
+    contents = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            contents.append(f.read())
+    return contents
+
+
+def unique_path(path, taken):
+    suffix = 2
+    candidate = path
+    while candidate in taken:
+        candidate = f"{path}_{suffix}"
+        suffix += 1
+    return candidate
+
+
+def markdown_entries(directory, base_path, workers=READ_WORKERS):
+    """Return the (path, content) entries for every Markdown file below
+    directory, and the (file, path) pairs of files that had to be renamed.
+
+    Each directory level is scanned in parallel and the files are read in
+    parallel, since both are dominated by waiting on the filesystem. A file
+    becomes a leaf named after its stem, and a folder next to a file of the
+    same name becomes that leaf's children. Files whose names map to the
+    same path, such as a.b.md and a_b.md or x.md and x.markdown, get a
+    numeric suffix in file path order rather than overwrite each other.
+    Paths are sorted, which puts every parent before its children.
+    """
+    directory = os.path.abspath(directory)
+    files = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        level = [directory]
+        while level:
+            next_level = []
+            for subdirectories, found in pool.map(scan_directory, level):
+                next_level.extend(subdirectories)
+                files.extend(found)
+            level = next_level
+        files.sort()
+
+        batches = pool.map(read_files, [files[i:i + READ_BATCH]
+                                        for i in range(0, len(files), READ_BATCH)])
+        entries = []
+        for file_path, content in zip(files, chain.from_iterable(batches)):
+            # Scanned paths all start with the directory and a separator
+            relative = os.path.splitext(file_path[len(directory) + 1:])[0]
+            names = [node_name(part) for part in relative.split(os.sep)]
+            if all(names):
+                entries.append(('.'.join([base_path, *names]), content, file_path))
+
+    # Every file's own name is reserved before any suffix is chosen
+    taken = {path for path, _, _ in entries}
+    claimed = set()
+    renamed = []
+    for i, (path, content, file_path) in enumerate(entries):
+        if path in claimed:
+            path = unique_path(path, taken)
+            taken.add(path)
+            renamed.append((file_path, path))
+        claimed.add(path)
+        entries[i] = (path, content)
+    entries.sort(key=lambda entry: entry[0])
+    return entries, renamed
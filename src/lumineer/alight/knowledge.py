@@ -0,0 +1,238 @@
+# src/lumineer/alight/knowledge.py
+import sys
+
+
+class NoChildren(dict):
+    """The empty children mapping shared by every childless node.
+
+    Writing to it would give a child to every leaf at once, so each
+    mutator raises and points at the KnowledgeNode methods instead.
+    """
+
+    def refuse(self, *args, **kwargs):
+        raise TypeError("Node children are changed with add_child, "
+                        "remove_child and rename_child")
+
+    __setitem__ = __delitem__ = __ior__ = refuse
+    pop = popitem = setdefault = update = clear = refuse
+
+
+NO_CHILDREN = NoChildren()
+
+
+def subtree_bounds(path):
+    # Every descendant path sorts between 'path.' and 'path/' ('/' follows '.')
+    return path + '.', path + '/'
+
+
+class KnowledgeNode:
+    """One node of the knowledge tree.
+
+    Nodes are slotted, names are interned so repeated segment names share
+    one string, and childless nodes share a single read-only empty mapping
+    until their first child is added. Because of that, children are only
+    changed through add_child, remove_child and rename_child, never by
+    writing to node.children. leaves, size and modified describe
+    the whole subtree and content_size the node's own content, and all are
+    kept current by SubtreeStats.
+    """
+
+    __slots__ = ('name', 'content', 'parent', 'is_leaf', 'children', 'digest',
+                 'leaves', 'size', 'modified', 'content_size')
+
+    def __init__(self, name, content=None, parent=None, is_leaf=None):
+        self.name = sys.intern(name)
+        self.content = content
+        self.parent = parent
+        self.is_leaf = content is not None if is_leaf is None else is_leaf
+        self.children = NO_CHILDREN
+        self.digest = None  # Set by History to the node's current object
+        self.leaves = int(self.is_leaf)
+        self.size = 0
+        self.modified = 0.0
+        # Length of the node's own content counted in size, None if not a leaf
+        self.content_size = 0 if self.is_leaf else None
+
+    def add_child(self, name, content=None, is_leaf=None):
+        child = type(self)(name, content, self, is_leaf)
+        if self.children is NO_CHILDREN:
+            self.children = {}
+        self.children[child.name] = child
+        return child
+
+    def remove_child(self, name):
+        if name not in self.children:
+            raise KeyError(name)
+        child = self.children.pop(name)
+        if not self.children:
+            self.children = NO_CHILDREN
+        return child
+
+    def rename_child(self, old_name, new_name):
+        new_name = sys.intern(new_name)
+        # Rebuild the dict so the renamed child keeps its position
+        self.children = {new_name if name == old_name else name: child
+                         for name, child in self.children.items()}
+        self.children[new_name].name = new_name
+
+    @property
+    def path(self):
+        parts = []
+        node = self
+        while node is not None:
+            parts.append(node.name)
+            node = node.parent
+        return '.'.join(reversed(parts))
+
+    def to_dict(self):
+        # Iterative so that very deep trees do not hit the recursion limit
+        result = {"name": self.name, "content": self.content}
+        stack = [(self, result)]
+        while stack:
+            node, data = stack.pop()
+            if node.children:
+                data["children"] = {}
+                for name, child in node.children.items():
+                    child_data = {"name": child.name, "content": child.content}
+                    data["children"][name] = child_data
+                    stack.append((child, child_data))
+        return result
+
+    @classmethod
+    def from_dict(cls, data, parent=None):
+        root = cls(data["name"], data.get("content"), parent)
+        stack = [(root, data)]
+        while stack:
+            node, node_data = stack.pop()
+            for child_data in node_data.get("children", {}).values():
+                child = node.add_child(child_data["name"], child_data.get("content"))
+                stack.append((child, child_data))
+        return root
+
+
+class KnowledgeListener:
+    """Receives change events from a KnowledgeBase after each mutation."""
+
+    def node_inserted(self, node, content):
+        pass
+
+    def node_removed(self, parent, node):
+        pass
+
+    def node_renamed(self, node, old_name):
+        pass
+
+    def content_changed(self, node, content):
+        pass
+
+    def nodes_inserted(self, entries):
+        # Listeners that can do better than one insert at a time override this
+        for node, content in entries:
+            self.node_inserted(node, content)
+
+
+class KnowledgeBase:
+    """Owns the node tree and broadcasts fine-grained change events.
+
+    With a loader, leaf content lives in the backing store rather than on the
+    nodes, and is read back through the loader when it is needed.
+    """
+
+    def __init__(self, root=None, loader=None):
+        self.root = root if root is not None else KnowledgeNode("alight")
+        self.loader = loader
+        self.listeners = []
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        self.listeners.remove(listener)
+
+    def emit(self, event, *args):
+        for listener in list(self.listeners):
+            getattr(listener, event)(*args)
+
+    def content(self, node):
+        if node.content is not None or not node.is_leaf or self.loader is None:
+            return node.content
+        return self.loader(node)
+
+    def retained(self, content):
+        return content if self.loader is None else None
+
+    def get(self, path):
+        parts = path.split('.')
+        node = self.root
+        for part in parts[1:]:  # Skip 'alight'
+            if part in node.children:
+                node = node.children[part]
+            else:
+                return None
+        return node
+
+    def create(self, path, content=None):
+        parts = path.split('.')[1:]  # Skip the 'alight' part
+        parent = self.root
+        for part in parts[:-1]:
+            if part not in parent.children:
+                self.emit("node_inserted", parent.add_child(part), None)
+            parent = parent.children[part]
+
+        node = parent.add_child(parts[-1], self.retained(content),
+                                content is not None)
+        self.emit("node_inserted", node, content)
+        return node
+
+    def create_many(self, entries):
+        """Create every (path, content) pair and announce them as one event.
+
+        Missing intermediate nodes are created along the way, and content
+        given for one of those later in the batch is set on it. Paths that
+        already existed before the batch are left alone.
+        """
+        created = {}
+        batch = []
+        for path, content in entries:
+            if path in created:
+                node, _ = batch[created[path]]
+                node.content = self.retained(content)
+                node.is_leaf = content is not None
+                batch[created[path]] = (node, content)
+                continue
+            parts = path.split('.')
+            parent = self.root
+            for i in range(1, len(parts)):  # Skip the 'alight' part
+                node = parent.children.get(parts[i])
+                if node is None:
+                    last = i == len(parts) - 1
+                    node = parent.add_child(
+                        parts[i], self.retained(content) if last else None,
+                        last and content is not None)
+                    created['.'.join(parts[:i + 1])] = len(batch)
+                    batch.append((node, content if last else None))
+                parent = node
+        if batch:
+            self.emit("nodes_inserted", batch)
+        return batch
+
+    def update(self, path, content):
+        node = self.get(path)
+        node.content = self.retained(content)
+        node.is_leaf = content is not None
+        self.emit("content_changed", node, content)
+        return node
+
+    def rename(self, path, new_name):
+        node = self.get(path)
+        old_name = node.name
+        node.parent.rename_child(old_name, new_name)
+        self.emit("node_renamed", node, old_name)
+        return node
+
+    def delete(self, path):
+        node = self.get(path)
+        parent = node.parent
+        parent.remove_child(node.name)
+        self.emit("node_removed", parent, node)
+        return node
@@ -0,0 +1,119 @@
+# src/lumineer/alight/links.py
+import re
+import xml.etree.ElementTree as etree
+
+import markdown
+from markdown.extensions import Extension
+from markdown.inlinepatterns import InlineProcessor
+from markdown.util import AtomicString
+
+from .knowledge import subtree_bounds
+
+LINK_PATTERN = r'\[\[(alight(?:\.[^.\[\]\n]+)*)\]\]'
+LINK = re.compile(LINK_PATTERN)
+
+
+def extract_links(text):
+    return {match.group(1) for match in LINK.finditer(text or "")}
+
+
+def rewrite_links(text, old_path, new_path):
+    """Point every link into old_path's subtree at new_path instead."""
+    def replace(match):
+        target = match.group(1)
+        if target == old_path or target.startswith(old_path + '.'):
+            return f"[[{new_path}{target[len(old_path):]}]]"
+        return match.group(0)
+    return LINK.sub(replace, text)
+
+
+def build_url(path):
+    return path
+
+
+class WikiLinkProcessor(InlineProcessor):
+    def __init__(self, pattern, md, build_url=build_url):
+        super().__init__(pattern, md)
+        self.build_url = build_url
+
+    def handleMatch(self, m, data):
+        anchor = etree.Element('a')
+        anchor.set('href', self.build_url(m.group(1)))
+        anchor.text = AtomicString(m.group(1))
+        return anchor, m.start(0), m.end(0)
+
+
+class WikiLinkExtension(Extension):
+    """Turns [[alight.some.path]] into a link whose href is the path."""
+
+    def __init__(self, **kwargs):
+        self.config = {'build_url': [build_url, "Turns a linked path into its href"]}
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md):
+        md.inlinePatterns.register(
+            WikiLinkProcessor(LINK_PATTERN, md, self.getConfig('build_url')),
+            'alight_wikilink', 75)
+
+
+def render_markdown(text):
+    return markdown.markdown(text, extensions=[WikiLinkExtension()])
+
+
+class LinkIndex:
+    """Outgoing wiki-links of every leaf, queryable by target.
+
+    Sources are node ids, so renaming a linking leaf leaves its rows alone,
+    while targets are paths as written in the content. KnowledgeStore
+    updates a leaf's rows in the same transaction as its content.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @staticmethod
+    def create(db):
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS links (
+                source INTEGER NOT NULL,
+                target TEXT NOT NULL,
+                PRIMARY KEY (source, target)
+            ) WITHOUT ROWID""")
+        db.execute("CREATE INDEX IF NOT EXISTS links_target ON links (target, source)")
+        db.execute("DELETE FROM links")
+        db.executemany("INSERT INTO links (source, target) VALUES (?, ?)", [
+            (node_id, target)
+            for node_id, body in db.execute("SELECT node_id, body FROM contents")
+            for target in extract_links(body)])
+
+    def update(self, db, path, content):
+        node_id = db.execute("SELECT id FROM nodes WHERE path = ?", (path,)).fetchone()[0]
+        db.execute("DELETE FROM links WHERE source = ?", (node_id,))
+        db.executemany("INSERT INTO links (source, target) VALUES (?, ?)",
+                       [(node_id, target) for target in extract_links(content)])
+
+    def remove_subtree(self, db, path, low, high):
+        db.execute("""
+            DELETE FROM links WHERE source IN (
+                SELECT id FROM nodes
+                WHERE path = ? OR (path >= ? AND path < ?))""", (path, low, high))
+
+    def backlinks(self, path):
+        """Return the paths of leaves that link to path."""
+        return [source for source, in self.connection.execute("""
+            SELECT nodes.path FROM links JOIN nodes ON nodes.id = links.source
+            WHERE links.target = ? ORDER BY nodes.path""", (path,))]
+
+    def inbound(self, path, low, high):
+        # Leaves linking to path or anything below it
+        return [source for source, in self.connection.execute("""
+            SELECT DISTINCT nodes.path FROM links JOIN nodes ON nodes.id = links.source
+            WHERE links.target = ? OR (links.target >= ? AND links.target < ?)""",
+            (path, low, high))]
+
+    def relink(self, knowledge_base, old_path, new_path):
+        """Rewrite links to a renamed subtree in every leaf that has them."""
+        for source in self.inbound(old_path, *subtree_bounds(old_path)):
+            node = knowledge_base.get(source)
+            content = knowledge_base.content(node)
+            knowledge_base.update(source, rewrite_links(content, old_path, new_path))
@@ -1,71 +1,423 @@
 # src/lumineer/alight/main.py
 import appdirs
 import sys
-import json
 import os
+import html
+import hashlib
+from concurrent.futures import Future
+from datetime import datetime
+from itertools import islice
 from PyQt6.QtWidgets import (QApplication, QDialog, QDialogButtonBox, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QLabel, QLineEdit, QPushButton,
-                             QTextEdit, QTreeWidget, QTreeWidgetItem,
-                             QMessageBox, QSplitter, QTextBrowser, QRadioButton, QSizePolicy)
+                             QListWidget, QListWidgetItem, QCompleter,
+                             QTextEdit, QTreeView, QHeaderView,
+                             QMessageBox, QSplitter, QFileDialog, QTextBrowser, QRadioButton, QSizePolicy)
 from PyQt6.QtGui import QShortcut, QKeySequence
-from PyQt6.QtCore import Qt, QEvent
+from PyQt6.QtCore import (Qt, QAbstractItemModel, QEvent, QModelIndex, QObject,
+                          QRunnable, QStringListModel, QThreadPool, QTimer,
+                          pyqtSignal)
+
+from .complete import PathCompleter
+from .history import History
+from .importer import markdown_entries, node_name
+from .server import DEFAULT_ADDRESS, KnowledgeServer, ServerThread, apply_write
+from .site import export_site
+from .stats import SubtreeStats
+from .knowledge import KnowledgeBase, KnowledgeListener, KnowledgeNode
+from .links import render_markdown
+from .store import ContentCache, KnowledgeStore
+
+PREVIEW_DELAY_MS = 200
+RENDER_CACHE_SIZE = 16 * 1024 * 1024  # Characters of rendered HTML
 
-import markdown
+class MarkdownTextEdit(QTextBrowser):
+    def setMarkdownText(self, text):
+        html = render_markdown(text)
+        self.setHtml(html)
 
-class KnowledgeNode:
-    def __init__(self, name, content=None):
-        self.name = name
-        self.content = content
-        self.children = {}
+class MarkdownRenderJob(QRunnable):
+    def __init__(self, renderer, generation, key, text):
+        super().__init__()
+        self.renderer = renderer
+        self.generation = generation
+        self.key = key
+        self.text = text
+
+    def run(self):
+        # A newer request has already superseded this one
+        if self.generation != self.renderer.generation:
+            return
+        html = render_markdown(self.text)
+        try:
+            self.renderer.finished.emit(self.generation, self.key, html)
+        except RuntimeError:
+            pass  # The window closed while this job was running
+
+class MarkdownRenderer(QObject):
+    """Renders Markdown on a worker thread, caching HTML by node and content hash.
+
+    Only the most recent request is ever delivered through `rendered`;
+    results for superseded requests are cached but not shown.
+    """
+
+    rendered = pyqtSignal(str)
+    finished = pyqtSignal(int, object, str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.generation = 0
+        self.cache = ContentCache(RENDER_CACHE_SIZE)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.finished.connect(self.on_finished)
+
+    def request(self, node, text):
+        self.generation += 1
+        if not text:
+            self.rendered.emit("")
+            return
+        key = (node, hashlib.blake2b(text.encode(), digest_size=16).digest())
+        html = self.cache.get(key)
+        if html is not None:
+            self.rendered.emit(html)
+        else:
+            self.pool.start(MarkdownRenderJob(self, self.generation, key, text))
 
-    def add_child(self, name, content=None):
-        self.children[name] = KnowledgeNode(name, content)
+    def on_finished(self, generation, key, html):
+        self.cache.put(key, html)
+        if generation == self.generation:
+            self.rendered.emit(html)
 
-    def remove_child(self, name):
-        del self.children[name]
+    def shutdown(self):
+        self.generation += 1
+        self.pool.waitForDone()
 
-    def to_dict(self):
-        result = {"name": self.name, "content": self.content}
-        if self.children:
-            result["children"] = {name: child.to_dict() 
-                                  for name, child in self.children.items()}
-        return result
+class ServerWriter(QObject):
+    """Carries write requests from the server thread over to the GUI thread."""
 
-    @classmethod
-    def from_dict(cls, data):
-        node = cls(data["name"], data.get("content"))
-        for child_data in data.get("children", {}).values():
-            child = cls.from_dict(child_data)
-            node.children[child.name] = child
-        return node
+    requested = pyqtSignal(object, object)
 
-class MarkdownTextEdit(QTextBrowser):
-    def setMarkdownText(self, text):
-        html = markdown.markdown(text)
-        self.setHtml(html)
+    def __init__(self, knowledge_base, parent=None):
+        super().__init__(parent)
+        self.knowledge_base = knowledge_base
+        self.requested.connect(self.apply)
+
+    def __call__(self, request):
+        future = Future()
+        self.requested.emit(request, future)
+        return future
+
+    def apply(self, request, future):
+        # The server may have given up on the request while it was queued
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(apply_write(self.knowledge_base, request))
+        except Exception as e:
+            # Anything left unresolved would hold the server's write lock
+            future.set_exception(e)
+
+class KnowledgeTreeModel(QAbstractItemModel, KnowledgeListener):
+    """Lazy item model over a KnowledgeBase.
+
+    Children are fetched in batches as the view asks for them, and only node
+    names and their subtree statistics are exposed to the view; leaf content
+    stays in the store.
+    """
+
+    FETCH_BATCH = 256
+    HEADERS = ("Knowledge Structure", "Leaves", "Size", "Modified")
+
+    def __init__(self, knowledge_base, parent=None):
+        super().__init__(parent)
+        self.knowledge_base = knowledge_base
+        self.rows = {}  # node -> children fetched so far, in display order
+        self.positions = {knowledge_base.root: 0}  # node -> row within its parent
+        self.changing = None  # parent whose rows are mid-insert/remove
+
+    def reset(self):
+        self.beginResetModel()
+        self.rows.clear()
+        self.positions.clear()
+        self.positions[self.knowledge_base.root] = 0
+        self.endResetModel()
+
+    def node_from_index(self, index):
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def index_for_node(self, node, column=0):
+        if node is None or node not in self.positions:
+            return QModelIndex()
+        return self.createIndex(self.positions[node], column, node)
+
+    def fetch_to(self, node):
+        # Fetch just enough of each ancestor to make node addressable
+        chain = []
+        while node is not None:
+            chain.append(node)
+            node = node.parent
+        for ancestor in reversed(chain):
+            parent = ancestor.parent
+            while ancestor not in self.positions and parent is not None:
+                parent_index = self.index_for_node(parent)
+                if not self.canFetchMore(parent_index):
+                    break
+                self.fetchMore(parent_index)
+        return self.index_for_node(chain[0] if chain else None)
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not 0 <= column < len(self.HEADERS) or row < 0:
+            return QModelIndex()
+        if not parent.isValid():
+            if row == 0:
+                return self.createIndex(0, column, self.knowledge_base.root)
+            return QModelIndex()
+        if parent.column() > 0:
+            return QModelIndex()  # Only the first column has children
+        rows = self.rows.get(parent.internalPointer(), [])
+        if row >= len(rows):
+            return QModelIndex()
+        return self.createIndex(row, column, rows[row])
+
+    def parent(self, index=QModelIndex()):
+        node = self.node_from_index(index)
+        if node is None or node.parent is None:
+            return QModelIndex()
+        return self.index_for_node(node.parent)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return 1
+        if parent.column() > 0:
+            return 0
+        return len(self.rows.get(parent.internalPointer(), ()))
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return True
+        return parent.column() == 0 and bool(parent.internalPointer().children)
+
+    def canFetchMore(self, parent):
+        node = self.node_from_index(parent)
+        if node is None or self.changing is not None:
+            return False
+        return len(self.rows.get(node, ())) < len(node.children)
+
+    def fetchMore(self, parent):
+        node = self.node_from_index(parent)
+        if node is None or self.changing is not None:
+            return
+        rows = self.rows.setdefault(node, [])
+        start = len(rows)
+        batch = list(islice(node.children.values(), start,
+                            start + self.FETCH_BATCH))
+        if not batch:
+            return
+        self.changing = node
+        self.beginInsertRows(parent, start, start + len(batch) - 1)
+        for offset, child in enumerate(batch):
+            rows.append(child)
+            self.positions[child] = start + offset
+        self.endInsertRows()
+        self.changing = None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        node = self.node_from_index(index)
+        if node is None:
+            return None
+        column = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Each column reads a value kept current on the node
+            if column == 0:
+                return node.name
+            if column == 1:
+                return f"{node.leaves:,}"
+            if column == 2:
+                return f"{node.size:,}"
+            if node.modified:
+                return datetime.fromtimestamp(node.modified).strftime("%Y-%m-%d %H:%M")
+            return ""
+        if role == Qt.ItemDataRole.TextAlignmentRole and column in (1, 2):
+            return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self.HEADERS)):
+            return self.HEADERS[section]
+        return None
+
+    def stats_changed(self, node):
+        # Aggregates change along the whole ancestor chain
+        while node is not None:
+            if node in self.positions:
+                self.dataChanged.emit(self.index_for_node(node, 1),
+                                      self.index_for_node(node, len(self.HEADERS) - 1))
+            node = node.parent
+
+    def forget(self, node):
+        self.positions.pop(node, None)
+        for child in self.rows.pop(node, ()):
+            self.forget(child)
+
+    def node_inserted(self, node, content):
+        parent = node.parent
+        self.stats_changed(parent)
+        if parent not in self.positions:
+            return
+        rows = self.rows.get(parent)
+        if rows is None:
+            if len(parent.children) != 1:
+                return  # Not fetched yet; fetchMore will pick it up
+            rows = self.rows[parent] = []
+        if len(rows) != len(parent.children) - 1:
+            return  # Still has unfetched children ahead of the new one
+        row = len(rows)
+        self.changing = parent
+        self.beginInsertRows(self.index_for_node(parent), row, row)
+        rows.append(node)
+        self.positions[node] = row
+        self.endInsertRows()
+        self.changing = None
+
+    def nodes_inserted(self, entries):
+        # A bulk insert is shown with a single reset rather than row by row
+        self.reset()
+
+    def node_removed(self, parent, node):
+        self.stats_changed(parent)
+        if node not in self.positions:
+            return
+        rows = self.rows[parent]
+        row = self.positions[node]
+        self.changing = parent
+        self.beginRemoveRows(self.index_for_node(parent), row, row)
+        del rows[row]
+        self.forget(node)
+        for position in range(row, len(rows)):
+            self.positions[rows[position]] = position
+        self.endRemoveRows()
+        self.changing = None
+
+    def node_renamed(self, node, old_name):
+        index = self.index_for_node(node)
+        if index.isValid():
+            self.dataChanged.emit(index, index)
+        self.stats_changed(node)
+
+    def content_changed(self, node, content):
+        self.stats_changed(node)
 
 class AlightGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.data_dir = os.path.join(appdirs.user_data_dir("Lumineer", "kosmolebryce"), "Alight")
         os.makedirs(self.data_dir, exist_ok=True)
-        self.db_path = os.path.join(self.data_dir, "knowledge.json")
-        self.knowledge_base = KnowledgeNode("alight")
+        self.db_path = os.path.join(self.data_dir, "knowledge.db")
+        self.json_path = os.path.join(self.data_dir, "knowledge.json")
+        self.site_dir = os.path.join(self.data_dir, "site")
+        self.server_address = os.environ.get("LUMINEER_ALIGHT_SERVER", DEFAULT_ADDRESS)
+        self.server_thread = None
         self.load_knowledge_base()
         self.init_ui()
         self.setup_shortcuts()
 
     def load_knowledge_base(self):
-        if os.path.exists(self.db_path):
-            with open(self.db_path, "r") as f:
-                data = json.load(f)
-                self.knowledge_base = KnowledgeNode.from_dict(data)
-        else:
-            self.knowledge_base = KnowledgeNode("alight")
+        self.store = KnowledgeStore(self.db_path)
+        # One-shot migration from the old single-file format
+        self.store.migrate(self.json_path)
+        self.knowledge_base = KnowledgeBase(self.store.load_skeleton(),
+                                            self.store.get_content)
+        self.knowledge_base.add_listener(self.store)
+        self.history = History(self.store)
+        self.knowledge_base.add_listener(self.history)
+        self.knowledge_base.add_listener(SubtreeStats())
+
+    def export_knowledge_base(self):
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Export Knowledge Base", self.json_path, "JSON Files (*.json)")
+        if path:
+            self.store.export_json(path)
+            QMessageBox.information(self, "Success", f"Exported to {path}.")
+
+    def publish_site(self):
+        directory = QFileDialog.getExistingDirectory(
+            self, "Publish Static Site", self.site_dir)
+        if not directory:
+            return
+        self.site_dir = directory
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            written = export_site(self.history, self.knowledge_base.root, directory)
+        finally:
+            QApplication.restoreOverrideCursor()
+        QMessageBox.information(self, "Success",
+                                f"Published to {directory} ({written} pages updated).")
+
+    def import_markdown_directory(self):
+        directory = QFileDialog.getExistingDirectory(self, "Import Markdown Folder")
+        if not directory:
+            return
+        # Import under the selected node, or under the root
+        parent = self.get_node_from_path(self.path_input.text()) or self.knowledge_base.root
+        name = node_name(os.path.basename(os.path.normpath(directory)))
+        target = f"{parent.path}.{name}"
+        if self.get_node_from_path(target) is not None:
+            QMessageBox.warning(self, "Error", f"Entry '{target}' already exists.")
+            return
 
-    def save_knowledge_base(self):
-        with open(self.db_path, "w") as f:
-            json.dump(self.knowledge_base.to_dict(), f, indent=2)
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            entries, renamed = markdown_entries(directory, target)
+            if entries:
+                with self.store.transaction():
+                    self.knowledge_base.create_many(entries)
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        if not entries:
+            QMessageBox.warning(self, "Error", "No Markdown files found.")
+            return
+        self.tree.expand(self.tree_model.index(0, 0))
+        self.select_item_by_path(target)
+        message = f"Imported {len(entries)} notes."
+        if renamed:
+            message += (f"\n\n{len(renamed)} files had the same name as another note "
+                        "and were imported as:\n"
+                        + "\n".join(f"{os.path.basename(file_path)} -> {path}"
+                                     for file_path, path in renamed[:10]))
+            if len(renamed) > 10:
+                message += f"\n... and {len(renamed) - 10} more"
+        QMessageBox.information(self, "Success", message)
+
+    def toggle_server(self, enabled):
+        if not enabled:
+            if self.server_thread is not None:
+                self.server_thread.stop()
+                self.server_thread = None
+            return
+        server = KnowledgeServer(self.db_path, ServerWriter(self.knowledge_base, self))
+        self.server_thread = ServerThread(server, self.server_address)
+        self.server_thread.start()
+        try:
+            self.server_thread.started.result(timeout=5)
+        except Exception as e:
+            self.server_thread = None
+            self.serve_btn.setChecked(False)
+            QMessageBox.warning(self, "Error", f"Could not start server: {e}")
+
+    def closeEvent(self, event):
+        if self.server_thread is not None:
+            self.server_thread.stop()
+        self.renderer.shutdown()
+        self.store.close()
+        super().closeEvent(event)
 
     def eventFilter(self, source, event):
         if (source is self.tree and event.type() == QEvent.Type.KeyPress
@@ -86,14 +438,42 @@ class AlightGUI(QMainWindow):
         self.main_splitter = QSplitter(Qt.Orientation.Horizontal)
         main_layout.addWidget(self.main_splitter)
 
-        # Tree view on the left
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabel("Knowledge Structure")
-        self.tree.itemClicked.connect(self.on_item_selected)
-        self.tree.currentItemChanged.connect(lambda current, previous: 
-                                            self.on_item_selected(current))
+        # Search and tree view on the left
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        left_layout.setContentsMargins(0, 0, 0, 0)
+        self.main_splitter.addWidget(left_widget)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search (e.g., alight.science.* force)")
+        self.search_input.textChanged.connect(self.run_search)
+        left_layout.addWidget(self.search_input)
+
+        self.left_splitter = QSplitter(Qt.Orientation.Vertical)
+        left_layout.addWidget(self.left_splitter)
+
+        self.tree = QTreeView()
+        self.tree_model = KnowledgeTreeModel(self.knowledge_base, self)
+        self.knowledge_base.add_listener(self.tree_model)
+        self.tree.setModel(self.tree_model)
+        self.tree.setUniformRowHeights(True)
+        header = self.tree.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column, width in ((1, 60), (2, 80), (3, 120)):
+            self.tree.setColumnWidth(column, width)
+        self.tree.clicked.connect(self.on_item_selected)
+        self.tree.selectionModel().currentChanged.connect(
+            lambda current, previous: self.on_item_selected(current))
         self.tree.installEventFilter(self)
-        self.main_splitter.addWidget(self.tree)
+        self.left_splitter.addWidget(self.tree)
+
+        self.search_results = QTextBrowser()
+        self.search_results.setOpenLinks(False)
+        self.search_results.anchorClicked.connect(
+            lambda url: self.select_item_by_path(url.toString()))
+        self.search_results.setVisible(False)
+        self.left_splitter.addWidget(self.search_results)
 
         # Right side widget
         right_widget = QWidget()
@@ -107,6 +487,15 @@ class AlightGUI(QMainWindow):
         self.path_input = QLineEdit()
         self.path_input.setPlaceholderText("Enter path (e.g., alight.science.physics)")
         self.path_input.returnPressed.connect(self.navigate_to_path)
+        self.path_completer = PathCompleter(self.knowledge_base)
+        self.knowledge_base.add_listener(self.path_completer)
+        self.completions = QStringListModel(self)
+        completer = QCompleter(self.completions, self)
+        # Suggestions are already ranked, so show them as they are
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        completer.activated.connect(self.navigate_to_completion)
+        self.path_input.setCompleter(completer)
+        self.path_input.textEdited.connect(self.update_completions)
         nav_layout.addWidget(self.path_input)
         nav_button = QPushButton("Go")
         nav_button.clicked.connect(self.navigate_to_path)
@@ -133,9 +522,27 @@ class AlightGUI(QMainWindow):
         self.content_splitter = QSplitter(Qt.Orientation.Vertical)
         self.content_input = QTextEdit()
         self.markdown_view = MarkdownTextEdit()
+        self.markdown_view.setOpenLinks(False)
+        self.markdown_view.anchorClicked.connect(
+            lambda url: self.select_item_by_path(url.toString()))
+        self.renderer = MarkdownRenderer(self)
+        self.renderer.rendered.connect(self.markdown_view.setHtml)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(PREVIEW_DELAY_MS)
+        self.preview_timer.timeout.connect(self.update_live_preview)
+        self.content_input.textChanged.connect(self.preview_timer.start)
         self.content_splitter.addWidget(self.content_input)
         self.content_splitter.addWidget(self.markdown_view)
         content_layout.addWidget(self.content_splitter)
+
+        self.backlinks_view = QTextBrowser()
+        self.backlinks_view.setOpenLinks(False)
+        self.backlinks_view.setMaximumHeight(80)
+        self.backlinks_view.anchorClicked.connect(
+            lambda url: self.select_item_by_path(url.toString()))
+        self.backlinks_view.setVisible(False)
+        content_layout.addWidget(self.backlinks_view)
         right_layout.addLayout(content_layout)
 
         # CRUD buttons
@@ -156,6 +563,28 @@ class AlightGUI(QMainWindow):
         delete_btn.clicked.connect(self.delete_entry)
         button_layout.addWidget(delete_btn)
 
+        history_btn = QPushButton("History")
+        history_btn.clicked.connect(self.show_history_dialog)
+        button_layout.addWidget(history_btn)
+
+        import_btn = QPushButton("Import")
+        import_btn.clicked.connect(self.import_markdown_directory)
+        button_layout.addWidget(import_btn)
+
+        export_btn = QPushButton("Export")
+        export_btn.clicked.connect(self.export_knowledge_base)
+        button_layout.addWidget(export_btn)
+
+        publish_btn = QPushButton("Publish")
+        publish_btn.clicked.connect(self.publish_site)
+        button_layout.addWidget(publish_btn)
+
+        self.serve_btn = QPushButton("Serve")
+        self.serve_btn.setCheckable(True)
+        self.serve_btn.setToolTip(f"Answer local queries on {self.server_address}")
+        self.serve_btn.toggled.connect(self.toggle_server)
+        button_layout.addWidget(self.serve_btn)
+
         button_layout.addStretch(1)
 
         button_container = QWidget()
@@ -183,16 +612,43 @@ class AlightGUI(QMainWindow):
         
         if is_leaf:
             self.content_splitter.setSizes([70, 740])
-            if node.content is not None:
-                self.content_input.setPlainText(node.content)
-                self.markdown_view.setMarkdownText(node.content)
+            if node.is_leaf:
+                content = self.knowledge_base.content(node)
+                self.content_input.setPlainText(content)
+                self.render_preview(content, node)
             else:
                 self.content_input.clear()
-                self.markdown_view.setMarkdownText("")
+                self.render_preview("")
         else:
             self.content_splitter.setSizes([400, 0])
             children = ", ".join(node.children.keys())
-            self.content_input.setPlainText(f"Children: {children}")
+            self.content_input.setPlainText(
+                f"Children: {children}\n\n"
+                f"Leaves: {node.leaves:,}\nSize: {node.size:,} characters")
+
+    def render_preview(self, text, node=None):
+        # Programmatic text changes should not queue a second render
+        self.preview_timer.stop()
+        self.renderer.request(node, text)
+
+    def update_live_preview(self):
+        if not self.leaf_radio.isChecked():
+            return
+        node = self.get_node_from_path(self.path_input.text())
+        self.renderer.request(node, self.content_input.toPlainText())
+
+    def run_search(self, text):
+        text = text.strip()
+        self.search_results.setVisible(bool(text))
+        if not text:
+            return
+        results = self.store.index.search(text)
+        if not results:
+            self.search_results.setHtml("<i>No matches.</i>")
+            return
+        self.search_results.setHtml("".join(
+            f'<p><a href="{html.escape(path)}">{html.escape(path)}</a><br>{snippet}</p>'
+            for path, snippet in results))
 
     def show_rename_dialog(self):
         path = self.path_input.text()
@@ -227,6 +683,56 @@ class AlightGUI(QMainWindow):
             if new_name and new_name != old_name:
                 self.rename_entry(path, new_name)
 
+    def show_history_dialog(self):
+        path = self.path_input.text()
+        entries = self.history.versions(path)
+        if not entries:
+            QMessageBox.warning(self, "Error", f"No history for: {path}")
+            return
+
+        dialog = QDialog(self)
+        dialog.setWindowTitle(f"History of {path}")
+        dialog.resize(720, 480)
+        layout = QVBoxLayout(dialog)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        versions = QListWidget()
+        preview = MarkdownTextEdit()
+        splitter.addWidget(versions)
+        splitter.addWidget(preview)
+        layout.addWidget(splitter)
+
+        for snapshot_id, created, action, changed, digest in entries:
+            stamp = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S")
+            item = QListWidgetItem(f"{stamp}  {action} {changed}")
+            item.setData(Qt.ItemDataRole.UserRole, digest)
+            versions.addItem(item)
+
+        def show_version(item):
+            if item is None:
+                return
+            content, children = self.history.describe(
+                item.data(Qt.ItemDataRole.UserRole))
+            if content is None:
+                content = "Children:\n" + "\n".join(f"- {name}" for name in children)
+            preview.setMarkdownText(content)
+
+        versions.currentItemChanged.connect(show_version)
+        versions.setCurrentRow(0)
+
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        restore_button = button_box.addButton(
+            "Restore", QDialogButtonBox.ButtonRole.AcceptRole)
+        button_box.accepted.connect(dialog.accept)
+        button_box.rejected.connect(dialog.reject)
+        layout.addWidget(button_box)
+
+        if dialog.exec() == QDialog.DialogCode.Accepted and versions.currentItem() is not None:
+            self.history.restore(self.knowledge_base, path,
+                                 versions.currentItem().data(Qt.ItemDataRole.UserRole))
+            self.select_item_by_path(path)
+            QMessageBox.information(self, "Success", f"Restored {path}.")
+
     def rename_entry(self, path, new_name):
         parts = path.split('.')
         parent_path, old_name = '.'.join(parts[:-1]), parts[-1]
@@ -238,19 +744,14 @@ class AlightGUI(QMainWindow):
                                     f"An entry named '{new_name}' already exists.")
                 return
             
-            node = parent_node.children[old_name]
-            parent_node.children[new_name] = node
-            del parent_node.children[old_name]
-            node.name = new_name
-
-            # Update paths of all child nodes
-            self.update_child_paths(node, parent_path)
+            # Renaming and rewriting the links that point into the renamed
+            # subtree is recorded as one change
+            new_path = f"{parent_path}.{new_name}"
+            with self.history.grouped(self.knowledge_base.root, "rename", new_path):
+                self.knowledge_base.rename(path, new_name)
+                self.store.links.relink(self.knowledge_base, path, new_path)
 
-            self.save_knowledge_base()
-            self.refresh_tree()
-            
             # Update the path input to reflect the new name
-            new_path = f"{parent_path}.{new_name}"
             self.path_input.setText(new_path)
             self.select_item_by_path(new_path)
             
@@ -275,138 +776,103 @@ class AlightGUI(QMainWindow):
         update_shortcut.activated.connect(self.update_entry)
 
     def refresh_tree(self):
-        self.tree.clear()
-        root_item = QTreeWidgetItem(self.tree, ["alight"])
-        self.add_node_to_tree(self.knowledge_base, root_item)
-        self.tree.expandAll()
-
-    def add_node_to_tree(self, node, parent_item):
-        for name, child in node.children.items():
-            item = QTreeWidgetItem(parent_item, [name])
-            if child.content is not None:
-                item.setData(0, Qt.ItemDataRole.UserRole, child.content)
-            self.add_node_to_tree(child, item)
+        self.tree_model.reset()
+        self.tree.expand(self.tree_model.index(0, 0))
+
+    def update_completions(self, text):
+        self.completions.setStringList(self.path_completer.complete(text))
+        self.path_input.completer().complete()
+
+    def navigate_to_completion(self, path):
+        self.path_input.setText(path)
+        self.navigate_to_path()
 
     def navigate_to_path(self):
         path = self.path_input.text()
         if not path.startswith('alight'):
             path = 'alight.' + path
 
-        item = self.find_item_by_path(path)
-        if item:
-            self.tree.setCurrentItem(item)
-            self.tree.expandItem(item)
-            self.on_item_selected(item, 0)
+        index = self.find_item_by_path(path)
+        if index.isValid():
+            self.tree.setCurrentIndex(index)
+            self.tree.expand(index)
+            self.on_item_selected(index, 0)
         else:
             QMessageBox.warning(self, "Error", f"Path not found: {path}")
 
     def find_item_by_path(self, path):
-        def find_item_recursive(item, parts):
-            if not parts:
-                return item
-            for i in range(item.childCount()):
-                child = item.child(i)
-                if child.text(0) == parts[0]:
-                    return find_item_recursive(child, parts[1:])
-            return None
-
-        parts = path.split('.')[1:]  # Skip the 'alight' part
-        root_item = self.tree.topLevelItem(0)  # 'alight' is the top-level item
-        return find_item_recursive(root_item, parts)
+        node = self.get_node_from_path(path)
+        if node is None:
+            return QModelIndex()
+        return self.tree_model.fetch_to(node)
 
     def select_item_by_path(self, path):
-        def find_item(item, target_path):
-            if self.get_item_path(item) == target_path:
-                return item
-            for i in range(item.childCount()):
-                child = item.child(i)
-                result = find_item(child, target_path)
-                if result:
-                    return result
-            return None
-
-        root = self.tree.invisibleRootItem()
-        for i in range(root.childCount()):
-            item = find_item(root.child(i), path)
-            if item:
-                self.tree.setCurrentItem(item)
-                self.tree.expandItem(item)
-                self.on_item_selected(item, 0)
-                return
+        index = self.find_item_by_path(path)
+        if index.isValid():
+            self.tree.setCurrentIndex(index)
+            self.tree.expand(index)
+            self.on_item_selected(index, 0)
+            return
 
         QMessageBox.warning(self, "Error", f"Item not found: {path}")
 
     def get_node_from_path(self, path):
-        parts = path.split('.')
-        node = self.knowledge_base
-        for part in parts[1:]:  # Skip 'alight'
-            if part in node.children:
-                node = node.children[part]
-            else:
-                return None
-        return node
+        return self.knowledge_base.get(path)
 
-    def on_item_selected(self, item, column=0):
-        if item is None:
+    def on_item_selected(self, index, column=0):
+        node = self.tree_model.node_from_index(index)
+        if node is None:
             return
         
-        path = self.get_item_path(item)
+        path = node.path
         self.path_input.setText(path)
+        self.show_backlinks(path)
         
-        node = self.get_node_from_path(path)
-        
-        if node is None:
-            return
-        
-        if node.content is not None:
+        if node.is_leaf:
             # This is a leaf
+            content = self.knowledge_base.content(node)
             self.leaf_radio.setChecked(True)
-            self.content_input.setPlainText(node.content)
-            self.markdown_view.setMarkdownText(node.content)
+            self.content_input.setPlainText(content)
+            self.render_preview(content, node)
         else:
             # This is a node
             self.node_radio.setChecked(True)
             children = "  - \n".join(node.children.keys())
             self.content_input.setPlainText(f"Children: {children}")
-            self.markdown_view.setMarkdownText("")
+            self.render_preview("")
         
         self.toggle_markdown_preview()
 
-    def get_item_path(self, item):
-        path = []
-        while item is not None:
-            path.insert(0, item.text(0))
-            item = item.parent()
-        return '.'.join(path)
+    def show_backlinks(self, path):
+        sources = self.store.links.backlinks(path)
+        self.backlinks_view.setVisible(bool(sources))
+        self.backlinks_view.setHtml("Linked from: " + ", ".join(
+            f'<a href="{html.escape(source)}">{html.escape(source)}</a>'
+            for source in sources))
+
+    def get_item_path(self, index):
+        node = self.tree_model.node_from_index(index)
+        return node.path if node is not None else ''
 
     def create_entry(self):
         path = self.path_input.text()
         is_leaf = self.leaf_radio.isChecked()
         content = self.content_input.toPlainText() if is_leaf else None
 
-        parts = path.split('.')[1:]  # Skip the 'alight' part
-        parent = self.knowledge_base
-        for part in parts[:-1]:
-            if part not in parent.children:
-                parent.add_child(part)
-            parent = parent.children[part]
-
-        name = parts[-1]
-        if name in parent.children:
+        name = path.split('.')[-1]
+        if self.get_node_from_path(path) is not None:
             QMessageBox.warning(self, "Error", f"Entry '{name}' already exists.")
             return
 
-        parent.add_child(name, content)
-        self.save_knowledge_base()
-        self.refresh_tree()
+        self.knowledge_base.create(path, content)
         self.select_item_by_path(path)
         
         if is_leaf:
             self.content_input.setPlainText(content or "")
-            self.markdown_view.setMarkdownText(content or "")
+            self.render_preview(content or "", self.get_node_from_path(path))
         else:
             self.content_input.setPlainText("Children:")
-            self.markdown_view.setMarkdownText("")
+            self.render_preview("")
         
         QMessageBox.information(self, "Success", 
                                 f"{'Leaf' if is_leaf else 'Node'} created.")
@@ -440,17 +906,13 @@ class AlightGUI(QMainWindow):
             parent_node = self.get_node_from_path(parent_path)
             
             if parent_node and name in parent_node.children:
-                node = parent_node.children[name]
-                
                 # Update content
                 if is_leaf:
-                    node.content = content
+                    self.knowledge_base.update(path, content)
                 else:
-                    node.content = None
+                    self.knowledge_base.update(path, None)
                     self.content_input.setPlainText("Children:")
 
-                self.save_knowledge_base()
-                self.refresh_tree()
                 
                 # Update the path input to reflect any changes
                 self.path_input.setText(path)
@@ -460,12 +922,6 @@ class AlightGUI(QMainWindow):
             else:
                 QMessageBox.warning(self, "Error", "Entry not found.")
 
-    def update_child_paths(self, node, parent_path):
-        for child_name, child_node in node.children.items():
-            child_node.name = child_name
-            new_parent_path = f"{parent_path}.{node.name}"
-            self.update_child_paths(child_node, new_parent_path)
-
     def delete_entry(self):
         path = self.path_input.text()
         if path == 'alight':
@@ -492,12 +948,10 @@ class AlightGUI(QMainWindow):
             parent = self.get_node_from_path(parent_path)
 
             if parent and name in parent.children:
-                parent.remove_child(name)
-                self.save_knowledge_base()
-                self.refresh_tree()
+                self.knowledge_base.delete(path)
                 self.path_input.clear()
                 self.content_input.clear()
-                self.markdown_view.setMarkdownText("")
+                self.render_preview("")
                 QMessageBox.information(self, "Success", "Entry deleted.")
             else:
                 QMessageBox.warning(self, "Error", "Entry not found.")
@@ -0,0 +1,111 @@
+# src/lumineer/alight/search.py
+import html
+
+from .knowledge import subtree_bounds
+
+HIGHLIGHT_START = "\x01"
+HIGHLIGHT_END = "\x02"
+SNIPPET_TOKENS = 16
+NAME_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+
+
+def parse_query(text):
+    """Split a query into FTS terms and an optional 'alight.some.path.*' scope."""
+    terms = []
+    scope = None
+    for term in text.split():
+        if term.endswith('.*') and term.startswith('alight'):
+            scope = term[:-2]
+        else:
+            terms.append(term)
+    return terms, scope
+
+
+def match_expression(terms):
+    # Quote every term so user input never hits FTS syntax; the last term is
+    # a prefix so results update while typing
+    quoted = ['"' + term.replace('"', '""') + '"' for term in terms]
+    if quoted:
+        quoted[-1] += '*'
+    return ' '.join(quoted)
+
+
+def highlight(snippet):
+    return (html.escape(snippet)
+            .replace(HIGHLIGHT_START, "<b>")
+            .replace(HIGHLIGHT_END, "</b>"))
+
+
+class SearchIndex:
+    """Full-text index over node names and leaf content.
+
+    The FTS5 table reads its text from the nodes and contents tables, so the
+    index itself holds only postings. KnowledgeStore keeps it in step inside
+    the same transaction as each write.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    @staticmethod
+    def create(db):
+        db.execute("""
+            CREATE VIEW IF NOT EXISTS search_source AS
+            SELECT nodes.id AS id, nodes.name AS name,
+                   coalesce(contents.body, '') AS body
+            FROM nodes LEFT JOIN contents ON contents.node_id = nodes.id""")
+        db.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(
+                name, body,
+                content='search_source', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2'
+            )""")
+        db.execute("INSERT INTO search (search) VALUES ('rebuild')")
+
+    def add(self, db, path):
+        db.execute("""
+            INSERT INTO search (rowid, name, body)
+            SELECT id, name, body FROM search_source
+            WHERE id = (SELECT id FROM nodes WHERE path = ?)""", (path,))
+
+    def add_many(self, db, paths):
+        db.executemany("""
+            INSERT INTO search (rowid, name, body)
+            SELECT id, name, body FROM search_source
+            WHERE id = (SELECT id FROM nodes WHERE path = ?)""",
+            [(path,) for path in paths])
+
+    def remove(self, db, path):
+        # External-content FTS needs the old text to drop its postings
+        db.execute("""
+            INSERT INTO search (search, rowid, name, body)
+            SELECT 'delete', id, name, body FROM search_source
+            WHERE id = (SELECT id FROM nodes WHERE path = ?)""", (path,))
+
+    def remove_subtree(self, db, path, low, high):
+        db.execute("""
+            INSERT INTO search (search, rowid, name, body)
+            SELECT 'delete', id, name, body FROM search_source
+            WHERE id IN (SELECT id FROM nodes
+                         WHERE path = ? OR (path >= ? AND path < ?))""",
+            (path, low, high))
+
+    def search(self, text, limit=50):
+        """Return (path, snippet_html) pairs, best matches first."""
+        terms, scope = parse_query(text)
+        if not terms:
+            return []
+        sql = f"""
+            SELECT nodes.path,
+                   snippet(search, -1, ?, ?, '…', {SNIPPET_TOKENS})
+            FROM search JOIN nodes ON nodes.id = search.rowid
+            WHERE search MATCH ?"""
+        params = [HIGHLIGHT_START, HIGHLIGHT_END, match_expression(terms)]
+        if scope is not None:
+            sql += " AND (nodes.path = ? OR (nodes.path >= ? AND nodes.path < ?))"
+            params += [scope, *subtree_bounds(scope)]
+        sql += f" ORDER BY bm25(search, {NAME_WEIGHT}, {BODY_WEIGHT}) LIMIT ?"
+        params.append(limit)
+        return [(path, highlight(snippet))
+                for path, snippet in self.connection.execute(sql, params)]
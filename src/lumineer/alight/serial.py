@@ -0,0 +1,208 @@
+# src/lumineer/alight/serial.py
+import json
+import re
+from json.decoder import scanstring
+
+from .knowledge import KnowledgeNode
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r'
+LITERAL = re.compile(r'-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][-+]?\d+)?|true|false|null')
+LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+class JSONTokenizer:
+    """Pull tokenizer over a JSON file that only buffers the current token."""
+
+    def __init__(self, fp, chunk_size=CHUNK_SIZE):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self):
+        chunk = self.fp.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def next(self):
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                break
+            if not self.fill():
+                raise ValueError("Unexpected end of JSON input")
+
+        char = self.buffer[self.pos]
+        if char in '{}[]:,':
+            self.pos += 1
+            return char, None
+        if char == '"':
+            return 'string', self.read_string()
+        return 'literal', self.read_literal()
+
+    def read_string(self):
+        # Find the closing quote before decoding, so a long string is scanned
+        # once rather than once per refill
+        scan = self.pos + 1
+        while True:
+            end = self.buffer.find('"', scan)
+            if end == -1:
+                scan = len(self.buffer) - self.pos
+                if not self.fill():
+                    raise ValueError("Unterminated string in JSON input")
+                continue
+            backslashes = 0
+            while self.buffer[end - 1 - backslashes] == '\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                break
+            scan = end + 1
+        value, self.pos = scanstring(self.buffer, self.pos + 1)
+        return value
+
+    def read_literal(self):
+        while True:
+            match = LITERAL.match(self.buffer, self.pos)
+            if match and (match.end() < len(self.buffer) or self.eof):
+                break
+            if not self.fill() and not match:
+                raise ValueError(f"Invalid JSON at: {self.buffer[self.pos:self.pos + 20]!r}")
+        self.pos = match.end()
+        text = match.group()
+        if text in LITERALS:
+            return LITERALS[text]
+        return json.loads(text)
+
+    def expect(self, token):
+        kind, _ = self.next()
+        if kind != token:
+            raise ValueError(f"Expected {token!r} in JSON input, found {kind!r}")
+
+    def skip_value(self):
+        depth = 0
+        while True:
+            kind, _ = self.next()
+            if kind in '{[':
+                depth += 1
+            elif kind in '}]':
+                depth -= 1
+            if depth == 0 and kind not in ':,':
+                return
+
+
+class NodeFrame:
+    def __init__(self, parent_path, key):
+        self.parent_path = parent_path
+        self.name = key
+        self.content = None
+        self.emitted = False
+        self.in_children = False
+
+    @property
+    def path(self):
+        if self.parent_path is None:
+            return self.name
+        return f"{self.parent_path}.{self.name}"
+
+
+def iter_entries(fp):
+    """Yield (path, name, content) for every node of a knowledge.json, in order.
+
+    Parents are yielded before their children. Memory use is bounded by the
+    depth of the tree and the largest single string, not by the file size.
+    """
+    tokens = JSONTokenizer(fp)
+    tokens.expect('{')
+    stack = [NodeFrame(None, None)]
+    while stack:
+        frame = stack[-1]
+        kind, value = tokens.next()
+        if kind == ',':
+            continue
+        if kind == '}':
+            if frame.in_children:
+                frame.in_children = False
+                continue
+            if not frame.emitted:
+                yield frame.path, frame.name, frame.content
+            stack.pop()
+            continue
+        if kind != 'string':
+            raise ValueError(f"Expected a key in JSON input, found {kind!r}")
+        tokens.expect(':')
+        if frame.in_children:
+            tokens.expect('{')
+            stack.append(NodeFrame(frame.path, value))
+        elif value == 'children':
+            if not frame.emitted:
+                yield frame.path, frame.name, frame.content
+                frame.emitted = True
+            tokens.expect('{')
+            frame.in_children = True
+        elif value in ('name', 'content'):
+            kind, item = tokens.next()
+            if kind not in ('string', 'literal'):
+                raise ValueError(f"Expected a string for {value!r} in JSON input")
+            setattr(frame, value, item)
+        else:
+            tokens.skip_value()
+
+
+def load_tree(fp):
+    """Build a KnowledgeNode tree from a knowledge.json without recursion."""
+    root = None
+    nodes = {}
+    for path, name, content in iter_entries(fp):
+        if root is None:
+            root = nodes[path] = KnowledgeNode(name, content)
+            continue
+        parent = nodes.get(path.rsplit('.', 1)[0])
+        if parent is not None:
+            nodes[path] = parent.add_child(name, content)
+    return root
+
+
+def dump_tree(root, fp, content_of=None):
+    """Write a tree exactly as json.dump(root.to_dict(), fp, indent=2) would.
+
+    Nodes are written as they are visited, and content_of lets leaf content
+    be fetched one node at a time instead of being held on the tree.
+    """
+    if content_of is None:
+        content_of = lambda node: node.content
+    write = fp.write
+    dumps = json.dumps
+
+    def open_node(node, depth):
+        pad = ' ' * (4 * depth + 2)
+        write('{\n' + pad + '"name": ' + dumps(node.name) + ',\n'
+              + pad + '"content": ' + dumps(content_of(node)))
+        if node.children:
+            write(',\n' + pad + '"children": {')
+            return True
+        write('\n' + ' ' * (4 * depth) + '}')
+        return False
+
+    stack = []
+    if open_node(root, 0):
+        stack.append([0, iter(root.children.items()), True])
+    while stack:
+        frame = stack[-1]
+        depth, children, first = frame
+        entry = next(children, None)
+        if entry is None:
+            stack.pop()
+            write('\n' + ' ' * (4 * depth + 2) + '}\n' + ' ' * (4 * depth) + '}')
+            continue
+        frame[2] = False
+        name, child = entry
+        write(('\n' if first else ',\n') + ' ' * (4 * depth + 4) + dumps(name) + ': ')
+        if open_node(child, depth + 1):
+            stack.append([depth + 1, iter(child.children.items()), True])
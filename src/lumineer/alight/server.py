@@ -0,0 +1,248 @@
+# src/lumineer/alight/server.py
+import argparse
+import asyncio
+import json
+import sqlite3
+import threading
+from concurrent.futures import Future
+
+from .knowledge import subtree_bounds
+from .search import SearchIndex
+from .store import ContentCache
+
+DEFAULT_ADDRESS = "127.0.0.1:8765"
+RESPONSE_CACHE_SIZE = 8 * 1024 * 1024  # Characters of encoded responses
+MAX_REQUEST = 16 * 1024 * 1024
+STOP_TIMEOUT = 5  # Seconds to wait for the server thread to finish
+CACHED_OPS = ('get', 'children')
+
+
+class RequestError(Exception):
+    pass
+
+
+class ReadConnections(threading.local):
+    """One read-only connection per worker thread."""
+
+    def __init__(self, db_path):
+        self.connection = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True,
+                                          check_same_thread=False)
+        self.index = SearchIndex(self.connection)
+
+
+class KnowledgeServer:
+    """Serves a knowledge.db to local clients over newline-delimited JSON.
+
+    Each request is one JSON object with an "op" and its arguments, and each
+    response is one line with "ok" and a "result" or "error". Reads run on
+    worker threads with their own connections, so many clients can read at
+    once while WAL keeps them off the writer's back. Encoded get and children
+    responses are cached; the cache is dropped whenever PRAGMA data_version
+    shows another connection has committed, so a write from the GUI is
+    visible to the very next request. Writes are handed one at a time to
+    the writer callable, or refused when there is none.
+    """
+
+    def __init__(self, db_path, writer=None, cache_size=RESPONSE_CACHE_SIZE):
+        self.db_path = db_path
+        self.writer = writer
+        self.cache = ContentCache(cache_size)
+        self.readers = None
+        self.probe = None
+        self.version = None
+        self.epoch = 0
+        self.write_lock = None
+        self.server = None
+        # Handler task of each open connection, keyed by its writer
+        self.connections = {}
+
+    async def start(self, address=DEFAULT_ADDRESS):
+        self.readers = ReadConnections(self.db_path)
+        self.probe = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        self.write_lock = asyncio.Lock()
+        if address.startswith("unix:"):
+            self.server = await asyncio.start_unix_server(
+                self.handle, address[5:], limit=MAX_REQUEST)
+        else:
+            host, port = address.rsplit(':', 1)
+            self.server = await asyncio.start_server(
+                self.handle, host, int(port), limit=MAX_REQUEST)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            # Since 3.12 wait_closed also waits for every open connection,
+            # so idle clients are hung up on first
+            tasks = list(self.connections.values())
+            for writer, task in list(self.connections.items()):
+                writer.close()
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self.server.wait_closed()
+        if self.probe is not None:
+            self.probe.close()
+
+    def check_version(self):
+        version = self.probe.execute("PRAGMA data_version").fetchone()[0]
+        if version != self.version:
+            self.version = version
+            self.epoch += 1
+            self.cache.clear()
+
+    async def handle(self, reader, writer):
+        self.connections[writer] = asyncio.current_task()
+        try:
+            while line := await reader.readline():
+                writer.write(await self.respond(line) + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            pass  # Hung up on by close(); end quietly rather than as cancelled
+        finally:
+            del self.connections[writer]
+            writer.close()
+
+    async def respond(self, line):
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise RequestError("Requests must be JSON objects")
+            op = request.get("op")
+            path = request.get("path", "alight")
+            if not isinstance(op, str) or not isinstance(path, str):
+                raise RequestError('"op" and "path" must be strings')
+            if op in ('put', 'delete'):
+                result = await self.write(request)
+            else:
+                key = (op, path)
+                self.check_version()
+                if op in CACHED_OPS:
+                    cached = self.cache.get(key)
+                    if cached is not None:
+                        return cached.encode("utf-8")
+                epoch = self.epoch
+                result = await asyncio.to_thread(self.read, op, request)
+                encoded = json.dumps({"ok": True, "result": result})
+                # Drop results that raced with a commit
+                if op in CACHED_OPS and epoch == self.epoch:
+                    self.cache.put(key, encoded)
+                return encoded.encode("utf-8")
+            return json.dumps({"ok": True, "result": result}).encode("utf-8")
+        except (RequestError, ValueError, KeyError, AttributeError, sqlite3.Error) as e:
+            return json.dumps({"ok": False, "error": str(e)}).encode("utf-8")
+
+    async def write(self, request):
+        if self.writer is None:
+            raise RequestError("This server is read-only")
+        # One write at a time, in arrival order
+        async with self.write_lock:
+            try:
+                return await asyncio.wrap_future(self.writer(request))
+            except (RequestError, asyncio.CancelledError):
+                raise
+            except Exception as e:
+                raise RequestError(f"Write failed: {e}") from e
+
+    def read(self, op, request):
+        db = self.readers.connection
+        path = request.get("path", "alight")
+        if op == 'get':
+            row = db.execute("""
+                SELECT nodes.leaf, contents.body FROM nodes
+                LEFT JOIN contents ON contents.node_id = nodes.id
+                WHERE nodes.path = ?""", (path,)).fetchone()
+            if row is None:
+                if path != "alight":
+                    raise RequestError(f"Path not found: {path}")
+                row = (0, None)  # The root has no row of its own
+            return {"path": path, "leaf": bool(row[0]), "content": row[1]}
+        if op == 'children':
+            return [{"name": name, "leaf": bool(leaf)} for name, leaf in db.execute("""
+                SELECT name, leaf FROM nodes
+                WHERE depth = ? AND path >= ? AND path < ? ORDER BY id""",
+                (path.count('.') + 1, *subtree_bounds(path)))]
+        if op == 'search':
+            query = request.get("query", "")
+            limit = request.get("limit", 50)
+            if not isinstance(query, str):
+                raise RequestError('"query" must be a string')
+            if not isinstance(limit, int) or isinstance(limit, bool) or limit < 0:
+                raise RequestError('"limit" must be a non-negative integer')
+            return [{"path": found, "snippet": snippet} for found, snippet
+                    in self.readers.index.search(query, limit)]
+        if op == 'export':
+            # Parents come before children, as in creation order
+            return [[node_path, bool(leaf), body] for node_path, leaf, body in db.execute("""
+                SELECT nodes.path, nodes.leaf, contents.body FROM nodes
+                LEFT JOIN contents ON contents.node_id = nodes.id
+                WHERE nodes.path = ? OR (nodes.path >= ? AND nodes.path < ?)
+                ORDER BY nodes.id""", (path, *subtree_bounds(path)))]
+        raise RequestError(f"Unknown op: {op}")
+
+
+def apply_write(knowledge_base, request):
+    """Carry out a put or delete request against a KnowledgeBase."""
+    path = request.get("path", "")
+    if not path.startswith("alight.") or not all(path.split('.')):
+        raise RequestError(f"Invalid path: {path}")
+    content = request.get("content")
+    if content is not None and not isinstance(content, str):
+        raise RequestError('"content" must be a string or null')
+    if request["op"] == 'delete':
+        if knowledge_base.get(path) is None:
+            raise RequestError(f"Path not found: {path}")
+        knowledge_base.delete(path)
+    elif knowledge_base.get(path) is None:
+        knowledge_base.create(path, content)
+    else:
+        knowledge_base.update(path, content)
+    return {"path": path}
+
+
+class ServerThread(threading.Thread):
+    """Runs a KnowledgeServer on its own event loop beside the GUI."""
+
+    def __init__(self, server, address=DEFAULT_ADDRESS):
+        super().__init__(daemon=True)
+        self.server = server
+        self.address = address
+        self.loop = asyncio.new_event_loop()
+        self.started = Future()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.server.start(self.address))
+        except Exception as e:
+            self.started.set_exception(e)
+            return
+        self.started.set_result(True)
+        self.loop.run_forever()
+        self.loop.run_until_complete(self.server.close())
+        self.loop.close()
+
+    def stop(self):
+        if self.loop.is_running():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        self.join(STOP_TIMEOUT)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve an Alight knowledge.db read-only.")
+    parser.add_argument("db_path")
+    parser.add_argument("--address", default=DEFAULT_ADDRESS,
+                        help="host:port, or unix:/path/to/socket")
+    args = parser.parse_args()
+
+    async def serve():
+        server = KnowledgeServer(args.db_path)
+        async with await server.start(args.address):
+            await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+if __name__ == '__main__':
+    main()
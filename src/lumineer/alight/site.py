@@ -0,0 +1,125 @@
+# src/lumineer/alight/site.py
+import html
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import markdown
+
+from .links import WikiLinkExtension
+
+MANIFEST_NAME = "manifest.json"
+INDEX_NAME = "index.html"
+PARALLEL_THRESHOLD = 64  # Fewer pages than this are rendered in-process
+RENDER_CHUNK = 64
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+</head>
+<body>
+<nav>{breadcrumb}</nav>
+<main>
+{body}
+</main>
+{children}
+</body>
+</html>
+"""
+
+_markdown = None
+
+
+def page_name(path):
+    # The root's page is the site's front page
+    return INDEX_NAME if '.' not in path else path + ".html"
+
+
+def link(path, label):
+    return f'<a href="{html.escape(page_name(path))}">{html.escape(label)}</a>'
+
+
+def render_page(job):
+    """Write the page for one node. Runs in a worker process for big exports."""
+    global _markdown
+    if _markdown is None:
+        # One converter per process, reset between pages. Links go through
+        # page_name so they reach the root's index page too
+        _markdown = markdown.Markdown(extensions=[WikiLinkExtension(build_url=page_name)])
+    out_dir, path, content, children = job
+    parts = path.split('.')
+    crumbs = [link('.'.join(parts[:i]), parts[i - 1]) for i in range(1, len(parts))]
+    crumbs.append(html.escape(parts[-1]))
+    body = _markdown.reset().convert(content) if content else ""
+    listing = ""
+    if children:
+        listing = "<ul>" + "".join(f"<li>{link(f'{path}.{name}', name)}</li>"
+                                   for name in children) + "</ul>"
+    page = PAGE_TEMPLATE.format(title=html.escape(path), breadcrumb=" / ".join(crumbs),
+                                body=body, children=listing)
+    with open(os.path.join(out_dir, page_name(path)), "w", encoding="utf-8") as f:
+        f.write(page)
+
+
+def export_site(history, root, out_dir, workers=None):
+    """Publish the knowledge base as static HTML, rebuilding only what changed.
+
+    Every node gets a page with its rendered content and links to its
+    children. The manifest records the root digest of the last export, and
+    since history keeps every tree object, the old tree is diffed against
+    the current one: subtrees with the same digest are skipped unvisited,
+    and children that disappeared have their pages deleted. Returns the
+    number of pages written.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    try:
+        with open(manifest_path, "r") as f:
+            old_root = json.load(f)["root"]
+        history.load(old_root)
+    except (FileNotFoundError, ValueError, KeyError):
+        old_root = None  # Nothing usable to diff against; export everything
+    if old_root == root.digest:
+        return 0
+
+    jobs = []
+    stale = []
+    stack = [(root.name, root, old_root)]
+    while stack:
+        path, node, old = stack.pop()
+        if old == node.digest:
+            continue
+        content_digest, _ = history.load(node.digest)
+        jobs.append((out_dir, path, history.blob(content_digest), list(node.children)))
+        old_children = dict(history.load(old)[1]) if old is not None else {}
+        for name, child in node.children.items():
+            stack.append((f"{path}.{name}", child, old_children.pop(name, None)))
+        # Whatever is left was removed or renamed away
+        gone = [(f"{path}.{name}", digest) for name, digest in old_children.items()]
+        while gone:
+            gone_path, digest = gone.pop()
+            stale.append(gone_path)
+            gone.extend((f"{gone_path}.{name}", child)
+                        for name, child in history.load(digest)[1])
+
+    if len(jobs) < PARALLEL_THRESHOLD:
+        for job in jobs:
+            render_page(job)
+    else:
+        # Forking a process that runs Qt, render and server threads can copy
+        # locks those threads hold, so the workers start fresh
+        with ProcessPoolExecutor(max_workers=workers,
+                                 mp_context=multiprocessing.get_context("spawn")) as pool:
+            list(pool.map(render_page, jobs, chunksize=RENDER_CHUNK))
+    for path in stale:
+        try:
+            os.remove(os.path.join(out_dir, page_name(path)))
+        except FileNotFoundError:
+            pass
+
+    with open(manifest_path, "w") as f:
+        json.dump({"root": root.digest}, f)
+    return len(jobs)
@@ -0,0 +1,79 @@
+# src/lumineer/alight/stats.py
+import time
+
+from .knowledge import KnowledgeListener
+
+
+class SubtreeStats(KnowledgeListener):
+    """Keeps each node's leaf count, content size and last change current.
+
+    Every event adjusts the changed node and walks its ancestor chain once,
+    adding the difference in leaves and size and raising the modification
+    time, so nothing is ever recounted by traversal. Removals and renames
+    count as changes to the parent.
+    """
+
+    @staticmethod
+    def aggregate(root):
+        """Fold each node's own size and time into its ancestors after loading."""
+        order = []
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+        # Children are folded in before their parent is folded into its own
+        for node in reversed(order):
+            parent = node.parent
+            if parent is not None:
+                parent.leaves += node.leaves
+                parent.size += node.size
+                parent.modified = max(parent.modified, node.modified)
+
+    def propagate(self, node, leaves, size, now):
+        while node is not None:
+            node.leaves += leaves
+            node.size += size
+            node.modified = max(node.modified, now)
+            node = node.parent
+
+    @staticmethod
+    def count(node, content):
+        node.content_size = len(content) if content is not None else None
+        node.leaves = int(content is not None)
+        node.size = node.content_size or 0
+
+    def node_inserted(self, node, content):
+        now = time.time()
+        self.count(node, content)
+        node.modified = now
+        self.propagate(node.parent, node.leaves, node.size, now)
+
+    def nodes_inserted(self, entries):
+        now = time.time()
+        new = set()
+        for node, content in entries:
+            self.count(node, content)
+            node.modified = now
+            new.add(node)
+        # Entries come parents first, so walking back folds each child into
+        # a new parent before that parent is passed up to existing nodes
+        for node, _ in reversed(entries):
+            if node.parent in new:
+                node.parent.leaves += node.leaves
+                node.parent.size += node.size
+            else:
+                self.propagate(node.parent, node.leaves, node.size, now)
+
+    def content_changed(self, node, content):
+        old_leaves = int(node.content_size is not None)
+        old_size = node.content_size or 0
+        node.content_size = len(content) if content is not None else None
+        self.propagate(node, int(content is not None) - old_leaves,
+                       (node.content_size or 0) - old_size, time.time())
+
+    def node_renamed(self, node, old_name):
+        self.propagate(node, 0, 0, time.time())
+
+    def node_removed(self, parent, node):
+        self.propagate(parent, -node.leaves, -node.size, time.time())
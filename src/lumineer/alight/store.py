@@ -0,0 +1,310 @@
+# src/lumineer/alight/store.py
+import sqlite3
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from .knowledge import KnowledgeListener, KnowledgeNode, subtree_bounds
+from .history import History
+from .links import LinkIndex
+from .search import SearchIndex
+from .serial import dump_tree, iter_entries
+from .stats import SubtreeStats
+
+SCHEMA_VERSION = 1
+CACHE_SIZE = 4 * 1024 * 1024  # Characters of leaf content kept in memory
+IMPORT_BATCH = 1000
+
+
+class ContentCache:
+    """Least-recently-used leaf content, bounded by total size."""
+
+    def __init__(self, max_size=CACHE_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self.entries = OrderedDict()
+
+    def get(self, node):
+        content = self.entries.get(node)
+        if content is not None:
+            self.entries.move_to_end(node)
+        return content
+
+    def put(self, node, content):
+        self.discard(node)
+        if content is None or len(content) > self.max_size:
+            return
+        self.entries[node] = content
+        self.size += len(content)
+        while self.size > self.max_size:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def discard(self, node):
+        content = self.entries.pop(node, None)
+        if content is not None:
+            self.size -= len(content)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+
+
+class KnowledgeStore(KnowledgeListener):
+    """SQLite-backed persistence for a KnowledgeBase.
+
+    Nodes are keyed by their materialized dotted path, so each change event
+    touches only the rows it affects and a subtree rename is a single prefix
+    update. Leaf content lives in its own table, keyed by node id, and is
+    read on demand through a ContentCache. The full-text SearchIndex and the
+    LinkIndex of wiki-links are updated in the same transaction as every
+    write.
+    """
+
+    def __init__(self, db_path, cache_size=CACHE_SIZE):
+        self.db_path = db_path
+        self.cache = ContentCache(cache_size)
+        self.connection = sqlite3.connect(db_path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.index = SearchIndex(self.connection)
+        self.links = LinkIndex(self.connection)
+        self.depth = 0
+
+    @contextmanager
+    def transaction(self):
+        # Nested blocks join the outermost transaction
+        if self.depth == 0:
+            self.connection.execute("BEGIN")
+        self.depth += 1
+        try:
+            yield self.connection
+        except BaseException:
+            self.depth -= 1
+            if self.depth == 0:
+                self.connection.execute("ROLLBACK")
+            raise
+        else:
+            self.depth -= 1
+            if self.depth == 0:
+                self.connection.execute("COMMIT")
+
+    def migrate(self, json_path=None):
+        """Create the schema, importing an existing knowledge.json once."""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return False
+        imported = False
+        with self.transaction() as db:
+            # depth lets direct children be found with one index range
+            db.execute("""
+                CREATE TABLE nodes (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    leaf INTEGER NOT NULL DEFAULT 0,
+                    digest TEXT,
+                    size INTEGER NOT NULL DEFAULT 0,
+                    modified REAL NOT NULL DEFAULT 0,
+                    depth INTEGER GENERATED ALWAYS
+                        AS (length(path) - length(replace(path, '.', ''))) VIRTUAL
+                )""")
+            db.execute("CREATE INDEX nodes_depth ON nodes (depth, path)")
+            db.execute("""
+                CREATE TABLE contents (
+                    node_id INTEGER PRIMARY KEY,
+                    body TEXT NOT NULL
+                )""")
+            if json_path is not None:
+                imported = self.import_json(json_path)
+            SearchIndex.create(db)
+            # Seed the history with the current tree as its first snapshot
+            History.create(db)
+            History(self).rebuild(self.load_skeleton())
+            LinkIndex.create(db)
+            db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        return imported
+
+    def close(self):
+        self.connection.close()
+
+    def load_skeleton(self):
+        root = KnowledgeNode("alight")
+        row = self.connection.execute(
+            "SELECT root FROM snapshots ORDER BY id DESC LIMIT 1").fetchone()
+        root.digest = row[0] if row else None
+        nodes = {root.name: root}
+        # Ids increase in creation order, so parents come before children
+        for path, leaf, digest, size, modified in self.connection.execute(
+                "SELECT path, leaf, digest, size, modified FROM nodes ORDER BY id"):
+            parent_path, name = path.rsplit('.', 1)
+            parent = nodes.get(parent_path)
+            if parent is not None:
+                nodes[path] = node = parent.add_child(name, is_leaf=bool(leaf))
+                node.digest = digest
+                node.size = size
+                node.content_size = size if leaf else None
+                node.modified = modified
+        SubtreeStats.aggregate(root)
+        return root
+
+    def get_content(self, node):
+        content = self.cache.get(node)
+        if content is None:
+            content = self.read_content(node.path)
+            self.cache.put(node, content)
+        return content
+
+    def read_content(self, path):
+        row = self.connection.execute("""
+            SELECT body FROM contents
+            WHERE node_id = (SELECT id FROM nodes WHERE path = ?)""",
+            (path,)).fetchone()
+        return row[0] if row else ""
+
+    def write_content(self, db, path, content):
+        if content is None:
+            db.execute("""
+                DELETE FROM contents
+                WHERE node_id = (SELECT id FROM nodes WHERE path = ?)""", (path,))
+        else:
+            db.execute("""
+                INSERT OR REPLACE INTO contents (node_id, body)
+                SELECT id, ? FROM nodes WHERE path = ?""", (content, path))
+
+    def touch(self, db, path, now):
+        # A change below a node is a change to its subtree, so each row's
+        # time is already the latest within it
+        parts = path.split('.')
+        db.executemany("UPDATE nodes SET modified = ? WHERE path = ?",
+                       [(now, '.'.join(parts[:i])) for i in range(2, len(parts) + 1)])
+
+    def node_inserted(self, node, content):
+        path = node.path
+        now = time.time()
+        with self.transaction() as db:
+            db.execute("""
+                INSERT INTO nodes (path, name, leaf, size, modified)
+                VALUES (?, ?, ?, ?, ?)""",
+                (path, node.name, content is not None,
+                 len(content) if content is not None else 0, now))
+            self.touch(db, node.parent.path, now)
+            self.write_content(db, path, content)
+            self.index.add(db, path)
+            self.links.update(db, path, content)
+        self.cache.put(node, content)
+
+    def nodes_inserted(self, entries):
+        rows = []
+        contents = []
+        now = time.time()
+        for node, content in entries:
+            path = node.path
+            rows.append((path, node.name, content is not None,
+                         len(content) if content is not None else 0, now))
+            if content is not None:
+                contents.append((content, path))
+        new = {node for node, _ in entries}
+        joins = {node.parent for node, _ in entries if node.parent not in new}
+        # Rows are written in bulk and the cache is left to fill on demand
+        with self.transaction() as db:
+            db.executemany("""
+                INSERT INTO nodes (path, name, leaf, size, modified)
+                VALUES (?, ?, ?, ?, ?)""", rows)
+            for parent in joins:
+                self.touch(db, parent.path, now)
+            db.executemany("""
+                INSERT INTO contents (node_id, body)
+                SELECT id, ? FROM nodes WHERE path = ?""", contents)
+            self.index.add_many(db, [row[0] for row in rows])
+            for content, path in contents:
+                if '[[' in content:
+                    self.links.update(db, path, content)
+
+    def content_changed(self, node, content):
+        path = node.path
+        with self.transaction() as db:
+            self.index.remove(db, path)
+            db.execute("UPDATE nodes SET leaf = ?, size = ? WHERE path = ?",
+                       (content is not None,
+                        len(content) if content is not None else 0, path))
+            self.touch(db, path, time.time())
+            self.write_content(db, path, content)
+            self.index.add(db, path)
+            self.links.update(db, path, content)
+        self.cache.put(node, content)
+
+    def node_renamed(self, node, old_name):
+        old_path = f"{node.parent.path}.{old_name}"
+        low, high = subtree_bounds(old_path)
+        new_path = node.path
+        with self.transaction() as db:
+            # Only the renamed node's own name is indexed, so descendants
+            # keep their postings
+            self.index.remove(db, old_path)
+            db.execute("""
+                UPDATE nodes SET path = ? || substr(path, ?)
+                WHERE path = ? OR (path >= ? AND path < ?)""",
+                (new_path, len(old_path) + 1, old_path, low, high))
+            db.execute("UPDATE nodes SET name = ? WHERE path = ?",
+                       (node.name, new_path))
+            self.touch(db, new_path, time.time())
+            self.index.add(db, new_path)
+
+    def node_removed(self, parent, node):
+        path = f"{parent.path}.{node.name}"
+        low, high = subtree_bounds(path)
+        with self.transaction() as db:
+            self.index.remove_subtree(db, path, low, high)
+            self.links.remove_subtree(db, path, low, high)
+            db.execute("""
+                DELETE FROM contents WHERE node_id IN (
+                    SELECT id FROM nodes
+                    WHERE path = ? OR (path >= ? AND path < ?))""",
+                (path, low, high))
+            db.execute("DELETE FROM nodes WHERE path = ? OR (path >= ? AND path < ?)",
+                       (path, low, high))
+            self.touch(db, parent.path, time.time())
+        self.cache.discard(node)
+
+    def import_json(self, json_path):
+        try:
+            f = open(json_path, "r")
+        except FileNotFoundError:
+            return False
+
+        def flush(db, rows, contents):
+            db.executemany("""
+                INSERT INTO nodes (path, name, leaf, size, modified)
+                VALUES (?, ?, ?, ?, ?)""", rows)
+            db.executemany("""
+                INSERT INTO contents (node_id, body)
+                SELECT id, ? FROM nodes WHERE path = ?""", contents)
+            rows.clear()
+            contents.clear()
+
+        # Stream entries into the database in batches rather than loading
+        # the whole file
+        with f, self.transaction() as db:
+            rows = []
+            contents = []
+            now = time.time()
+            entries = iter_entries(f)
+            next(entries)  # The root is implicit in the store
+            for path, name, content in entries:
+                rows.append((path, name, content is not None,
+                             len(content) if content is not None else 0, now))
+                if content is not None:
+                    contents.append((content, path))
+                if len(rows) >= IMPORT_BATCH:
+                    flush(db, rows, contents)
+            flush(db, rows, contents)
+        return True
+
+    def export_json(self, json_path):
+        # Only the skeleton is held in memory; each leaf is read as it is
+        # written, bypassing the cache
+        root = self.load_skeleton()
+        with open(json_path, "w") as f:
+            dump_tree(root, f, lambda node: (self.read_content(node.path)
+                                             if node.is_leaf else None))
@@ -0,0 +1,397 @@
+# `src/lumineer/scholar/grades.py`
+import heapq
+from array import array
+from bisect import bisect_right
+
+# Lowest percentage for each letter, from the bottom of the scale up
+LETTER_SCALE = (
+    (59.5, "D-"),
+    (62.5, "D"),
+    (66.5, "D+"),
+    (69.5, "C-"),
+    (72.5, "C"),
+    (76.5, "C+"),
+    (79.5, "B-"),
+    (82.5, "B"),
+    (86.5, "B+"),
+    (89.5, "A-"),
+    (92.5, "A"),
+)
+FAILING_GRADE = "F"
+EPSILON = 1e-9  # Running sums may drift this far from an exact zero
+UNCATEGORIZED = -1  # Category index of rows the policy does not weigh
+SOLVER_STEPS = 30  # Bisection steps, enough for far finer than 0.01%
+
+
+def letter_grade(percentage, scale=LETTER_SCALE):
+    position = bisect_right([cutoff for cutoff, _ in scale], percentage)
+    return scale[position - 1][1] if position else FAILING_GRADE
+
+
+def points(value):
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def is_graded(value):
+    # A blank score means the assignment has not been graded yet
+    return value is not None and value != ""
+
+
+def is_extra_credit(assignment, possible):
+    # Points earned with nothing possible can only add to a grade
+    return bool(assignment.get("extra_credit")) or possible <= 0
+
+
+class GradingPolicy:
+    """How one course turns assignments into a grade.
+
+    categories maps a category name to its weight and how many of its
+    lowest-scoring assignments are dropped. Without categories every
+    assignment counts by points, as a single category. scale is a list of
+    (lowest percentage, letter) pairs.
+    """
+
+    def __init__(self, categories=None, scale=LETTER_SCALE):
+        self.categories = dict(categories or {})
+        self.scale = tuple(sorted((float(cutoff), letter) for cutoff, letter in scale))
+
+    @classmethod
+    def from_dict(cls, data):
+        categories = {
+            name: {
+                "weight": float(category.get("weight", 0)),
+                "drop_lowest": int(category.get("drop_lowest", 0)),
+            }
+            for name, category in data.get("categories", {}).items()
+        }
+        return cls(categories, data.get("scale", LETTER_SCALE))
+
+    def to_dict(self):
+        return {
+            "categories": self.categories,
+            "scale": [[cutoff, letter] for cutoff, letter in self.scale],
+        }
+
+
+class GradebookEngine:
+    """Grade results for one gradebook, kept current one edit at a time.
+
+    Points and per-row percentages live in parallel arrays beside the
+    gradebook's assignment dicts, and the raw totals and each category's
+    totals are running sums, so an edit adjusts one row and the sums by
+    its difference instead of re-reading every assignment. Only categories
+    that drop their lowest scores need a second look after an edit, and
+    that is a partial selection over the one category.
+    """
+
+    def __init__(self, assignments, policy=None):
+        self.assignments = assignments
+        self.policy = policy or GradingPolicy()
+        self.scale = self.policy.scale
+        names = list(self.policy.categories) or [""]
+        self.category_names = {name: index for index, name in enumerate(names)}
+        if self.policy.categories:
+            categories = self.policy.categories.values()
+            self.weights = array('d', (category["weight"] for category in categories))
+            self.drops = array('i', (category["drop_lowest"] for category in categories))
+        else:
+            self.weights = array('d', [1.0])
+            self.drops = array('i', [0])
+        self.possible = array('d', (points(a.get("points_possible")) for a in assignments))
+        self.actual = array('d', (points(a.get("points_actual")) for a in assignments))
+        self.percent = array('d', map(self.row_percentage, self.possible, self.actual))
+        self.extra = array('b', map(is_extra_credit, assignments, self.possible))
+        self.graded = array('b', (is_graded(a.get("points_actual", 0)) for a in assignments))
+        self.category = array('i', (self.category_of(a.get("category", ""))
+                                    for a in assignments))
+        self.build()
+
+    def __len__(self):
+        return len(self.assignments)
+
+    @staticmethod
+    def row_percentage(possible, actual):
+        return actual / possible * 100 if possible > 0 else 0.0
+
+    def category_of(self, name):
+        if not self.policy.categories:
+            return 0
+        return self.category_names.get(name, UNCATEGORIZED)
+
+    def counted_possible(self, row):
+        # Extra credit adds earned points without raising what is possible,
+        # and ungraded work does not count until it is graded
+        return 0.0 if self.extra[row] or not self.graded[row] else self.possible[row]
+
+    def build(self):
+        count = len(self.weights)
+        self.total_possible = sum(self.possible)
+        self.total_actual = sum(self.actual)
+        self.category_possible = array('d', bytes(8 * count))
+        self.category_actual = array('d', bytes(8 * count))
+        self.category_rows = [[] for _ in range(count)]
+        # Rows whose category the policy does not weigh count toward nothing
+        self.uncategorized = 0
+        for row, category in enumerate(self.category):
+            if category == UNCATEGORIZED:
+                self.uncategorized += 1
+            else:
+                self.category_possible[category] += self.counted_possible(row)
+                self.category_actual[category] += self.actual[row]
+                self.category_rows[category].append(row)
+        self.kept = {}  # Totals after drops, per dropping category
+
+    def add_to_category(self, row, sign):
+        category = self.category[row]
+        if category != UNCATEGORIZED:
+            self.category_possible[category] += sign * self.counted_possible(row)
+            self.category_actual[category] += sign * self.actual[row]
+            self.kept.pop(category, None)
+
+    def update(self, row, name, points_possible, points_actual, category=None):
+        """Apply an edit to one assignment; return True if the grade may have changed.
+
+        points_actual is None for an assignment that is not graded yet.
+        """
+        assignment = self.assignments[row]
+        assignment["name"] = name
+        assignment["points_possible"] = points_possible
+        assignment["points_actual"] = points_actual
+        index = self.category[row]
+        if category is not None:
+            if category:
+                assignment["category"] = category
+            else:
+                assignment.pop("category", None)
+            index = self.category_of(category)
+        graded = points_actual is not None
+        points_actual = points_actual if graded else 0.0
+        if (points_possible == self.possible[row] and points_actual == self.actual[row]
+                and index == self.category[row] and graded == self.graded[row]):
+            return False
+        self.add_to_category(row, -1)
+        if index != self.category[row]:
+            if self.category[row] != UNCATEGORIZED:
+                self.category_rows[self.category[row]].remove(row)
+            else:
+                self.uncategorized -= 1
+            if index != UNCATEGORIZED:
+                self.category_rows[index].append(row)
+            else:
+                self.uncategorized += 1
+            self.category[row] = index
+        self.total_possible += points_possible - self.possible[row]
+        self.total_actual += points_actual - self.actual[row]
+        self.possible[row] = points_possible
+        self.actual[row] = points_actual
+        self.percent[row] = self.row_percentage(points_possible, points_actual)
+        self.extra[row] = is_extra_credit(assignment, points_possible)
+        self.graded[row] = graded
+        self.add_to_category(row, 1)
+        if "grade_percent" in assignment:
+            assignment["grade_percent"] = self.percent[row]
+        return True
+
+    def append(self, assignment):
+        self.assignments.append(assignment)
+        possible = points(assignment.get("points_possible"))
+        actual = points(assignment.get("points_actual"))
+        self.possible.append(possible)
+        self.actual.append(actual)
+        self.percent.append(self.row_percentage(possible, actual))
+        self.extra.append(is_extra_credit(assignment, possible))
+        self.graded.append(is_graded(assignment.get("points_actual", 0)))
+        self.category.append(self.category_of(assignment.get("category", "")))
+        row = len(self.assignments) - 1
+        self.total_possible += possible
+        self.total_actual += actual
+        if self.category[row] != UNCATEGORIZED:
+            self.category_rows[self.category[row]].append(row)
+        else:
+            self.uncategorized += 1
+        self.add_to_category(row, 1)
+
+    def remove(self, row):
+        del self.assignments[row]
+        for column in (self.possible, self.actual, self.percent, self.extra,
+                       self.graded, self.category):
+            del column[row]
+        # Later rows shift up, so the per-category row lists are rebuilt
+        self.build()
+
+    def dropped(self, category):
+        """Return the rows a category drops: its lowest percentages, always
+        leaving at least one graded assignment."""
+        candidates = [row for row in self.category_rows[category]
+                      if self.counted_possible(row) > 0]
+        count = min(self.drops[category], len(candidates) - 1)
+        if count <= 0:
+            return []
+        # Ties go to the earlier row, so the same scores always drop the same way
+        return heapq.nsmallest(count, candidates, key=lambda row: (self.percent[row], row))
+
+    def category_totals(self, category):
+        if self.drops[category] <= 0:
+            return self.category_possible[category], self.category_actual[category]
+        totals = self.kept.get(category)
+        if totals is None:
+            dropped = self.dropped(category)
+            totals = (
+                self.category_possible[category] - sum(self.possible[row] for row in dropped),
+                self.category_actual[category] - sum(self.actual[row] for row in dropped),
+            )
+            self.kept[category] = totals
+        return totals
+
+    def ungraded(self):
+        return [row for row, graded in enumerate(self.graded) if not graded]
+
+    def letter(self, row):
+        return letter_grade(self.percent[row], self.scale)
+
+    def category_percentages(self):
+        """Return (name, weight, percentage or None) for each category."""
+        result = []
+        for name, index in self.category_names.items():
+            possible, actual = self.category_totals(index)
+            percentage = actual / possible * 100 if possible > EPSILON else None
+            result.append((name, self.weights[index], percentage))
+        return result
+
+    def overall_percentage(self):
+        """Return the weighted overall percentage, or None with nothing graded yet.
+
+        Categories with nothing graded yet are left out and the remaining
+        weights scaled up, which gives the grade standing so far.
+        """
+        score = 0.0
+        weight = 0.0
+        for index in range(len(self.weights)):
+            possible, actual = self.category_totals(index)
+            if possible > EPSILON:
+                score += self.weights[index] * actual / possible
+                weight += self.weights[index]
+        if weight <= EPSILON:
+            return None
+        return score / weight * 100
+
+
+class Projection:
+    """What the ungraded assignments of a gradebook can still do to its grade.
+
+    Every ungraded assignment is assumed to earn the same fraction of its
+    points. The rows are grouped by category once, and the graded scores a
+    category could drop are sorted once, so trying a fraction costs one
+    pass over the categories plus a short merge in the dropping ones.
+
+    The grade rises with the fraction except where the ungraded work
+    overtakes a graded score a category could drop, since which one is
+    dropped then flips. Those scores split [0, 1] into intervals over
+    which the grade only rises, so the solver checks the intervals in
+    order and bisects inside the first one that reaches the target.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.rows = engine.ungraded()
+        count = len(engine.weights)
+        self.possible = array('d', bytes(8 * count))  # Counted once graded
+        self.points = array('d', bytes(8 * count))  # Earned at a fraction of 1
+        self.candidates = {}
+        for row in self.rows:
+            category = engine.category[row]
+            if category == UNCATEGORIZED:
+                continue
+            self.points[category] += engine.possible[row]
+            if not engine.extra[row]:
+                self.possible[category] += engine.possible[row]
+        for category in range(count):
+            if engine.drops[category] > 0:
+                graded = sorted(
+                    (engine.percent[row], row, engine.possible[row], engine.actual[row])
+                    for row in engine.category_rows[category]
+                    if engine.counted_possible(row) > 0
+                )
+                remaining = [
+                    (row, engine.possible[row])
+                    for row in engine.category_rows[category]
+                    if not engine.graded[row] and not engine.extra[row]
+                ]
+                self.candidates[category] = (graded, remaining)
+        self.breakpoints = sorted({
+            graded_percent / 100
+            for graded, remaining in self.candidates.values() if remaining
+            for graded_percent, _, _, _ in graded
+            if 0 < graded_percent < 100
+        })
+
+    def dropped_totals(self, category, fraction):
+        graded, remaining = self.candidates[category]
+        count = min(self.engine.drops[category], len(graded) + len(remaining) - 1)
+        percent = fraction * 100
+        possible = actual = 0.0
+        i = j = 0
+        # Merge the two sorted runs, taking the lowest scores first
+        for _ in range(max(count, 0)):
+            if j == len(remaining) or (
+                i < len(graded) and graded[i][:2] < (percent, remaining[j][0])
+            ):
+                possible += graded[i][2]
+                actual += graded[i][3]
+                i += 1
+            else:
+                possible += remaining[j][1]
+                actual += fraction * remaining[j][1]
+                j += 1
+        return possible, actual
+
+    def percentage(self, fraction):
+        """Return the final percentage if every ungraded assignment earned
+        fraction of its points, or None if nothing would be graded."""
+        engine = self.engine
+        score = 0.0
+        weight = 0.0
+        for category in range(len(engine.weights)):
+            possible = engine.category_possible[category] + self.possible[category]
+            actual = engine.category_actual[category] + fraction * self.points[category]
+            if category in self.candidates:
+                dropped_possible, dropped_actual = self.dropped_totals(category, fraction)
+                possible -= dropped_possible
+                actual -= dropped_actual
+            if possible > EPSILON:
+                score += engine.weights[category] * actual / possible
+                weight += engine.weights[category]
+        if weight <= EPSILON:
+            return None
+        return score / weight * 100
+
+    def outcome_range(self):
+        """Return the final percentages with every ungraded assignment at
+        zero and at full marks."""
+        return self.percentage(0.0), self.percentage(1.0)
+
+    def required_fraction(self, target):
+        """Return the lowest fraction of its points every ungraded
+        assignment must earn to finish at target percent or above: 0.0 if
+        the grade is already secured, None if it is out of reach."""
+        def reaches(fraction):
+            percentage = self.percentage(fraction)
+            return percentage is not None and percentage >= target
+
+        if reaches(0.0):
+            return 0.0
+        low = 0.0
+        for high in (*self.breakpoints, 1.0):
+            if reaches(high):
+                for _ in range(SOLVER_STEPS):
+                    middle = (low + high) / 2
+                    if reaches(middle):
+                        high = middle
+                    else:
+                        low = middle
+                return high
+            low = high
+        return None
@@ -0,0 +1,161 @@
+# `src/lumineer/scholar/ics.py`
+import re
+from datetime import date, datetime, timedelta, timezone
+from itertools import chain
+
+from .meetings import parse_meeting
+
+PRODUCT_ID = "-//Lumineer//Scholar//EN"
+BYDAY = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+LINE_LIMIT = 75  # Octets per line before folding (RFC 5545, 3.1)
+# Rough term dates, as a starting point for the export dialog
+TERM_DATES = {
+    "spring": ((1, 15), (5, 10)),
+    "summer": ((5, 20), (8, 10)),
+    "fall": ((8, 25), (12, 15)),
+    "autumn": ((8, 25), (12, 15)),
+    "winter": ((1, 2), (1, 24)),
+}
+TERM_PATTERN = re.compile(
+    r"(spring|summer|fall|autumn|winter)\D*(\d{4})"
+    r"|(\d{4})\D*(spring|summer|fall|autumn|winter)"
+)
+
+
+def guess_semester_dates(semester):
+    """Return (first day, last day) for names such as "Fall 2024", or None."""
+    match = TERM_PATTERN.search(semester.lower())
+    if match is None:
+        return None
+    term = match.group(1) or match.group(4)
+    year = int(match.group(2) or match.group(3))
+    (first_month, first_day), (last_month, last_day) = TERM_DATES[term]
+    return date(year, first_month, first_day), date(year, last_month, last_day)
+
+
+def escape(text):
+    return (
+        str(text)
+        .replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line):
+    """Split a content line into CRLF-space continued pieces of at most 75
+    octets, never inside a UTF-8 sequence."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= LINE_LIMIT:
+        return line
+    pieces = []
+    start = 0
+    limit = LINE_LIMIT
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        pieces.append(encoded[start:end].decode("utf-8"))
+        start = end
+        limit = LINE_LIMIT - 1  # The leading space counts
+    return "\r\n ".join(pieces)
+
+
+def uid(*parts):
+    return re.sub(r"[^A-Za-z0-9.-]+", "-", "-".join(parts)).strip("-") + "@lumineer-scholar"
+
+
+def class_event(cls, first_day, last_day, stamp):
+    """Return the lines of a weekly repeating event for a class, or None if
+    its meeting time cannot be read or falls outside the semester."""
+    meeting = parse_meeting(cls)
+    if meeting is None:
+        return None
+    days, start, end = meeting
+    offset = min((day - first_day.weekday()) % 7 for day in days)
+    first_meeting = first_day + timedelta(days=offset)
+    if first_meeting > last_day:
+        return None
+    # Floating local times, since the schedule does not record a time zone
+    first_date = first_meeting.strftime("%Y%m%d")
+    location = " ".join(
+        part for part in (cls.get("location", ""), cls.get("room_number", "")) if part
+    )
+    summary = " ".join(
+        part for part in (cls["course_code"], cls.get("course_title", "")) if part
+    )
+    description = "\n".join(
+        f"{label}: {cls[field]}"
+        for label, field in (
+            ("Section", "section"),
+            ("Instructor", "instructor_name"),
+            ("Notes", "notes"),
+        )
+        if cls.get(field)
+    )
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{uid(cls['semester'], cls['course_code'], cls['section'])}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART:{first_date}T{start // 60:02d}{start % 60:02d}00",
+        f"DTEND:{first_date}T{end // 60:02d}{end % 60:02d}00",
+        "RRULE:FREQ=WEEKLY;BYDAY={};UNTIL={}T235959".format(
+            ",".join(BYDAY[day] for day in sorted(days)), last_day.strftime("%Y%m%d")
+        ),
+        f"SUMMARY:{escape(summary)}",
+    ]
+    if location:
+        lines.append(f"LOCATION:{escape(location)}")
+    if description:
+        lines.append(f"DESCRIPTION:{escape(description)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def assignment_event(semester, course_title, assignment, stamp):
+    """Return the lines of an all-day event on an assignment's due date, or
+    None if it has none."""
+    try:
+        due = date.fromisoformat(assignment.get("due_date") or "")
+    except ValueError:
+        return None
+    name = assignment.get("name", "")
+    return [
+        "BEGIN:VEVENT",
+        f"UID:{uid(semester, course_title, name, due.isoformat())}",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;VALUE=DATE:{due.strftime('%Y%m%d')}",
+        f"DTEND;VALUE=DATE:{(due + timedelta(days=1)).strftime('%Y%m%d')}",
+        f"SUMMARY:{escape(f'{course_title}: {name} due')}",
+        "TRANSP:TRANSPARENT",
+        "END:VEVENT",
+    ]
+
+
+def write_calendar(file, semesters):
+    """Write an iCalendar stream to a text file opened with newline="".
+
+    semesters yields (semester, first day, last day, classes, assignments),
+    where assignments yields (course_title, assignment) pairs. Each event
+    is written as soon as it is built, so the sequences can be generators
+    and only one gradebook needs to be held at a time. Returns the number
+    of events written.
+    """
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    file.write(f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:{PRODUCT_ID}\r\nCALSCALE:GREGORIAN\r\n")
+    count = 0
+    for semester, first_day, last_day, classes, assignments in semesters:
+        events = chain(
+            (class_event(cls, first_day, last_day, stamp) for cls in classes),
+            (
+                assignment_event(semester, course_title, assignment, stamp)
+                for course_title, assignment in assignments
+            ),
+        )
+        for event in events:
+            if event is not None:
+                file.write("".join(fold(line) + "\r\n" for line in event))
+                count += 1
+    file.write("END:VCALENDAR\r\n")
+    return count
@@ -3,6 +3,7 @@ import appdirs
 import sys
 import json
 import os
+from datetime import date, timedelta
 from pathlib import Path
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -17,6 +18,7 @@ from PyQt6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMessageBox,
@@ -26,86 +28,148 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem,
     QHeaderView,
     QComboBox,
+    QDateEdit,
+    QFileDialog,
     QInputDialog,
     QDialog,
     QDialogButtonBox,
     QSizePolicy
 )
-from PyQt6.QtCore import Qt, QCoreApplication, QEvent
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QCoreApplication,
+    QDate,
+    QEvent,
+    QModelIndex,
+    QTimer,
+)
 from PyQt6.QtGui import QBrush, QColor, QPalette, QKeySequence, QShortcut
 
+from .grades import (
+    LETTER_SCALE,
+    UNCATEGORIZED,
+    GradebookEngine,
+    GradingPolicy,
+    Projection,
+    letter_grade,
+)
+from .ics import guess_semester_dates, write_calendar
+from .meetings import DAY_NAMES, MeetingIndex, format_time, parse_meeting
+from .todos import TodoLog
+from .transcript import semester_summary, transcript
+
 # Constants
 APP_NAME = "Lumineer"
 APP_AUTHOR = "kosmolebryce"
 APP_DATA_DIR = Path(appdirs.user_data_dir(APP_NAME, APP_AUTHOR)) / "scholar"
 APP_CONFIG_DIR = Path(appdirs.user_config_dir(APP_NAME, APP_AUTHOR)) / "scholar"
+GRADEBOOK_FLUSH_DELAY = 1500  # Milliseconds of quiet before edits are written
 
 class TodoItem(QListWidgetItem):
-    def __init__(self, text, checked=False):
+    def __init__(self, todo):
         super().__init__()
-        self.setText(text)
-        self.setCheckState(Qt.Checked if checked else Qt.Unchecked)
+        self.todo_id = todo["id"]
+        self.setText(todo["text"])
+        self.setCheckState(
+            Qt.CheckState.Checked if todo["checked"] else Qt.CheckState.Unchecked
+        )
         self.update_style()
 
+    def is_checked(self):
+        return self.checkState() == Qt.CheckState.Checked
+
     def update_style(self):
         font = self.font()
-        font.setStrikeOut(self.checkState() == Qt.Checked)
+        font.setStrikeOut(self.is_checked())
         self.setFont(font)
 
+class ScheduleListener:
+    """Receives change events from Managyr after each schedule mutation.
+
+    Classes are identified by an ID that stays the same for the whole
+    session, even when their course code, section or semester change.
+    """
+
+    def class_added(self, class_id, cls):
+        pass
+
+    def class_removed(self, class_id, cls):
+        pass
+
+    def class_updated(self, class_id, cls, original_key):
+        pass
+
+
 class Managyr:
     def __init__(
         self,
         record_file="record.json",
         schedule_file="schedule.json",
         gradebook_dir="gradebooks/",
-        todo_file="todos.json"
+        todo_file="todos.log",
+        policy_file="policies.json",
+        transcript_file="transcript.json",
+        semester_file="semesters.json"
     ):
         self.record_file = APP_DATA_DIR / record_file
         self.schedule_file = APP_DATA_DIR / schedule_file
         self.gradebook_dir = APP_DATA_DIR / gradebook_dir
+        self.policy_file = APP_DATA_DIR / policy_file
+        self.transcript_file = APP_DATA_DIR / transcript_file
+        self.semester_file = APP_DATA_DIR / semester_file
         self.record = {}
-        self.schedule = []
+        # Classes keyed by (course_code, section, semester), with secondary
+        # indexes keyed by class ID kept in step on every change
+        self.classes = {}
+        self.by_semester = {}
+        self.by_instructor = {}
+        self.semester_credits = {}
+        # Semesters whose entries are out of class ID order
+        self.unsorted_semesters = set()
+        # Parsed weekly meeting times per semester, for conflict checks
+        self.meetings = {}
+        # Session-stable IDs for the views to refer to classes by. IDs are
+        # handed out in schedule order and survive a change of key, so
+        # classes_by_id holds the schedule order.
+        self.class_ids = {}
+        self.classes_by_id = {}
+        self.next_class_id = 1
+        self.listeners = []
+        # Loaded gradebooks keyed by (course_title, semester), with the
+        # (mtime, size) of the file each was read from or last written to
         self.gradebooks = {}
+        self.gradebook_stamps = {}
+        self.dirty_gradebooks = set()
+        self.grade_engines = {}
+        self.gradebook_edits = {}
+        # Semester summaries with the fingerprint each was computed under
+        self.transcript = {}
+        self.transcript_changed = False
+        # Grading policies keyed by (course_title, semester)
+        self.policies = {}
+        # First and last day of each semester, as ISO dates
+        self.semester_dates = {}
         self.load_record()
         self.load_schedule()
+        self.load_policies()
+        self.load_transcript()
+        self.load_semester_dates()
         self.ensure_gradebook_dir()
         self.todo_file = APP_DATA_DIR / todo_file
-        self.todos = []
-        self.load_todos()
-
-    def load_todos(self):
-        if os.path.exists(self.todo_file):
-            with open(self.todo_file, 'r') as file:
-                self.todos = json.load(file)
-            
-            # Convert old format to new format if necessary
-            for i, todo in enumerate(self.todos):
-                if not isinstance(todo, dict):
-                    self.todos[i] = {'text': str(todo), 'checked': False}
-            
-            # Save the converted todos back to the file
-            self.save_todos()
-
-    def save_todos(self):
-        with open(self.todo_file, 'w') as file:
-            json.dump(self.todos, file, indent=4)
+        self.todos = TodoLog(self.todo_file, APP_DATA_DIR / "todos.json")
 
     def get_todos(self):
-        return self.todos
+        return list(self.todos.todos.values())
 
-    def add_todo(self, todo):
-        self.todos.append(todo)
-        self.save_todos()
+    def add_todo(self, text):
+        return self.todos.add(text)
 
-    def update_todo(self, index, new_todo):
-        if 0 <= index < len(self.todos):
-            self.todos[index] = new_todo
-            self.save_todos()
+    def update_todo(self, todo_id, **changes):
+        return self.todos.update(todo_id, **changes)
 
-    def delete_todo(self, index):
-        if 0 <= index < len(self.todos):
-            del self.todos[index]
-            self.save_todos()       
+    def delete_todo(self, todo_id):
+        self.todos.delete(todo_id)
 
     def ensure_gradebook_dir(self):
         if not os.path.exists(self.gradebook_dir):
@@ -122,10 +186,125 @@ class Managyr:
         with open(self.record_file, "w") as file:
             json.dump(self.record, file, indent=4)
 
+    @staticmethod
+    def class_key(cls):
+        return cls["course_code"], cls["section"], cls["semester"]
+
+    @staticmethod
+    def credit_hours(cls):
+        try:
+            return float(cls.get("credit_hours", 0) or 0)
+        except ValueError:
+            return 0.0
+
+    def index_class(self, key, class_id, cls):
+        self.classes[key] = cls
+        entries = self.by_semester.setdefault(cls["semester"], {})
+        if entries and class_id < next(reversed(entries)):
+            self.unsorted_semesters.add(cls["semester"])
+        entries[class_id] = cls
+        self.by_instructor.setdefault(cls.get("instructor_name", ""), {})[class_id] = cls
+        self.semester_credits[cls["semester"]] = (
+            self.semester_credits.get(cls["semester"], 0.0) + self.credit_hours(cls)
+        )
+        self.index_meeting(key, cls)
+
+    def unindex_class(self, key):
+        class_id = self.class_ids[key]
+        cls = self.classes.pop(key)
+        semester = cls["semester"]
+        instructor = cls.get("instructor_name", "")
+        del self.by_semester[semester][class_id]
+        del self.by_instructor[instructor][class_id]
+        self.unindex_meeting(key, semester)
+        if self.by_semester[semester]:
+            self.semester_credits[semester] -= self.credit_hours(cls)
+        else:
+            # Start the next class in this semester from an exact zero
+            del self.by_semester[semester]
+            del self.semester_credits[semester]
+            self.unsorted_semesters.discard(semester)
+        if not self.by_instructor[instructor]:
+            del self.by_instructor[instructor]
+        return cls
+
+    def index_meeting(self, key, cls):
+        meeting = parse_meeting(cls)
+        if meeting is not None:
+            self.meetings.setdefault(cls["semester"], MeetingIndex()).add(key, meeting)
+
+    def unindex_meeting(self, key, semester):
+        index = self.meetings.get(semester)
+        if index is not None:
+            index.remove(key)
+            if not len(index):
+                del self.meetings[semester]
+
+    def find_conflicts(self, class_info, ignore=None):
+        """Return the classes of the same semester that meet at the same
+        time as class_info, leaving out the class keyed by ignore."""
+        meeting = parse_meeting(class_info)
+        index = self.meetings.get(class_info.get("semester"))
+        if meeting is None or index is None:
+            return []
+        return [self.classes[key] for key in sorted(index.conflicts(meeting, ignore))]
+
+    def get_conflict_report(self, semester):
+        """Return (class, other class, day name, start, end) for every
+        overlap in a semester, with times in minutes after midnight."""
+        index = self.meetings.get(semester)
+        if index is None:
+            return []
+        return [
+            (self.classes[key], self.classes[other], DAY_NAMES[day], start, end)
+            for key, other, day, start, end in index.report()
+        ]
+
+    def assign_class_id(self, key, cls):
+        class_id = self.next_class_id
+        self.next_class_id += 1
+        self.class_ids[key] = class_id
+        self.classes_by_id[class_id] = cls
+        return class_id
+
+    def get_class(self, class_id):
+        return self.classes_by_id.get(class_id)
+
+    def get_class_id(self, cls):
+        return self.class_ids.get(self.class_key(cls))
+
+    def add_listener(self, listener):
+        self.listeners.append(listener)
+
+    def find_class(self, course_code, section, semester):
+        return self.classes.get((course_code, section, semester))
+
+    def get_semesters(self):
+        return list(self.by_semester)
+
+    def get_classes_in_semester(self, semester):
+        if semester in self.unsorted_semesters:
+            # A class moved in from another semester; restore schedule order
+            self.by_semester[semester] = dict(sorted(self.by_semester[semester].items()))
+            self.unsorted_semesters.discard(semester)
+        return list(self.by_semester.get(semester, {}).values())
+
+    def get_classes_by_instructor(self, instructor_name):
+        return list(self.by_instructor.get(instructor_name, {}).values())
+
+    def get_semester_credit_hours(self, semester):
+        return self.semester_credits.get(semester, 0.0)
+
     def add_class(self, class_info):
         try:
-            self.schedule.append(class_info)
+            key = self.class_key(class_info)
+            if key in self.classes:
+                raise ValueError(f"Duplicate class: {' '.join(key)}")
+            class_id = self.assign_class_id(key, class_info)
+            self.index_class(key, class_id, class_info)
             self.save_schedule()
+            for listener in self.listeners:
+                listener.class_added(class_id, class_info)
 
             if "course_title" in class_info and class_info["course_title"]:
                 self.create_gradebook_if_not_exists(class_info["course_title"])
@@ -137,46 +316,179 @@ class Managyr:
             raise
 
     def remove_class(self, course_code, section, semester):
-        # Filter out the class to be removed
-        self.schedule = [
-            cls
-            for cls in self.schedule
-            if not (
-                cls["course_code"] == course_code
-                and cls["section"] == section
-                and cls["semester"] == semester
-            )
-        ]
+        key = (course_code, section, semester)
+        if key not in self.classes:
+            return
+        cls = self.unindex_class(key)
+        class_id = self.class_ids.pop(key)
+        for listener in self.listeners:
+            listener.class_removed(class_id, cls)
+        # Views may still ask for the row while it is being removed
+        del self.classes_by_id[class_id]
+        # Gradebooks, policies and semester dates are kept, so re-adding
+        # the class finds them again
         self.save_schedule()
 
-        # Check if the semester is now empty and should be handled
-        if not any(cls["semester"] == semester for cls in self.schedule):
-            self.remove_empty_semester_gradebooks(semester)
-
-    def remove_empty_semester_gradebooks(self, semester):
-        # Additional check to remove empty semester gradebooks
-        for cls in list(self.schedule):
-            if cls["semester"] == semester:
-                gradebook_path = self.get_gradebook_path(cls["course_title"])
-                if os.path.exists(gradebook_path):
-                    os.remove(gradebook_path)
-
     def get_schedule(self):
-        return self.schedule
+        return list(self.classes_by_id.values())
 
     def save_schedule(self):
         with open(self.schedule_file, "w") as file:
-            json.dump(self.schedule, file, indent=4)
+            json.dump(self.get_schedule(), file, indent=4)
 
     def load_record(self):
         if os.path.exists(self.record_file):
             with open(self.record_file, "r") as file:
                 self.record = json.load(file)
 
+    def load_policies(self):
+        if os.path.exists(self.policy_file):
+            with open(self.policy_file, "r") as file:
+                policies = json.load(file)
+            for semester, courses in policies.items():
+                for course_title, policy in courses.items():
+                    self.policies[(course_title, semester)] = GradingPolicy.from_dict(policy)
+
+    def save_policies(self):
+        policies = {}
+        for (course_title, semester), policy in self.policies.items():
+            policies.setdefault(semester, {})[course_title] = policy.to_dict()
+        with open(self.policy_file, "w") as file:
+            json.dump(policies, file, indent=4)
+
+    def get_policy(self, course_title, semester):
+        return self.policies.get((course_title, semester)) or GradingPolicy()
+
+    def set_policy(self, course_title, semester, policy):
+        self.policies[(course_title, semester)] = policy
+        self.save_policies()
+        # The next engine for this gradebook is built under the new policy
+        self.grade_engines.pop((course_title, semester), None)
+
+    def load_transcript(self):
+        if os.path.exists(self.transcript_file):
+            with open(self.transcript_file, "r") as file:
+                self.transcript = json.load(file)
+
+    def save_transcript(self):
+        if not self.transcript_changed:
+            return
+        # Semesters that are gone from the schedule are not kept
+        self.transcript = {
+            semester: entry
+            for semester, entry in self.transcript.items()
+            if semester in self.by_semester
+        }
+        with open(self.transcript_file, "w") as file:
+            json.dump(self.transcript, file)
+        self.transcript_changed = False
+
+    def load_semester_dates(self):
+        if os.path.exists(self.semester_file):
+            with open(self.semester_file, "r") as file:
+                self.semester_dates = json.load(file)
+
+    def save_semester_dates(self):
+        with open(self.semester_file, "w") as file:
+            json.dump(self.semester_dates, file, indent=4)
+
+    def get_semester_dates(self, semester):
+        """Return the (first day, last day) saved for a semester, else a
+        guess from its name, else None."""
+        if semester in self.semester_dates:
+            first_day, last_day = self.semester_dates[semester]
+            return date.fromisoformat(first_day), date.fromisoformat(last_day)
+        return guess_semester_dates(semester)
+
+    def set_semester_dates(self, semester, first_day, last_day):
+        dates = [first_day.isoformat(), last_day.isoformat()]
+        if self.semester_dates.get(semester) != dates:
+            self.semester_dates[semester] = dates
+            self.save_semester_dates()
+
+    def read_gradebook(self, course_title, semester):
+        """Return a gradebook without adding it to the cache."""
+        if (course_title, semester) in self.gradebooks:
+            return self.get_gradebook(course_title, semester)
+        gradebook_path = self.gradebook_path(course_title, semester)
+        if not os.path.exists(gradebook_path):
+            return []
+        with open(gradebook_path, "r") as file:
+            return json.load(file)
+
+    def iter_assignments(self, semester):
+        seen = set()
+        for cls in self.get_classes_in_semester(semester):
+            course_title = cls.get("course_title", "")
+            if course_title and course_title not in seen:
+                seen.add(course_title)
+                for assignment in self.read_gradebook(course_title, semester):
+                    yield course_title, assignment
+
+    def export_calendar(self, path, semesters):
+        """Write the classes and assignment due dates of the given
+        (semester, first day, last day) entries to an .ics file, one
+        semester and one gradebook at a time. Returns the number of events."""
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            return write_calendar(
+                file,
+                (
+                    (
+                        semester,
+                        first_day,
+                        last_day,
+                        self.get_classes_in_semester(semester),
+                        self.iter_assignments(semester),
+                    )
+                    for semester, first_day, last_day in semesters
+                ),
+            )
+
+    def semester_fingerprint(self, semester):
+        # Everything a semester's summary depends on, found without
+        # reading a single gradebook
+        fingerprint = []
+        for cls in self.get_classes_in_semester(semester):
+            course_title = cls.get("course_title", "")
+            key = (course_title, semester)
+            if key in self.dirty_gradebooks:
+                stamp = ["unsaved", self.gradebook_edits[key]]
+            else:
+                stamp = self.gradebook_stamp(self.gradebook_path(course_title, semester))
+                stamp = list(stamp) if stamp is not None else None
+            policy = self.policies.get(key)
+            fingerprint.append([
+                cls.get("course_code", ""),
+                course_title,
+                self.credit_hours(cls),
+                stamp,
+                policy.to_dict() if policy is not None else None,
+            ])
+        return fingerprint
+
+    def get_semester_summary(self, semester):
+        """Return the semester's course grades and GPA totals, recomputed
+        only when its classes, gradebooks or policies have changed."""
+        fingerprint = self.semester_fingerprint(semester)
+        entry = self.transcript.get(semester)
+        if entry is not None and entry["fingerprint"] == fingerprint:
+            return entry["summary"]
+        summary = semester_summary(
+            (cls, self.get_grade_engine(cls.get("course_title", ""), semester))
+            for cls in self.get_classes_in_semester(semester)
+        )
+        self.transcript[semester] = {"fingerprint": fingerprint, "summary": summary}
+        self.transcript_changed = True
+        return summary
+
     def load_schedule(self):
         if os.path.exists(self.schedule_file):
             with open(self.schedule_file, "r") as file:
-                self.schedule = json.load(file)
+                schedule = json.load(file)
+            for cls in schedule:
+                key = self.class_key(cls)
+                if key not in self.classes:
+                    self.index_class(key, self.assign_class_id(key, cls), cls)
 
     def create_gradebook_if_not_exists(self, course_title):
         gradebook_path = os.path.join(self.gradebook_dir, f"{course_title}.json")
@@ -189,35 +501,408 @@ class Managyr:
         if os.path.exists(gradebook_path):
             os.remove(gradebook_path)
 
+    def gradebook_path(self, course_title, semester):
+        return os.path.join(self.gradebook_dir, f"{course_title}_{semester}.json")
+
+    def gradebook_stamp(self, gradebook_path):
+        try:
+            stat = os.stat(gradebook_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def get_gradebook(self, course_title, semester):
-        gradebook_path = os.path.join(
-            self.gradebook_dir, f"{course_title}_{semester}.json"
-        )
-        if os.path.exists(gradebook_path):
+        """Return the cached gradebook, reading the file only when it has
+        changed on disk since it was loaded.
+
+        The returned list is the cached one; edit it in place and pass it
+        to save_gradebook. Gradebooks with unsaved edits are returned
+        without touching the disk, and those edits win over any change
+        made to the file in the meantime.
+        """
+        key = (course_title, semester)
+        if key in self.dirty_gradebooks:
+            return self.gradebooks[key]
+        gradebook_path = self.gradebook_path(course_title, semester)
+        stamp = self.gradebook_stamp(gradebook_path)
+        if key in self.gradebooks and self.gradebook_stamps.get(key) == stamp:
+            return self.gradebooks[key]
+        grades = []
+        if stamp is not None:
             with open(gradebook_path, "r") as file:
-                return json.load(file)
-        return []
+                grades = json.load(file)
+        self.gradebooks[key] = grades
+        self.gradebook_stamps[key] = stamp
+        return grades
+
+    def get_grade_engine(self, course_title, semester):
+        """Return a GradebookEngine over the cached gradebook, rebuilt only
+        when the gradebook itself has been reloaded."""
+        key = (course_title, semester)
+        grades = self.get_gradebook(course_title, semester)
+        engine = self.grade_engines.get(key)
+        if engine is None or engine.assignments is not grades:
+            engine = GradebookEngine(grades, self.get_policy(course_title, semester))
+            self.grade_engines[key] = engine
+        return engine
 
     def save_gradebook(self, course_title, semester, grades):
-        gradebook_path = os.path.join(
-            self.gradebook_dir, f"{course_title}_{semester}.json"
-        )
-        with open(gradebook_path, "w") as file:
-            json.dump(grades, file, indent=4)
+        # Only marks the gradebook; flush_gradebooks writes it out
+        key = (course_title, semester)
+        self.gradebooks[key] = grades
+        self.dirty_gradebooks.add(key)
+        self.gradebook_edits[key] = self.gradebook_edits.get(key, 0) + 1
+
+    def flush_gradebooks(self):
+        """Write every gradebook with unsaved edits."""
+        for key in list(self.dirty_gradebooks):
+            gradebook_path = self.gradebook_path(*key)
+            with open(gradebook_path, "w") as file:
+                json.dump(self.gradebooks[key], file, indent=4)
+            self.gradebook_stamps[key] = self.gradebook_stamp(gradebook_path)
+            self.dirty_gradebooks.discard(key)
 
     def update_class(
         self, original_course_code, original_section, original_semester, updated_info
     ):
-        # Find the class and update it
-        for i, cls in enumerate(self.schedule):
-            if (
-                cls["course_code"] == original_course_code
-                and cls["section"] == original_section
-                and cls["semester"] == original_semester
-            ):
-                self.schedule[i].update(updated_info)
-                break
+        original_key = (original_course_code, original_section, original_semester)
+        if original_key not in self.classes:
+            return
+        key = self.class_key({**self.classes[original_key], **updated_info})
+        if key != original_key and key in self.classes:
+            raise ValueError(f"Duplicate class: {' '.join(key)}")
+        class_id = self.class_ids[original_key]
+        cls = self.classes[original_key]
+        if key[2] != original_semester:
+            # Moving semesters changes every index
+            self.unindex_class(original_key)
+            del self.class_ids[original_key]
+            cls.update(updated_info)
+            self.class_ids[key] = class_id
+            self.index_class(key, class_id, cls)
+        else:
+            # The semester entry is keyed by ID and stays where it is
+            instructor = cls.get("instructor_name", "")
+            self.semester_credits[original_semester] -= self.credit_hours(cls)
+            self.unindex_meeting(original_key, original_semester)
+            if key != original_key:
+                del self.classes[original_key]
+                del self.class_ids[original_key]
+                self.classes[key] = cls
+                self.class_ids[key] = class_id
+            cls.update(updated_info)
+            self.semester_credits[original_semester] += self.credit_hours(cls)
+            self.index_meeting(key, cls)
+            if cls.get("instructor_name", "") != instructor:
+                del self.by_instructor[instructor][class_id]
+                if not self.by_instructor[instructor]:
+                    del self.by_instructor[instructor]
+                self.by_instructor.setdefault(cls.get("instructor_name", ""), {})[class_id] = cls
         self.save_schedule()
+        for listener in self.listeners:
+            listener.class_updated(class_id, cls, original_key)
+
+
+class ClassListModel(QAbstractListModel, ScheduleListener):
+    """One semester's classes, as rows that refer to classes by ID.
+
+    The display text is formatted from the class on demand, and the user
+    role holds the class ID, so nothing is copied or serialized per row.
+    Schedule changes insert, remove or repaint single rows.
+    """
+
+    def __init__(self, manager, label, parent=None):
+        super().__init__(parent)
+        self.manager = manager
+        self.label = label
+        self.semester = None
+        self.rows = []
+        self.positions = {}
+        manager.add_listener(self)
+
+    def set_semester(self, semester):
+        """Show the classes of one semester, or of all semesters for None."""
+        self.beginResetModel()
+        self.semester = semester
+        if semester is None:
+            classes = self.manager.get_schedule()
+        else:
+            classes = self.manager.get_classes_in_semester(semester)
+        self.rows = [self.manager.get_class_id(cls) for cls in classes]
+        self.positions = {class_id: row for row, class_id in enumerate(self.rows)}
+        self.endResetModel()
+
+    def clear(self):
+        self.beginResetModel()
+        self.semester = ""
+        self.rows = []
+        self.positions = {}
+        self.endResetModel()
+
+    def shows(self, cls):
+        return self.semester is None or cls["semester"] == self.semester
+
+    def class_at(self, index):
+        if not index.isValid():
+            return None
+        return self.manager.get_class(self.rows[index.row()])
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        class_id = self.rows[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.label(self.manager.get_class(class_id))
+        if role == Qt.ItemDataRole.UserRole:
+            return class_id
+        return None
+
+    def append_row(self, class_id):
+        row = len(self.rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.rows.append(class_id)
+        self.positions[class_id] = row
+        self.endInsertRows()
+
+    def remove_row(self, class_id):
+        row = self.positions.pop(class_id)
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.rows[row]
+        for later in range(row, len(self.rows)):
+            self.positions[self.rows[later]] = later
+        self.endRemoveRows()
+
+    def class_added(self, class_id, cls):
+        if self.shows(cls):
+            self.append_row(class_id)
+
+    def class_removed(self, class_id, cls):
+        if class_id in self.positions:
+            self.remove_row(class_id)
+
+    def class_updated(self, class_id, cls, original_key):
+        if class_id in self.positions:
+            if self.shows(cls):
+                index = self.index(self.positions[class_id])
+                self.dataChanged.emit(index, index)
+            else:
+                self.remove_row(class_id)
+        elif self.shows(cls):
+            self.append_row(class_id)
+
+
+class GradingPolicyDialog(QDialog):
+    def __init__(self, policy, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Grading Policy")
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("Categories (leave empty to grade by total points):"))
+        self.categoryTable = QTableWidget(0, 3)
+        self.categoryTable.setHorizontalHeaderLabels(["Category", "Weight (%)", "Drop Lowest"])
+        self.categoryTable.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        for name, category in policy.categories.items():
+            self.add_category_row(name, category["weight"], category["drop_lowest"])
+        layout.addWidget(self.categoryTable)
+
+        category_buttons = QHBoxLayout()
+        for button_text, slot in [
+            ("Add Category", lambda: self.add_category_row()),
+            ("Remove Category", self.remove_category_row),
+        ]:
+            button = QPushButton(button_text)
+            button.clicked.connect(slot)
+            category_buttons.addWidget(button)
+        layout.addLayout(category_buttons)
+
+        layout.addWidget(QLabel("Letter scale (lowest percentage for each letter):"))
+        self.scaleEntry = QLineEdit(
+            ", ".join(f"{letter}={cutoff:g}" for cutoff, letter in reversed(policy.scale))
+        )
+        layout.addWidget(self.scaleEntry)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def add_category_row(self, name="", weight=0, drop_lowest=0):
+        row = self.categoryTable.rowCount()
+        self.categoryTable.insertRow(row)
+        for column, value in enumerate((name, f"{weight:g}", str(drop_lowest))):
+            self.categoryTable.setItem(row, column, QTableWidgetItem(value))
+
+    def remove_category_row(self):
+        row = self.categoryTable.currentRow()
+        if row != -1:
+            self.categoryTable.removeRow(row)
+
+    def policy(self):
+        """Return the edited policy, or raise ValueError describing the problem."""
+        categories = {}
+        for row in range(self.categoryTable.rowCount()):
+            name, weight, drop_lowest = (
+                (self.categoryTable.item(row, column) or QTableWidgetItem()).text().strip()
+                for column in range(3)
+            )
+            if not name:
+                continue
+            if name in categories:
+                raise ValueError(f"The category '{name}' is listed twice.")
+            try:
+                weight = float(weight or 0)
+                drop_lowest = int(drop_lowest or 0)
+            except ValueError:
+                raise ValueError(
+                    f"The weight and drop count of '{name}' must be numbers."
+                ) from None
+            if weight < 0 or drop_lowest < 0:
+                raise ValueError(f"The weight and drop count of '{name}' cannot be negative.")
+            categories[name] = {"weight": weight, "drop_lowest": drop_lowest}
+
+        scale = []
+        for part in self.scaleEntry.text().split(","):
+            if not part.strip():
+                continue
+            letter, _, cutoff = part.partition("=")
+            try:
+                scale.append((float(cutoff), letter.strip()))
+            except ValueError:
+                raise ValueError(f"'{part.strip()}' should look like A=92.5.") from None
+        return GradingPolicy(categories, scale or LETTER_SCALE)
+
+
+class GradeProjectionDialog(QDialog):
+    """Shows what the ungraded assignments need for each target letter."""
+
+    def __init__(self, engine, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("What Do I Need?")
+        self.engine = engine
+        self.projection = Projection(engine)
+        layout = QVBoxLayout(self)
+
+        low, high = self.projection.outcome_range()
+        if low is None:
+            outcome = "Final grade: N/A"
+        else:
+            outcome = (
+                f"Final grade: {low:.2f}% ({letter_grade(low, engine.scale)}) "
+                f"if every ungraded assignment gets 0, up to {high:.2f}% "
+                f"({letter_grade(high, engine.scale)}) with full marks"
+            )
+        outcome_label = QLabel(outcome)
+        outcome_label.setWordWrap(True)
+        layout.addWidget(outcome_label)
+
+        layout.addWidget(QLabel("Target letter grade:"))
+        self.targetComboBox = QComboBox()
+        for cutoff, letter in reversed(engine.scale):
+            self.targetComboBox.addItem(f"{letter} ({cutoff:g}%)", cutoff)
+        self.targetComboBox.currentIndexChanged.connect(self.update_needed)
+        layout.addWidget(self.targetComboBox)
+
+        self.neededLabel = QLabel()
+        self.neededLabel.setWordWrap(True)
+        layout.addWidget(self.neededLabel)
+
+        self.neededTable = QTableWidget(len(self.projection.rows), 3)
+        self.neededTable.setHorizontalHeaderLabels(["Name", "Points Possible", "Points Needed"])
+        self.neededTable.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self.neededTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        for i, row in enumerate(self.projection.rows):
+            self.neededTable.setItem(
+                i, 0, QTableWidgetItem(engine.assignments[row].get("name", ""))
+            )
+            self.neededTable.setItem(i, 1, QTableWidgetItem(f"{engine.possible[row]:g}"))
+            self.neededTable.setItem(i, 2, QTableWidgetItem())
+        layout.addWidget(self.neededTable)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        self.update_needed()
+
+    def update_needed(self):
+        if not self.projection.rows:
+            self.neededLabel.setText(
+                "Every assignment is graded. Leave Points Actual blank for "
+                "assignments still to come."
+            )
+            return
+        fraction = self.projection.required_fraction(self.targetComboBox.currentData())
+        if fraction is None:
+            self.neededLabel.setText("Out of reach, even with full marks on everything left.")
+        elif fraction == 0:
+            self.neededLabel.setText("Already secured, whatever the remaining scores.")
+        else:
+            self.neededLabel.setText(
+                f"Score at least {fraction * 100:.2f}% on each ungraded assignment."
+            )
+        for i, row in enumerate(self.projection.rows):
+            needed = "-" if fraction is None else f"{fraction * self.engine.possible[row]:.2f}"
+            self.neededTable.item(i, 2).setText(needed)
+
+
+class CalendarExportDialog(QDialog):
+    """Picks the semesters to export and the dates each one runs between."""
+
+    def __init__(self, semesters, selected=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Export Calendar")
+        layout = QVBoxLayout(self)
+
+        layout.addWidget(QLabel("Semesters to export, with their first and last day of classes:"))
+        self.semesterTable = QTableWidget(len(semesters), 3)
+        self.semesterTable.setHorizontalHeaderLabels(["Semester", "First Day", "Last Day"])
+        self.semesterTable.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        today = date.today()
+        for row, (semester, dates) in enumerate(semesters):
+            item = QTableWidgetItem(semester)
+            item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
+            item.setCheckState(
+                Qt.CheckState.Checked if semester == selected else Qt.CheckState.Unchecked
+            )
+            self.semesterTable.setItem(row, 0, item)
+            first_day, last_day = dates or (today, today + timedelta(weeks=16))
+            for column, day in ((1, first_day), (2, last_day)):
+                dateEdit = QDateEdit(QDate(day.year, day.month, day.day))
+                dateEdit.setCalendarPopup(True)
+                self.semesterTable.setCellWidget(row, column, dateEdit)
+        layout.addWidget(self.semesterTable)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def selection(self):
+        """Return (semester, first day, last day) for each checked semester,
+        or raise ValueError describing the problem."""
+        selected = []
+        for row in range(self.semesterTable.rowCount()):
+            item = self.semesterTable.item(row, 0)
+            if item.checkState() != Qt.CheckState.Checked:
+                continue
+            first_day = self.semesterTable.cellWidget(row, 1).date().toPyDate()
+            last_day = self.semesterTable.cellWidget(row, 2).date().toPyDate()
+            if last_day < first_day:
+                raise ValueError(f"{item.text()} ends before it starts.")
+            selected.append((item.text(), first_day, last_day))
+        if not selected:
+            raise ValueError("Select at least one semester to export.")
+        return selected
 
 
 class StyledInputDialog(QInputDialog):
@@ -273,7 +958,14 @@ class ManagyrApp(QMainWindow):
     def __init__(self, manager):
         super().__init__()
         self.manager = manager
+        self.grade_engine = None
         self.setWindowTitle("Scholar - Lumineer")
+
+        # Gradebook edits are written in one batch once editing pauses
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(GRADEBOOK_FLUSH_DELAY)
+        self.flush_timer.timeout.connect(self.flush_gradebooks)
         self.initUI()
         self.setup_shortcuts()
 
@@ -339,7 +1031,7 @@ class ManagyrApp(QMainWindow):
             color: #000; /* White text */
             font-size: 12px;
         }
-        QListWidget {
+        QListView {
             padding: 5px;
             border: 1px solid #666;
             border-radius: 4px;
@@ -397,9 +1089,11 @@ class ManagyrApp(QMainWindow):
         self.recordTab = QWidget()
         self.scheduleTab = QWidget()
         self.gradebookTab = QWidget()
+        self.transcriptTab = QWidget()
         self.tabs.addTab(self.recordTab, "Manage Record")
         self.tabs.addTab(self.scheduleTab, "Schedule")
         self.tabs.addTab(self.gradebookTab, "Gradebook")
+        self.tabs.addTab(self.transcriptTab, "Transcript")
 
         self.mainLayout.addWidget(self.tabs)
         self.resize(1024, 768)
@@ -408,6 +1102,7 @@ class ManagyrApp(QMainWindow):
         self.initRecordTab()
         self.initScheduleTab()
         self.initGradebookTab()
+        self.initTranscriptTab()
 
         # Connect tab change signal to update function
         self.tabs.currentChanged.connect(self.on_tab_change)
@@ -534,20 +1229,13 @@ class ManagyrApp(QMainWindow):
         self.load_todos()
 
     def load_todos(self):
-        todos = self.manager.get_todos()
-        for todo in todos:
-            if isinstance(todo, dict):
-                item = TodoItem(todo.get('text', ''), todo.get('checked', False))
-            else:
-                item = TodoItem(str(todo), False)
-            self.todoList.addItem(item)
+        for todo in self.manager.get_todos():
+            self.todoList.addItem(TodoItem(todo))
 
     def add_todo(self):
         todo, ok = QInputDialog.getText(self, "Add To-Do", "Enter a new to-do item:")
         if ok and todo:
-            item = TodoItem(todo)
-            self.todoList.addItem(item)
-            self.manager.add_todo({'text': todo, 'checked': False})
+            self.todoList.addItem(TodoItem(self.manager.add_todo(todo)))
 
     def edit_todo(self):
         current_item = self.todoList.currentItem()
@@ -556,28 +1244,19 @@ class ManagyrApp(QMainWindow):
                                                 "Edit the to-do item:", 
                                                 text=current_item.text())
             if ok and new_todo:
-                index = self.todoList.row(current_item)
+                # todo_item_changed records the new text
                 current_item.setText(new_todo)
-                current_item.update_background()  # Ensure background is updated
-                self.manager.update_todo(index, {
-                    'text': new_todo,
-                    'checked': current_item.checkState() == Qt.Checked
-                })
 
     def todo_item_changed(self, item):
-        item.update_style()  # Update style when item is checked/unchecked
-        index = self.todoList.row(item)
-        self.manager.update_todo(index, {
-            'text': item.text(),
-            'checked': item.checkState() == Qt.Checked
-        })
+        # Restyling fires this again, but only real changes are written
+        item.update_style()
+        self.manager.update_todo(item.todo_id, text=item.text(), checked=item.is_checked())
 
     def delete_todo(self):
         current_item = self.todoList.currentItem()
         if current_item:
-            index = self.todoList.row(current_item)
-            self.todoList.takeItem(index)
-            self.manager.delete_todo(index)
+            self.todoList.takeItem(self.todoList.row(current_item))
+            self.manager.delete_todo(current_item.todo_id)
 
     # The adjust_preview_pane_height method remains the same
     def adjust_preview_pane_height(self):
@@ -623,8 +1302,15 @@ class ManagyrApp(QMainWindow):
         layout.addLayout(summaryLayout)
 
         # Schedule List
-        self.scheduleList = QListWidget()
-        self.scheduleList.currentItemChanged.connect(
+        self.scheduleModel = ClassListModel(
+            self.manager,
+            lambda cls: f"{cls['course_code']} - {cls['section']} - {cls['course_title']}",
+            self,
+        )
+        self.scheduleList = QListView()
+        self.scheduleList.setModel(self.scheduleModel)
+        self.scheduleList.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.scheduleList.selectionModel().currentChanged.connect(
             self.populate_fields_from_selection
         )
         layout.addWidget(self.scheduleList)
@@ -659,6 +1345,8 @@ class ManagyrApp(QMainWindow):
             ("Add Class", self.add_class),
             ("Update Class", self.update_class),
             ("Remove Class", self.remove_class),
+            ("Check Conflicts", self.show_conflict_report),
+            ("Export Calendar", self.export_calendar),
             # ("Exit", self.exit_program)
         ]:
             button = QPushButton(button_text)
@@ -687,16 +1375,31 @@ class ManagyrApp(QMainWindow):
         layout.addWidget(self.gradebookSemesterComboBox)
 
         # Gradebook list
-        self.gradebookList = QListWidget()
-        self.gradebookList.currentItemChanged.connect(
+        self.gradebookModel = ClassListModel(
+            self.manager,
+            lambda cls: f"{cls['course_title']} ({cls['semester']})",
+            self,
+        )
+        self.gradebookList = QListView()
+        self.gradebookList.setModel(self.gradebookModel)
+        self.gradebookList.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.gradebookList.selectionModel().currentChanged.connect(
             self.populate_gradebook_from_selection
         )
         layout.addWidget(self.gradebookList)
 
         # Assignments table
-        self.assignmentsTable = QTableWidget(0, 5)
+        self.assignmentsTable = QTableWidget(0, 7)
         self.assignmentsTable.setHorizontalHeaderLabels(
-            ["Name", "Points Possible", "Points Actual", "Grade (%)", "Letter Grade"]
+            [
+                "Name",
+                "Points Possible",
+                "Points Actual",
+                "Grade (%)",
+                "Letter Grade",
+                "Category",
+                "Due Date",
+            ]
         )
         self.assignmentsTable.horizontalHeader().setStretchLastSection(True)
         self.assignmentsTable.horizontalHeader().setSectionResizeMode(
@@ -711,6 +1414,8 @@ class ManagyrApp(QMainWindow):
         for button_text, slot in [
             ("Add Assignment", self.add_assignment),
             ("Remove Assignment", self.remove_assignment),
+            ("Grading Policy", self.edit_grading_policy),
+            ("What Do I Need?", self.show_grade_projection),
             # ("Exit", self.exit_program)
         ]:
             button = QPushButton(button_text)
@@ -730,15 +1435,76 @@ class ManagyrApp(QMainWindow):
         # Connect the cell changed signal
         self.assignmentsTable.cellChanged.connect(self.on_cell_changed)
 
+    def initTranscriptTab(self):
+        layout = QVBoxLayout()
+
+        self.cumulativeGpaLabel = QLabel("Cumulative GPA: N/A")
+        layout.addWidget(self.cumulativeGpaLabel)
+
+        self.transcriptTable = QTableWidget(0, 5)
+        self.transcriptTable.setHorizontalHeaderLabels(
+            ["Semester", "Course", "Credit Hours", "Grade (%)", "Letter Grade"]
+        )
+        self.transcriptTable.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self.transcriptTable.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        layout.addWidget(self.transcriptTable)
+
+        self.transcriptTab.setLayout(layout)
+
+    def update_transcript(self):
+        # Oldest first, so the cumulative GPA builds up term by term
+        semesters = list(reversed(self.sort_semesters(self.manager.get_semesters())))
+        terms = list(transcript(
+            (semester, self.manager.get_semester_summary(semester)) for semester in semesters
+        ))
+        try:
+            self.manager.save_transcript()
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to save the transcript: {e}")
+
+        rows = []
+        for semester, summary, term_gpa, cumulative_gpa in reversed(terms):
+            for course in summary["courses"]:
+                percentage = course["percentage"]
+                rows.append((
+                    semester,
+                    f"{course['course_code']} {course['course_title']}".strip(),
+                    f"{course['credit_hours']:g}",
+                    "N/A" if percentage is None else f"{percentage:.2f}%",
+                    course["letter"] or "N/A",
+                    False,
+                ))
+            rows.append((
+                semester,
+                "Term GPA" if term_gpa is None else f"Term GPA: {term_gpa:.2f}",
+                f"{summary['credits']:g}",
+                "",
+                "" if cumulative_gpa is None else f"Cumulative: {cumulative_gpa:.2f}",
+                True,
+            ))
+
+        self.transcriptTable.setRowCount(len(rows))
+        for row, (*values, bold) in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if bold:
+                    font = item.font()
+                    font.setBold(True)
+                    item.setFont(font)
+                self.transcriptTable.setItem(row, column, item)
+
+        cumulative_gpa = terms[-1][3] if terms else None
+        self.cumulativeGpaLabel.setText(
+            "Cumulative GPA: N/A" if cumulative_gpa is None
+            else f"Cumulative GPA: {cumulative_gpa:.2f}"
+        )
+
     def update_summary(self):
         selected_semester = self.semesterComboBox.currentText()
-        total_credit_hours = 0
-        total_classes = 0
-
-        for cls in self.manager.get_schedule():
-            if cls["semester"] == selected_semester:
-                total_classes += 1
-                total_credit_hours += float(cls.get("credit_hours", 0))
+        total_classes = len(self.manager.get_classes_in_semester(selected_semester))
+        total_credit_hours = self.manager.get_semester_credit_hours(selected_semester)
 
         self.totalClassesLabel.setText(f"Total Classes: {total_classes}")
         self.totalCreditHoursLabel.setText(
@@ -746,9 +1512,9 @@ class ManagyrApp(QMainWindow):
         )
 
     def populate_fields_from_selection(self, current, previous):
-        if not current:
+        info = self.scheduleModel.class_at(current)
+        if info is None:
             return
-        info = json.loads(current.data(Qt.ItemDataRole.UserRole))
         self.courseCodeEntry.setText(info["course_code"])
         self.sectionEntry.setText(info["section"])
         self.courseTitleEntry.setText(info["course_title"])
@@ -778,6 +1544,8 @@ class ManagyrApp(QMainWindow):
         elif tab_text == "Gradebook":
             self.populate_gradebook_semester_combobox()
             self.populate_gradebook_list_based_on_semester()
+        elif tab_text == "Transcript":
+            self.update_transcript()
 
     def reload_gradebooks(self):
         """Reload all gradebooks when switching to the gradebook tab."""
@@ -822,7 +1590,7 @@ class ManagyrApp(QMainWindow):
             self.semesterComboBox.itemText(i)
             for i in range(self.semesterComboBox.count())
         }
-        new_semesters = set(cls["semester"] for cls in self.manager.get_schedule())
+        new_semesters = set(self.manager.get_semesters())
 
         # Add any new semesters to the combobox
         for semester in new_semesters:
@@ -864,36 +1632,43 @@ class ManagyrApp(QMainWindow):
             )
             return
 
-        if any(
-            cls["course_code"] == class_info["course_code"]
-            and cls["section"] == class_info["section"]
-            and cls["semester"] == class_info["semester"]
-            for cls in self.manager.get_schedule()
-        ):
+        if self.manager.find_class(
+            class_info["course_code"], class_info["section"], class_info["semester"]
+        ) is not None:
             QMessageBox.information(
                 self, "Duplicate", "This class has already been added."
             )
             return
 
+        if not self.confirm_despite_conflicts(self.manager.find_conflicts(class_info)):
+            return
+
         self.manager.add_class(class_info)
+        # The list models pick up the new class themselves
         self.populate_semester_combobox()
-        self.update_schedule_list_based_on_semester()
+        self.update_summary()
         QMessageBox.information(self, "Success", "Class added successfully.")
 
     def update_class(self):
-        current_item = self.scheduleList.currentItem()
-        if not current_item:
+        # Get the current class info from the list
+        cls_info = self.scheduleModel.class_at(self.scheduleList.currentIndex())
+        if cls_info is None:
             QMessageBox.critical(self, "Error", "No class selected to update.")
             return
 
-        # Get the current class info from the list
-        cls_info = json.loads(current_item.data(Qt.ItemDataRole.UserRole))
-
         # Check for changes in the unique identifier (course_code, section, semester)
         original_course_code = cls_info["course_code"]
         original_section = cls_info["section"]
         original_semester = cls_info["semester"]
 
+        try:
+            credit_hours = float(self.creditHoursEntry.text().strip())
+        except ValueError:
+            QMessageBox.critical(
+                self, "Invalid Input", "Credit Hours must be a numeric value."
+            )
+            return
+
         # Get updated values from input fields
         updated_info = {
             "course_code": self.courseCodeEntry.text().strip(),
@@ -906,7 +1681,7 @@ class ManagyrApp(QMainWindow):
             "room_number": self.roomNumberEntry.text().strip(),
             "instructor_name": self.instructorNameEntry.text().strip(),
             "notes": self.notesEntry.text().strip(),
-            "credit_hours": self.creditHoursEntry.text().strip(),
+            "credit_hours": credit_hours,
             "semester": self.semesterEntry.text().strip(),
         }
 
@@ -922,12 +1697,9 @@ class ManagyrApp(QMainWindow):
             original_course_code != updated_info["course_code"]
             or original_section != updated_info["section"]
             or original_semester != updated_info["semester"]
-        ) and any(
-            cls["course_code"] == updated_info["course_code"]
-            and cls["section"] == updated_info["section"]
-            and cls["semester"] == updated_info["semester"]
-            for cls in self.manager.get_schedule()
-        ):
+        ) and self.manager.find_class(
+            updated_info["course_code"], updated_info["section"], updated_info["semester"]
+        ) is not None:
             QMessageBox.critical(
                 self,
                 "Error",
@@ -935,21 +1707,101 @@ class ManagyrApp(QMainWindow):
             )
             return
 
+        conflicts = self.manager.find_conflicts(
+            updated_info, (original_course_code, original_section, original_semester)
+        )
+        if not self.confirm_despite_conflicts(conflicts):
+            return
+
         # Proceed with the update
         self.manager.update_class(
             original_course_code, original_section, original_semester, updated_info
         )
         self.populate_semester_combobox()
-        self.update_schedule_list_based_on_semester()
+        self.update_summary()
         QMessageBox.information(self, "Success", "Class updated successfully.")
 
+    @staticmethod
+    def describe_meeting(cls):
+        return (
+            f"{cls['course_code']} - {cls['section']} "
+            f"({cls.get('meeting_days', '')} {cls.get('start_time', '')}"
+            f"-{cls.get('end_time', '')})"
+        )
+
+    def confirm_despite_conflicts(self, conflicts):
+        if not conflicts:
+            return True
+        reply = QMessageBox.question(
+            self,
+            "Schedule Conflict",
+            "This class meets at the same time as:\n"
+            + "\n".join(self.describe_meeting(cls) for cls in conflicts)
+            + "\n\nSave it anyway?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
+        )
+        return reply == QMessageBox.StandardButton.Yes
+
+    def show_conflict_report(self):
+        semester = self.semesterComboBox.currentText()
+        if not semester:
+            QMessageBox.critical(self, "Error", "No semester selected.")
+            return
+        report = self.manager.get_conflict_report(semester)
+        if not report:
+            QMessageBox.information(
+                self, "Conflicts", f"No classes overlap in {semester}."
+            )
+            return
+        lines = [
+            f"{day} {format_time(start)}-{format_time(end)}: "
+            f"{cls['course_code']} - {cls['section']} and "
+            f"{other['course_code']} - {other['section']}"
+            for cls, other, day, start, end in report
+        ]
+        QMessageBox.warning(
+            self, "Conflicts", f"Overlapping classes in {semester}:\n" + "\n".join(lines)
+        )
+
+    def export_calendar(self):
+        semesters = self.manager.get_semesters()
+        if not semesters:
+            QMessageBox.critical(self, "Error", "There are no classes to export.")
+            return
+
+        dialog = CalendarExportDialog(
+            [(semester, self.manager.get_semester_dates(semester)) for semester in semesters],
+            self.semesterComboBox.currentText(),
+            self,
+        )
+        while dialog.exec() == QDialog.DialogCode.Accepted:
+            try:
+                selection = dialog.selection()
+            except ValueError as e:
+                QMessageBox.critical(self, "Invalid Dates", str(e))
+                continue
+            path, _ = QFileDialog.getSaveFileName(
+                self, "Export Calendar", "schedule.ics", "iCalendar Files (*.ics)"
+            )
+            if not path:
+                return
+            try:
+                for semester, first_day, last_day in selection:
+                    self.manager.set_semester_dates(semester, first_day, last_day)
+                count = self.manager.export_calendar(path, selection)
+            except OSError as e:
+                QMessageBox.critical(self, "Error", f"Failed to export the calendar: {e}")
+                return
+            QMessageBox.information(self, "Success", f"Exported {count} events to {path}.")
+            return
+
     def remove_class(self):
-        current_item = self.scheduleList.currentItem()
-        if not current_item:
+        cls_info = self.scheduleModel.class_at(self.scheduleList.currentIndex())
+        if cls_info is None:
             QMessageBox.critical(self, "Error", "No class selected.")
             return
 
-        cls_info = json.loads(current_item.data(Qt.ItemDataRole.UserRole))
         course_code = cls_info.get("course_code")
         section = cls_info.get("section")
         semester = cls_info.get("semester")
@@ -957,13 +1809,13 @@ class ManagyrApp(QMainWindow):
         self.manager.remove_class(course_code, section, semester)
 
         # Check if any class is left in that semester
-        remaining_classes_in_semester = any(
-            cls for cls in self.manager.get_schedule() if cls["semester"] == semester
+        remaining_classes_in_semester = bool(
+            self.manager.get_classes_in_semester(semester)
         )
 
-        # Update the schedule list
+        # The schedule list has already dropped the row
         self.populate_semester_combobox()  # Update the semester dropdown
-        self.update_schedule_list_based_on_semester()
+        self.update_summary()
 
         # If no classes are left for the semester, update the gradebook tab as well
         if not remaining_classes_in_semester:
@@ -972,13 +1824,7 @@ class ManagyrApp(QMainWindow):
         QMessageBox.information(self, "Success", "Class removed successfully.")
 
     def update_schedule_list(self):
-        self.scheduleList.clear()
-        for cls in self.manager.get_schedule():
-            item = QListWidgetItem(
-                f"{cls['course_code']} - {cls['section']} - {cls['course_title']}"
-            )
-            item.setData(Qt.ItemDataRole.UserRole, json.dumps(cls))
-            self.scheduleList.addItem(item)
+        self.scheduleModel.set_semester(None)
 
     # Method to sort semesters
     def sort_semesters(self, semesters):
@@ -992,7 +1838,7 @@ class ManagyrApp(QMainWindow):
 
     # Method to find the most recent semester
     def find_most_recent_semester(self):
-        semesters = {cls["semester"] for cls in self.manager.get_schedule()}
+        semesters = self.manager.get_semesters()
         sorted_semesters = self.sort_semesters(semesters)
         return sorted_semesters[0] if sorted_semesters else None
 
@@ -1001,7 +1847,7 @@ class ManagyrApp(QMainWindow):
             self.semesterComboBox.itemText(i)
             for i in range(self.semesterComboBox.count())
         }
-        new_semesters = {cls["semester"] for cls in self.manager.get_schedule()}
+        new_semesters = set(self.manager.get_semesters())
 
         # Add new semesters to the ComboBox
         for semester in new_semesters:
@@ -1019,14 +1865,14 @@ class ManagyrApp(QMainWindow):
             if most_recent_semester:
                 self.semesterComboBox.setCurrentText(most_recent_semester)
             else:
-                self.scheduleList.clear()
+                self.scheduleModel.clear()
 
     def populate_gradebook_semester_combobox(self):
         current_semesters = {
             self.gradebookSemesterComboBox.itemText(i)
             for i in range(self.gradebookSemesterComboBox.count())
         }
-        new_semesters = {cls["semester"] for cls in self.manager.get_schedule()}
+        new_semesters = set(self.manager.get_semesters())
 
         for semester in new_semesters:
             if semester not in current_semesters:
@@ -1041,179 +1887,204 @@ class ManagyrApp(QMainWindow):
             if most_recent_semester:
                 self.gradebookSemesterComboBox.setCurrentText(most_recent_semester)
             else:
-                self.gradebookList.clear()
+                self.gradebookModel.clear()
 
     def update_schedule_list_based_on_semester(self):
         selected_semester = self.semesterComboBox.currentText()
-        self.scheduleList.clear()
-        for cls in self.manager.get_schedule():
-            if cls["semester"] == selected_semester:
-                item = QListWidgetItem(
-                    f"{cls['course_code']} - {cls['section']} - {cls['course_title']}"
-                )
-                item.setData(Qt.ItemDataRole.UserRole, json.dumps(cls))
-                self.scheduleList.addItem(item)
+        self.scheduleModel.set_semester(selected_semester)
 
         # Update the summary section
         self.update_summary()
 
     def populate_gradebook_list(self):
-        self.gradebookList.clear()
-        for cls in self.manager.get_schedule():
-            item = QListWidgetItem(cls["course_title"])
-            item.setData(Qt.ItemDataRole.UserRole, json.dumps(cls))
-            self.gradebookList.addItem(item)
+        self.gradebookModel.set_semester(None)
 
     def exit_program(self):
         QApplication.instance().quit()
 
+    def current_gradebook_class(self):
+        return self.gradebookModel.class_at(self.gradebookList.currentIndex())
+
     def populate_gradebook_from_selection(self, current, previous):
-        if not current:
+        course_info = self.gradebookModel.class_at(current)
+        if course_info is None:
             return
-        course_info = json.loads(current.data(Qt.ItemDataRole.UserRole))
         course_title = course_info["course_title"]
         semester = course_info["semester"]
         gradebook = self.manager.get_gradebook(course_title, semester)
         self.populate_assignments_table(gradebook, course_title, semester)
 
+    def read_only_item(self, text=""):
+        item = QTableWidgetItem(text)
+        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+        return item
+
+    def set_cell_text(self, row, column, text):
+        # Leave cells that already show the right value untouched
+        item = self.assignmentsTable.item(row, column)
+        if item.text() != text:
+            item.setText(text)
+
     def populate_assignments_table(self, gradebook, course_title, semester):
+        self.grade_engine = self.manager.get_grade_engine(course_title, semester)
         self.assignmentsTable.clearContents()
         self.assignmentsTable.setRowCount(len(gradebook) + 1)  # +1 for overall grade row
         self.assignmentsTable.cellChanged.disconnect(self.on_cell_changed)
 
         for i, assignment in enumerate(gradebook):
-            name_item = QTableWidgetItem(assignment.get("name", ""))
-            points_possible_item = QTableWidgetItem(
-                str(assignment.get("points_possible", 0))
+            self.assignmentsTable.setItem(i, 0, QTableWidgetItem(assignment.get("name", "")))
+            self.assignmentsTable.setItem(
+                i, 1, QTableWidgetItem(str(assignment.get("points_possible", 0)))
             )
-            points_actual_item = QTableWidgetItem(
-                str(assignment.get("points_actual", 0))
+            self.assignmentsTable.setItem(
+                i, 2, QTableWidgetItem(self.score_text(assignment.get("points_actual", 0)))
             )
-            
-            name_item.setFlags(name_item.flags() | Qt.ItemIsEditable)
-            points_possible_item.setFlags(points_possible_item.flags() | Qt.ItemIsEditable)
-            points_actual_item.setFlags(points_actual_item.flags() | Qt.ItemIsEditable)
-            
-            self.assignmentsTable.setItem(i, 0, name_item)
-            self.assignmentsTable.setItem(i, 1, points_possible_item)
-            self.assignmentsTable.setItem(i, 2, points_actual_item)
-            
+            self.assignmentsTable.setItem(i, 3, self.read_only_item())
+            self.assignmentsTable.setItem(i, 4, self.read_only_item())
+            self.assignmentsTable.setItem(i, 5, QTableWidgetItem(assignment.get("category", "")))
+            self.assignmentsTable.setItem(i, 6, QTableWidgetItem(assignment.get("due_date", "")))
             self.update_grade_items(i)
 
         # Add overall grade row
-        self.update_overall_grade_row(distinct_style=True, bold_only=True)
+        overall_row = len(gradebook)
+        for col in range(self.assignmentsTable.columnCount()):
+            item = self.read_only_item("Overall Grade" if col == 0 else "")
+            font = item.font()
+            font.setBold(True)
+            item.setFont(font)
+            self.assignmentsTable.setItem(overall_row, col, item)
+        self.update_overall_grade_row()
 
         self.assignmentsTable.cellChanged.connect(self.on_cell_changed)
-    
+
     def on_cell_changed(self, row, column):
-        if column in [0, 1, 2] and row < self.assignmentsTable.rowCount() - 1:  # Exclude overall grade row
-            current_item = self.gradebookList.currentItem()
-            if current_item:
-                course_info = json.loads(current_item.data(Qt.ItemDataRole.UserRole))
+        if column == 6 and row < self.assignmentsTable.rowCount() - 1:
+            self.on_due_date_changed(row)
+            return
+        if column in [0, 1, 2, 5] and row < self.assignmentsTable.rowCount() - 1:  # Exclude overall grade row
+            course_info = self.current_gradebook_class()
+            if course_info is not None:
                 course_title = course_info["course_title"]
                 semester = course_info["semester"]
-                gradebook = self.manager.get_gradebook(course_title, semester)
+                engine = self.grade_engine
 
                 name = self.assignmentsTable.item(row, 0).text()
-                points_possible = float(self.assignmentsTable.item(row, 1).text() or 0)
-                points_actual = float(self.assignmentsTable.item(row, 2).text() or 0)
-
-                gradebook[row] = {
-                    "name": name,
-                    "points_possible": points_possible,
-                    "points_actual": points_actual,
-                }
+                try:
+                    points_possible = float(self.assignmentsTable.item(row, 1).text() or 0)
+                    # A blank score leaves the assignment ungraded
+                    points_actual = self.assignmentsTable.item(row, 2).text().strip()
+                    points_actual = float(points_actual) if points_actual else None
+                except ValueError:
+                    # Put back the last number the gradebook accepted
+                    if column == 1:
+                        self.set_cell_text(row, column, str(engine.possible[row]))
+                    else:
+                        self.set_cell_text(
+                            row, column, self.score_text(engine.assignments[row]["points_actual"])
+                        )
+                    return
+
+                category = self.assignmentsTable.item(row, 5).text().strip()
+                before = dict(engine.assignments[row])
+                changed = engine.update(row, name, points_possible, points_actual, category)
+                # Edits that leave the assignment as it was are not saved
+                if not changed and engine.assignments[row] == before:
+                    return
+                self.manager.save_gradebook(course_title, semester, engine.assignments)
+                self.flush_timer.start()
+                if changed:
+                    self.update_grade_items(row)
+                    self.update_overall_grade_row()
+
+    def on_due_date_changed(self, row):
+        course_info = self.current_gradebook_class()
+        if course_info is None:
+            return
+        assignment = self.grade_engine.assignments[row]
+        due_date = self.assignmentsTable.item(row, 6).text().strip()
+        if due_date:
+            try:
+                due_date = date.fromisoformat(due_date).isoformat()
+            except ValueError:
+                QMessageBox.critical(
+                    self, "Invalid Input", "Due Date must be written as YYYY-MM-DD."
+                )
+                self.set_cell_text(row, 6, assignment.get("due_date", ""))
+                return
+        # Show the date as stored, e.g. 20240903 as 2024-09-03
+        self.set_cell_text(row, 6, due_date)
+        if due_date == assignment.get("due_date", ""):
+            return
+        if due_date:
+            assignment["due_date"] = due_date
+        else:
+            del assignment["due_date"]
+        self.manager.save_gradebook(
+            course_info["course_title"], course_info["semester"], self.grade_engine.assignments
+        )
+        self.flush_timer.start()
 
-                self.manager.save_gradebook(course_title, semester, gradebook)
-                self.update_grade_items(row)
-                self.update_overall_grade_row(distinct_style=True, bold_only=True)
+    def score_text(self, points_actual):
+        return "" if points_actual is None or points_actual == "" else str(points_actual)
 
     def update_grade_items(self, row):
-        points_possible = float(self.assignmentsTable.item(row, 1).text())
-        points_actual = float(self.assignmentsTable.item(row, 2).text())
-        
-        if points_possible > 0:
-            grade_percent = (points_actual / points_possible) * 100
-        else:
-            grade_percent = 0
-        
-        grade_percent_item = QTableWidgetItem(f"{grade_percent:.2f}%")
-        grade_percent_item.setFlags(grade_percent_item.flags() & ~Qt.ItemIsEditable)
-        self.assignmentsTable.setItem(row, 3, grade_percent_item)
-        
-        letter_grade = self.convert_percentage_to_letter_grade(grade_percent)
-        letter_grade_item = QTableWidgetItem(letter_grade)
-        letter_grade_item.setFlags(letter_grade_item.flags() & ~Qt.ItemIsEditable)
-        self.assignmentsTable.setItem(row, 4, letter_grade_item)
-
-    def update_overall_grade_row(self, distinct_style=True, bold_only=False):
-        total_points_possible = 0
-        total_points_actual = 0
-        row_count = self.assignmentsTable.rowCount()
-        
-        for row in range(row_count - 1):  # Exclude the last row (overall grade)
-            points_possible = float(self.assignmentsTable.item(row, 1).text() or 0)
-            points_actual = float(self.assignmentsTable.item(row, 2).text() or 0)
-            total_points_possible += points_possible
-            total_points_actual += points_actual
-        
-        # Create and set items for the overall grade row
-        overall_label = QTableWidgetItem("Overall Grade")
-        overall_label.setFlags(overall_label.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.assignmentsTable.setItem(row_count - 1, 0, overall_label)
-        
-        overall_points_possible = QTableWidgetItem(str(total_points_possible))
-        overall_points_possible.setFlags(overall_points_possible.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.assignmentsTable.setItem(row_count - 1, 1, overall_points_possible)
-        
-        overall_points_actual = QTableWidgetItem(str(total_points_actual))
-        overall_points_actual.setFlags(overall_points_actual.flags() & ~Qt.ItemFlag.ItemIsEditable)
-        self.assignmentsTable.setItem(row_count - 1, 2, overall_points_actual)
-        
-        if total_points_possible > 0:
-            overall_grade_percent = (total_points_actual / total_points_possible) * 100
-            overall_letter_grade = self.convert_percentage_to_letter_grade(overall_grade_percent)
-            
-            grade_percent_item = QTableWidgetItem(f"{overall_grade_percent:.2f}%")
-            grade_percent_item.setFlags(grade_percent_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.assignmentsTable.setItem(row_count - 1, 3, grade_percent_item)
-            
-            letter_grade_item = QTableWidgetItem(overall_letter_grade)
-            letter_grade_item.setFlags(letter_grade_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-            self.assignmentsTable.setItem(row_count - 1, 4, letter_grade_item)
+        # Flag categories the policy does not weigh
+        item = self.assignmentsTable.item(row, 5)
+        tooltip = (
+            "Not a category of the grading policy, so this assignment is not counted"
+            if self.grade_engine.category[row] == UNCATEGORIZED
+            else ""
+        )
+        if item.toolTip() != tooltip:
+            item.setToolTip(tooltip)
+        if not self.grade_engine.graded[row]:
+            self.set_cell_text(row, 3, "")
+            self.set_cell_text(row, 4, "")
+            return
+        self.set_cell_text(row, 3, f"{self.grade_engine.percent[row]:.2f}%")
+        self.set_cell_text(row, 4, self.grade_engine.letter(row))
+
+    def update_overall_grade_row(self):
+        engine = self.grade_engine
+        row = self.assignmentsTable.rowCount() - 1
+        # Running totals can carry float noise, so round before display
+        self.set_cell_text(row, 1, str(round(engine.total_possible, 6)))
+        self.set_cell_text(row, 2, str(round(engine.total_actual, 6)))
+        overall_grade_percent = engine.overall_percentage()
+        # Assignments outside the policy's categories count toward nothing,
+        # so say how many there are
+        self.set_cell_text(
+            row, 0,
+            f"Overall Grade ({engine.uncategorized} not counted)"
+            if engine.uncategorized else "Overall Grade",
+        )
+        if engine.policy.categories:
+            breakdown = "\n".join(
+                f"{name} ({weight:g}%): "
+                + ("N/A" if percentage is None else f"{percentage:.2f}%")
+                for name, weight, percentage in engine.category_percentages()
+            )
+            if engine.uncategorized:
+                breakdown += (
+                    f"\nNot counted: {engine.uncategorized} assignment(s)"
+                    " outside these categories"
+                )
+            item = self.assignmentsTable.item(row, 0)
+            if item.toolTip() != breakdown:
+                item.setToolTip(breakdown)
+        if overall_grade_percent is not None:
+            self.set_cell_text(row, 3, f"{overall_grade_percent:.2f}%")
+            self.set_cell_text(row, 4, letter_grade(overall_grade_percent, engine.scale))
         else:
-            for col in range(3, 5):
-                empty_item = QTableWidgetItem("N/A")
-                empty_item.setFlags(empty_item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                self.assignmentsTable.setItem(row_count - 1, col, empty_item)
-        
-        # Apply styling if requested
-        if distinct_style:
-            for col in range(5):
-                item = self.assignmentsTable.item(row_count - 1, col)
-                if item:
-                    if not bold_only:
-                        item.setBackground(QColor(240, 240, 240))  # Light gray background
-                    font = item.font()
-                    font.setBold(True)
-                    item.setFont(font)
+            self.set_cell_text(row, 3, "N/A")
+            self.set_cell_text(row, 4, "N/A")
 
     def add_assignment(self):
-        current = self.gradebookList.currentItem()
-        if not current:
-            return
-
-        # Extract course title and semester from the current text
-        # Assuming the format is "Course Title (Semester)"
-        text = current.text()
-        if "(" in text and text.endswith(")"):
-            course_title = text.rsplit(" (", 1)[0]
-            semester = text.rsplit(" (", 1)[1][:-1]
-        else:
-            QMessageBox.critical(
-                self, "Error", "Failed to parse course title and semester."
-            )
+        course_info = self.current_gradebook_class()
+        if course_info is None:
             return
+        course_title = course_info["course_title"]
+        semester = course_info["semester"]
 
         assignment_name, ok = QInputDialog.getText(
             self, "Add Assignment", "Enter assignment name:"
@@ -1234,8 +2105,9 @@ class ManagyrApp(QMainWindow):
                 )
                 if ok:
                     # Fetch the correct gradebook using both course_title and semester
-                    gradebook = self.manager.get_gradebook(course_title, semester)
-                    gradebook.append(
+                    engine = self.manager.get_grade_engine(course_title, semester)
+                    gradebook = engine.assignments
+                    engine.append(
                         {
                             "name": assignment_name,
                             "points_possible": points_possible,
@@ -1250,35 +2122,60 @@ class ManagyrApp(QMainWindow):
 
                     # Save the gradebook using both course_title and semester
                     self.manager.save_gradebook(course_title, semester, gradebook)
+                    self.flush_timer.start()
 
                     # Update the assignments table using both course_title and semester
                     self.populate_assignments_table(gradebook, course_title, semester)
 
-    def remove_assignment(self):
-        current = self.gradebookList.currentItem()
-        if not current:
-            QMessageBox.critical(
-                self, "Error", "No course selected to remove an assignment from."
-            )
+    def edit_grading_policy(self):
+        course_info = self.current_gradebook_class()
+        if course_info is None:
+            QMessageBox.critical(self, "Error", "No course selected.")
             return
+        course_title = course_info["course_title"]
+        semester = course_info["semester"]
 
-        # Extract course title and semester from the current text
-        text = current.text()
-        if "(" in text and text.endswith(")"):
-            course_title = text.rsplit(" (", 1)[0]
-            semester = text.rsplit(" (", 1)[1][:-1]
-        else:
+        dialog = GradingPolicyDialog(self.manager.get_policy(course_title, semester), self)
+        while dialog.exec() == QDialog.DialogCode.Accepted:
+            try:
+                policy = dialog.policy()
+            except ValueError as e:
+                QMessageBox.critical(self, "Invalid Policy", str(e))
+                continue
+            try:
+                self.manager.set_policy(course_title, semester, policy)
+            except OSError as e:
+                QMessageBox.critical(self, "Error", f"Failed to save the policy: {e}")
+                return
+            gradebook = self.manager.get_gradebook(course_title, semester)
+            self.populate_assignments_table(gradebook, course_title, semester)
+            return
+
+    def show_grade_projection(self):
+        course_info = self.current_gradebook_class()
+        if course_info is None:
+            QMessageBox.critical(self, "Error", "No course selected.")
+            return
+        engine = self.manager.get_grade_engine(course_info["course_title"], course_info["semester"])
+        GradeProjectionDialog(engine, self).exec()
+
+    def remove_assignment(self):
+        course_info = self.current_gradebook_class()
+        if course_info is None:
             QMessageBox.critical(
-                self, "Error", "Failed to parse course title and semester."
+                self, "Error", "No course selected to remove an assignment from."
             )
             return
+        course_title = course_info["course_title"]
+        semester = course_info["semester"]
 
         # Get the current gradebook
-        gradebook = self.manager.get_gradebook(course_title, semester)
+        engine = self.manager.get_grade_engine(course_title, semester)
+        gradebook = engine.assignments
 
         # Determine which assignment to remove based on the selected row in the assignments table
         selected_row = self.assignmentsTable.currentRow()
-        if selected_row == -1:
+        if not 0 <= selected_row < len(gradebook):  # The overall row is not an assignment
             QMessageBox.critical(self, "Error", "No assignment selected to remove.")
             return
 
@@ -1287,14 +2184,15 @@ class ManagyrApp(QMainWindow):
             self,
             "Remove Assignment",
             "Are you sure you want to remove this assignment?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No,
         )
-        if reply == QMessageBox.Yes:
+        if reply == QMessageBox.StandardButton.Yes:
             # Remove the assignment from the gradebook
-            del gradebook[selected_row]
+            engine.remove(selected_row)
             # Save the updated gradebook back to the file
             self.manager.save_gradebook(course_title, semester, gradebook)
+            self.flush_timer.start()
             # Refresh the assignments table
             self.populate_assignments_table(gradebook, course_title, semester)
             QMessageBox.information(self, "Success", "Assignment removed successfully.")
@@ -1310,47 +2208,26 @@ class ManagyrApp(QMainWindow):
             self.previewPane.setText("Name: N/A\nAge: N/A\nMajor: N/A")
 
     def convert_percentage_to_letter_grade(self, percentage):
-        if percentage >= 92.5:
-            return "A"
-        elif percentage >= 89.5:
-            return "A-"
-        elif percentage >= 86.5:
-            return "B+"
-        elif percentage >= 82.5:
-            return "B"
-        elif percentage >= 79.5:
-            return "B-"
-        elif percentage >= 76.5:
-            return "C+"
-        elif percentage >= 72.5:
-            return "C"
-        elif percentage >= 69.5:
-            return "C-"
-        elif percentage >= 66.5:
-            return "D+"
-        elif percentage >= 62.5:
-            return "D"
-        elif percentage >= 59.5:
-            return "D-"
-        else:
-            return "F"
+        return letter_grade(percentage)
 
     def populate_gradebook_list_based_on_semester(self):
         selected_semester = self.gradebookSemesterComboBox.currentText()
-        self.gradebookList.clear()
-        for cls in self.manager.get_schedule():
-            if cls["semester"] == selected_semester:
-                # Use a tuple of (course_title, semester) as a unique identifier
-                item = QListWidgetItem(f"{cls['course_title']} ({cls['semester']})")
-                item.setData(Qt.ItemDataRole.UserRole, json.dumps(cls))
-                self.gradebookList.addItem(item)
+        self.gradebookModel.set_semester(selected_semester)
         
     def setup_shortcuts(self):
         close_shortcut = QShortcut(QKeySequence.StandardKey.Close, self)
         close_shortcut.activated.connect(self.close)
 
+    def flush_gradebooks(self):
+        try:
+            self.manager.flush_gradebooks()
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Failed to save gradebooks: {e}")
+
     def closeEvent(self, event):
         # Perform any necessary cleanup
+        self.flush_timer.stop()
+        self.flush_gradebooks()
         event.accept()
 
     def keyPressEvent(self, event):
@@ -0,0 +1,135 @@
+# `src/lumineer/scholar/meetings.py`
+import heapq
+import re
+from bisect import bisect_left, insort
+
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+# Longest spellings first, so "thurs" is not read as "t" + "hurs"
+DAY_PATTERN = re.compile(
+    r"mon(?:day)?|tue(?:s(?:day)?)?|wed(?:nesday)?|thu(?:r(?:s(?:day)?)?)?"
+    r"|fri(?:day)?|sat(?:urday)?|sun(?:day)?|th|tu|sa|su|[mtwrfsu]"
+)
+DAY_INDEX = {
+    "m": 0, "mon": 0, "t": 1, "tu": 1, "tue": 1, "w": 2, "wed": 2,
+    "r": 3, "th": 3, "thu": 3, "f": 4, "fri": 4, "s": 5, "sa": 5, "sat": 5,
+    "u": 6, "su": 6, "sun": 6,
+}
+TIME_PATTERN = re.compile(r"^(\d{1,2})(?::?(\d{2}))?\s*([ap])?\.?m?\.?$")
+SEPARATORS = re.compile(r"[\s,/&+-]+")
+
+
+def parse_days(text):
+    """Return the set of weekday numbers (Monday is 0) in text such as
+    "MWF", "TTh", "Tu/Th" or "Mon, Wed", or None if it names no days."""
+    text = SEPARATORS.sub("", text.lower())
+    if not text:
+        return None
+    days = set()
+    position = 0
+    while position < len(text):
+        match = DAY_PATTERN.match(text, position)
+        if match is None:
+            return None  # "TBA", "Online" and the like
+        days.add(DAY_INDEX[match.group()[:3]])
+        position = match.end()
+    return frozenset(days)
+
+
+def parse_time(text):
+    """Return minutes after midnight for "9:00", "9:00 AM", "1:30pm",
+    "0930" or "13:30", or None."""
+    match = TIME_PATTERN.match(text.strip().lower())
+    if match is None:
+        return None
+    hours, minutes, half = match.groups()
+    hours = int(hours)
+    minutes = int(minutes or 0)
+    if minutes >= 60 or hours > 23 or (half and not 1 <= hours <= 12):
+        return None
+    if half == "p" and hours != 12:
+        hours += 12
+    elif half == "a" and hours == 12:
+        hours = 0
+    return hours * 60 + minutes
+
+
+def parse_meeting(cls):
+    """Return (days, start, end) for a class, or None if its meeting time
+    is missing or cannot be read."""
+    days = parse_days(cls.get("meeting_days", ""))
+    start = parse_time(cls.get("start_time", ""))
+    end = parse_time(cls.get("end_time", ""))
+    if days is None or start is None or end is None:
+        return None
+    if end <= start and end + 12 * 60 > start:
+        end += 12 * 60  # "11:00" to "1:15" without AM/PM runs past noon
+    if end <= start:
+        return None
+    return days, start, end
+
+
+def format_time(minutes):
+    hours, minutes = divmod(minutes, 60)
+    return f"{(hours - 1) % 12 + 1}:{minutes:02d} {'AM' if hours < 12 else 'PM'}"
+
+
+class MeetingIndex:
+    """Weekly meeting intervals of one semester's classes, sorted by start
+    time within each day.
+
+    A new meeting only needs comparing with intervals that start before it
+    ends and no earlier than its start minus the longest meeting that day,
+    which is a bisect and a short scan. The full report is a sweep over
+    each day.
+    """
+
+    def __init__(self):
+        self.days = [[] for _ in DAY_NAMES]  # (start, end, key), sorted
+        self.longest = [0] * len(DAY_NAMES)
+        self.meetings = {}
+
+    def __len__(self):
+        return len(self.meetings)
+
+    def add(self, key, meeting):
+        days, start, end = meeting
+        self.meetings[key] = meeting
+        for day in days:
+            insort(self.days[day], (start, end, key))
+            self.longest[day] = max(self.longest[day], end - start)
+
+    def remove(self, key):
+        meeting = self.meetings.pop(key, None)
+        if meeting is None:
+            return
+        days, start, end = meeting
+        for day in days:
+            intervals = self.days[day]
+            del intervals[bisect_left(intervals, (start, end, key))]
+
+    def conflicts(self, meeting, ignore=None):
+        """Return the keys of classes meeting at the same time as meeting."""
+        days, start, end = meeting
+        found = set()
+        for day in days:
+            intervals = self.days[day]
+            low = bisect_left(intervals, (start - self.longest[day],))
+            high = bisect_left(intervals, (end,))
+            for other_start, other_end, key in intervals[low:high]:
+                if other_end > start and key != ignore:
+                    found.add(key)
+        return found
+
+    def report(self):
+        """Return (key, other key, day, overlap start, overlap end) for every
+        overlapping pair of classes."""
+        overlaps = []
+        for day, intervals in enumerate(self.days):
+            active = []  # (end, start, key) of meetings still running
+            for start, end, key in intervals:
+                while active and active[0][0] <= start:
+                    heapq.heappop(active)
+                for other_end, _, other in active:
+                    overlaps.append((other, key, day, start, min(end, other_end)))
+                heapq.heappush(active, (end, start, key))
+        return overlaps
@@ -0,0 +1,109 @@
+# `src/lumineer/scholar/todos.py`
+import json
+import os
+
+COMPACT_MIN_ENTRIES = 200  # Log lines kept before compaction is considered
+
+
+class TodoLog:
+    """To-do items kept as an append-only log of JSON lines.
+
+    Each line is an operation on one item, keyed by a stable ID:
+    {"op": "add", "id": 3, "text": "...", "checked": false},
+    {"op": "update", "id": 3, "checked": true} or {"op": "delete", "id": 3}.
+    Checking an item off appends one short line. Once the log has reached
+    twice as many lines as there are items (and COMPACT_MIN_ENTRIES), the
+    next change rewrites it as one "add" per item. Loading only reads.
+    """
+
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        self.legacy_path = legacy_path
+        self.todos = {}
+        self.next_id = 1
+        # Lines in the log, or None when the next change must rewrite it
+        self.entries = None
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.path):
+            with open(self.path, "r") as file:
+                content = file.read()
+            self.entries = 0
+            for line in content.splitlines():
+                try:
+                    self.apply(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    continue  # A write that was cut short
+                self.entries += 1
+            if content and not content.endswith("\n"):
+                self.entries = None  # Never append after a partial line
+        elif self.legacy_path is not None and os.path.exists(self.legacy_path):
+            # The old todos.json list is read as is and replaced by the log
+            # on the first change
+            with open(self.legacy_path, "r") as file:
+                for todo in json.load(file):
+                    if not isinstance(todo, dict):
+                        todo = {"text": str(todo), "checked": False}
+                    self.apply({
+                        "op": "add",
+                        "id": self.next_id,
+                        "text": todo.get("text", ""),
+                        "checked": bool(todo.get("checked", False)),
+                    })
+
+    def apply(self, op):
+        todo_id = op["id"]
+        if op["op"] == "add":
+            self.todos[todo_id] = {
+                "id": todo_id,
+                "text": op.get("text", ""),
+                "checked": op.get("checked", False),
+            }
+            self.next_id = max(self.next_id, todo_id + 1)
+        elif op["op"] == "update":
+            todo = self.todos.get(todo_id)
+            if todo is not None:
+                todo.update((field, op[field]) for field in ("text", "checked") if field in op)
+        elif op["op"] == "delete":
+            self.todos.pop(todo_id, None)
+
+    def write(self, op):
+        self.apply(op)
+        if self.entries is None or self.entries >= max(
+            COMPACT_MIN_ENTRIES, 2 * len(self.todos)
+        ):
+            self.compact()
+            return
+        with open(self.path, "a") as file:
+            file.write(json.dumps(op) + "\n")
+        self.entries += 1
+
+    def compact(self):
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w") as file:
+            for todo in self.todos.values():
+                file.write(json.dumps({"op": "add", **todo}) + "\n")
+        os.replace(temporary_path, self.path)
+        self.entries = len(self.todos)
+
+    def add(self, text, checked=False):
+        todo_id = self.next_id
+        self.write({"op": "add", "id": todo_id, "text": text, "checked": checked})
+        return self.todos[todo_id]
+
+    def update(self, todo_id, **changes):
+        """Record the fields that differ from the item's current values.
+        Returns whether anything was written."""
+        todo = self.todos.get(todo_id)
+        if todo is None:
+            return False
+        changes = {field: value for field, value in changes.items() if todo.get(field) != value}
+        if not changes:
+            return False
+        self.write({"op": "update", "id": todo_id, **changes})
+        return True
+
+    def delete(self, todo_id):
+        if todo_id in self.todos:
+            self.write({"op": "delete", "id": todo_id})
@@ -0,0 +1,63 @@
+# `src/lumineer/scholar/transcript.py`
+from .grades import letter_grade, points
+
+GRADE_POINTS = {
+    "A": 4.0,
+    "A-": 3.7,
+    "B+": 3.3,
+    "B": 3.0,
+    "B-": 2.7,
+    "C+": 2.3,
+    "C": 2.0,
+    "C-": 1.7,
+    "D+": 1.3,
+    "D": 1.0,
+    "D-": 0.7,
+    "F": 0.0,
+}
+
+
+def semester_summary(courses):
+    """Summarize one semester from (class, GradebookEngine) pairs.
+
+    Courses without a grade yet, or with a letter that carries no grade
+    points, are listed but left out of the GPA.
+    """
+    rows = []
+    credits = 0.0
+    quality_points = 0.0
+    for cls, engine in courses:
+        percentage = engine.overall_percentage()
+        letter = None if percentage is None else letter_grade(percentage, engine.scale)
+        credit_hours = points(cls.get("credit_hours"))
+        if letter in GRADE_POINTS:
+            credits += credit_hours
+            quality_points += credit_hours * GRADE_POINTS[letter]
+        rows.append({
+            "course_code": cls.get("course_code", ""),
+            "course_title": cls.get("course_title", ""),
+            "credit_hours": credit_hours,
+            "percentage": percentage,
+            "letter": letter,
+        })
+    return {"courses": rows, "credits": credits, "quality_points": quality_points}
+
+
+def gpa(credits, quality_points):
+    return quality_points / credits if credits > 0 else None
+
+
+def transcript(summaries):
+    """Yield (semester, summary, term GPA, cumulative GPA) for
+    (semester, summary) pairs given oldest first."""
+    credits = 0.0
+    quality_points = 0.0
+    for semester, summary in summaries:
+        credits += summary["credits"]
+        quality_points += summary["quality_points"]
+        yield (
+            semester,
+            summary,
+            gpa(summary["credits"], summary["quality_points"]),
+            gpa(credits, quality_points),
+        )
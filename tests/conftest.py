@@ -0,0 +1,27 @@
+# tests/conftest.py
+import pytest
+
+from lumineer.alight.history import History
+from lumineer.alight.knowledge import KnowledgeBase
+from lumineer.alight.store import KnowledgeStore
+
+
+@pytest.fixture
+def open_alight(tmp_path):
+    """Open the Alight database in tmp_path as the GUI does, returning the
+    store, knowledge base and history. Can be called again to reopen it."""
+    stores = []
+
+    def open_alight():
+        store = KnowledgeStore(str(tmp_path / "knowledge.db"))
+        store.migrate()
+        knowledge_base = KnowledgeBase(store.load_skeleton(), store.get_content)
+        knowledge_base.add_listener(store)
+        history = History(store)
+        knowledge_base.add_listener(history)
+        stores.append(store)
+        return store, knowledge_base, history
+
+    yield open_alight
+    for store in stores:
+        store.close()
@@ -0,0 +1,34 @@
+# tests/test_alight_history.py
+import time
+
+
+def test_restore_wide_snapshot(open_alight):
+    store, knowledge_base, history = open_alight()
+    width = 3000
+    knowledge_base.create_many(
+        [(f"alight.wide.n{i}", f"note {i}") for i in range(width)]
+        + [(f"alight.top{i}", None) for i in range(width)])
+    saved = knowledge_base.root.digest
+    wide = knowledge_base.get("alight.wide").digest
+    knowledge_base.delete("alight.wide")
+    knowledge_base.delete("alight.top0")
+
+    start = time.perf_counter()
+    history.restore(knowledge_base, "alight.wide", wide)
+    history.restore(knowledge_base, "alight", saved)
+    elapsed = time.perf_counter() - start
+
+    assert knowledge_base.root.digest == saved
+    assert knowledge_base.get("alight.wide").digest == wide
+    assert knowledge_base.content(knowledge_base.get("alight.wide.n7")) == "note 7"
+    assert elapsed < 20
+    # Both restores are recorded as one snapshot each
+    actions = [row[0] for row in store.connection.execute(
+        "SELECT action FROM snapshots ORDER BY id DESC LIMIT 2")]
+    assert actions == ["restore", "restore"]
+
+    store.close()
+    store, knowledge_base, _ = open_alight()
+    assert knowledge_base.root.digest == saved
+    assert len(knowledge_base.get("alight.wide").children) == width
+    assert store.read_content("alight.wide.n2999") == "note 2999"
@@ -0,0 +1,37 @@
+# tests/test_alight_server.py
+import asyncio
+import json
+
+from lumineer.alight.server import KnowledgeServer
+
+
+def test_bad_search_limit_keeps_the_connection(open_alight, tmp_path):
+    store, knowledge_base, _ = open_alight()
+    knowledge_base.create("alight.notes.physics", "momentum is conserved")
+    address = f"unix:{tmp_path / 'alight.sock'}"
+
+    async def exchange():
+        server = KnowledgeServer(store.db_path)
+        await server.start(address)
+        try:
+            reader, writer = await asyncio.open_unix_connection(address[5:])
+            responses = []
+            for request in (
+                {"op": "search", "query": "momentum", "limit": [1]},
+                {"op": "search", "query": "momentum", "limit": -1},
+                {"op": "search", "query": "momentum", "limit": 5},
+            ):
+                writer.write(json.dumps(request).encode("utf-8") + b"\n")
+                await writer.drain()
+                responses.append(json.loads(await reader.readline()))
+            writer.close()
+            await writer.wait_closed()
+            return responses
+        finally:
+            await server.close()
+
+    bad_type, negative, good = asyncio.run(exchange())
+    assert not bad_type["ok"] and "limit" in bad_type["error"]
+    assert not negative["ok"] and "limit" in negative["error"]
+    assert good["ok"]
+    assert [hit["path"] for hit in good["result"]] == ["alight.notes.physics"]
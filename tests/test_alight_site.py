@@ -0,0 +1,37 @@
+# tests/test_alight_site.py
+import os
+from html.parser import HTMLParser
+
+from lumineer.alight.site import INDEX_NAME, export_site
+
+
+class LinkCollector(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.hrefs = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            self.hrefs.extend(value for name, value in attrs if name == "href")
+
+
+def test_every_link_points_to_an_exported_page(open_alight, tmp_path):
+    _, knowledge_base, history = open_alight()
+    knowledge_base.create_many([
+        ("alight.science.physics", "See [[alight]] and [[alight.science]]."),
+        ("alight.science.chemistry", "Builds on [[alight.science.physics]]."),
+        ("alight.arts", "Back to [[alight]]."),
+    ])
+    out_dir = tmp_path / "site"
+    assert export_site(history, knowledge_base.root, str(out_dir)) == 5
+
+    pages = set(os.listdir(out_dir)) - {"manifest.json"}
+    assert INDEX_NAME in pages
+    hrefs = set()
+    for page in pages:
+        collector = LinkCollector()
+        collector.feed((out_dir / page).read_text(encoding="utf-8"))
+        hrefs.update(collector.hrefs)
+    assert INDEX_NAME in hrefs
+    assert "alight.science.physics.html" in hrefs
+    assert hrefs <= pages